@@ -92,6 +92,9 @@ def model_name_to_plural(model_name):
     if model_name.endswith("y") and not model_name.endswith("key"):
         return model_name[:-1] + "ies"
 
+    if model_name.endswith("x"):
+        return f"{model_name}es"
+
     return f"{model_name}s"
 
 
@@ -118,8 +121,10 @@ class SQLAlchemyGenerator:
         "blob": "LargeBinary",
         "numeric": "Numeric()",
         "geometry": "Geometry()",
+        "geography": "Geography()",
         "color": "ColorType",
         "array": "ARRAY",
+        "tsvector": "postgresql.TSVECTOR()",
     }
 
     def __init__(
@@ -330,6 +335,15 @@ class SQLAlchemyGenerator:
             geometry_type = col_data.get("geometry_type", "POINT")
             sqla_type = f'Geometry(geometry_type="{geometry_type}")'
 
+        # Handle geography type with geometry_type and srid
+        if col_type == "geography":
+            geometry_type = col_data.get("geometry_type", "POINT")
+            srid = col_data.get("srid", 4326)
+            sqla_type = f'Geography(geometry_type="{geometry_type}", srid={srid})'
+            geography_import = "from geoalchemy2 import Geography"
+            if geography_import not in model.imports:
+                model.imports.append(geography_import)
+
         # Handle array type with array_type
         if col_type == "array":
             array_type = col_data.get("array_type", "string")
@@ -552,11 +566,20 @@ class SQLAlchemyGenerator:
         name = index_data["name"]
         columns = ", ".join(f'"{col}"' for col in index_data["columns"])
         using = index_data.get("using", None)
+        ops = index_data.get("ops", None)
+
+        args = [f'"{name}"', columns]
 
         if using:
-            return f'Index("{name}", {columns}, postgresql_using="{using}")'
-        else:
-            return f'Index("{name}", {columns})'
+            args.append(f'postgresql_using="{using}"')
+
+        if ops:
+            column_ops = ", ".join(
+                f'"{col}": "{ops}"' for col in index_data["columns"]
+            )
+            args.append(f"postgresql_ops={{{column_ops}}}")
+
+        return f"Index({', '.join(args)})"
 
     def generate_context(self, model: Model) -> dict:
         # Process columns to handle deferred
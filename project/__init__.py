@@ -47,6 +47,24 @@ def load_app_config_from_env(app: Flask):
     set_env_to_app(app, "SITE_NAME", "EventCally")
     app.config["FLASK_DEBUG"] = getenv_bool("FLASK_DEBUG", "False")
     app.config["API_READ_ANONYM"] = getenv_bool("API_READ_ANONYM", "False")
+    app.config["EVENT_DATE_SEARCH_INDEX_ENABLED"] = getenv_bool(
+        "EVENT_DATE_SEARCH_INDEX_ENABLED", "False"
+    )
+    app.config["IMAGE_STORAGE_ENABLED"] = getenv_bool("IMAGE_STORAGE_ENABLED", "False")
+    app.config["IMAGE_CACHE_MAX_SIZE_MB"] = int(
+        os.getenv("IMAGE_CACHE_MAX_SIZE_MB", "1024")
+    )
+    app.config["WEBHOOK_DELIVERY_QUEUE"] = os.getenv("WEBHOOK_DELIVERY_QUEUE")
+    app.config["RESPONSE_CACHE_TIMEOUT"] = int(
+        os.getenv("RESPONSE_CACHE_TIMEOUT", "300")
+    )
+    app.config["ICAL_FEED_MAX_AGE"] = int(os.getenv("ICAL_FEED_MAX_AGE", "3600"))
+    app.config["DUMP_FULL_INTERVAL_DAYS"] = int(
+        os.getenv("DUMP_FULL_INTERVAL_DAYS", "7")
+    )
+    app.config["DUMP_DELTA_RETENTION_DAYS"] = int(
+        os.getenv("DUMP_DELTA_RETENTION_DAYS", "30")
+    )
     apply_feature_flags_to_config(app.config, os.getenv("FEATURE_FLAGS"))
 
     # Docker image tag names (comma-separated) baked into the image at build
@@ -278,6 +296,7 @@ def create_app(config_override: dict | None = None) -> Flask:
     import project.cli.data
     import project.cli.dump
     import project.cli.event
+    import project.cli.image
     import project.cli.seo
     import project.cli.user
     from project import init_data, jinja_filters, requests
@@ -346,6 +365,7 @@ def create_app(config_override: dict | None = None) -> Flask:
     from project.cli.data import data_cli
     from project.cli.dump import dump_cli
     from project.cli.event import event_cli
+    from project.cli.image import image_cli
     from project.cli.seo import seo_cli
     from project.cli.user import user_cli
 
@@ -353,6 +373,7 @@ def create_app(config_override: dict | None = None) -> Flask:
     app.cli.add_command(data_cli)
     app.cli.add_command(dump_cli)
     app.cli.add_command(event_cli)
+    app.cli.add_command(image_cli)
     app.cli.add_command(seo_cli)
     app.cli.add_command(user_cli)
 
@@ -372,9 +393,17 @@ cache_path = (
 dump_path = os.path.join(cache_path, "dump")
 dump_org_path = os.path.join(cache_path, "dump_org")
 img_path = os.path.join(cache_path, "img")
+ical_path = os.path.join(cache_path, "ical")
+image_storage_env = os.environ.get("IMAGE_STORAGE_PATH", "storage/images")
+image_storage_path = (
+    image_storage_env
+    if os.path.isabs(image_storage_env)
+    else os.path.join(os.getcwd(), image_storage_env)
+)
 sitemap_file = "sitemap.xml"
 robots_txt_file = "robots.txt"
 sitemap_path = os.path.join(cache_path, sitemap_file)
+sitemap_dir = os.path.join(cache_path, "sitemaps")
 robots_txt_path = os.path.join(cache_path, robots_txt_file)
 
 
@@ -1,9 +1,12 @@
+import itertools
+
 from authlib.integrations.flask_oauth2 import current_token
-from flask import abort, current_app, g
+from flask import abort, current_app, g, has_app_context
 from flask_login import login_user
 from flask_principal import Permission, RoleNeed
 from flask_security import current_user
-from sqlalchemy import and_, exists
+from sqlalchemy import and_, event, exists
+from sqlalchemy.orm import Session
 
 from project.extensions import db
 from project.models import AdminUnit, AdminUnitMember, Event, EventPublicStatus, User
@@ -54,10 +57,40 @@ def has_admin_unit_member_permission(admin_unit_member, permission):
     return False
 
 
-def get_current_user_member_for_admin_unit(admin_unit_id):
-    from project.services.admin_unit import get_member_for_admin_unit_by_user_id
+def get_current_user_memberships() -> dict[int, AdminUnitMember]:
+    from project.services.admin_unit import get_members_for_user_id
+
+    if not current_user.is_authenticated:
+        return dict()
+
+    # Loaded once per request, so that all checks are answered from memory
+    memberships = g.get("current_user_memberships")
+
+    if memberships is None or memberships[0] != current_user.id:
+        members = get_members_for_user_id(current_user.id)
+        memberships = (
+            current_user.id,
+            {member.admin_unit_id: member for member in members},
+        )
+        g.current_user_memberships = memberships
 
-    return get_member_for_admin_unit_by_user_id(admin_unit_id, current_user.id)
+    return memberships[1]
+
+
+@event.listens_for(Session, "after_flush")
+def reset_current_user_memberships(session, flush_context):
+    if not has_app_context() or "current_user_memberships" not in g:
+        return
+
+    if any(
+        isinstance(instance, (AdminUnitMember, AdminUnitMemberRole))
+        for instance in itertools.chain(session.new, session.dirty, session.deleted)
+    ) or any(isinstance(instance, AdminUnit) for instance in session.deleted):
+        g.pop("current_user_memberships")
+
+
+def get_current_user_member_for_admin_unit(admin_unit_id):
+    return get_current_user_memberships().get(admin_unit_id)
 
 
 def has_current_user_member_permission_for_admin_unit(admin_unit_id, permission):
@@ -207,12 +240,8 @@ def can_request_event_reference(event):
 def admin_units_the_current_user_is_member_of():
     result = list()
 
-    if current_user.is_authenticated:
-        admin_unit_members = AdminUnitMember.query.filter_by(
-            user_id=current_user.id
-        ).all()
-        for admin_unit_member in admin_unit_members:
-            result.append(admin_unit_member.admin_unit)
+    for admin_unit_member in get_current_user_memberships().values():
+        result.append(admin_unit_member.admin_unit)
 
     return result
 
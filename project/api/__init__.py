@@ -18,6 +18,23 @@ from project.utils import get_localized_scope
 
 class RestApi(Api):
     def handle_error(self, err):
+        data, code, schema = self.get_error_data(err)
+
+        # Call default error handler that propagates error further
+        if code >= 500:
+            try:
+                super().handle_error(err)
+            except Exception:
+                if not schema:
+                    raise
+
+        if data and "message" in data:
+            data["message"] = gettext(data["message"])
+
+        return schema.dump(data), code
+
+    @classmethod
+    def get_error_data(cls, err):
         from project.api.schemas import (
             ErrorResponseSchema,
             UnprocessableEntityResponseSchema,
@@ -79,7 +96,7 @@ class RestApi(Api):
                     and err.exc
                     and isinstance(err.exc, ValidationError)
                 ):
-                    self.fill_validation_data(err.exc, data)
+                    cls.fill_validation_data(err.exc, data)
             else:
                 schema = ErrorResponseSchema()
         elif isinstance(err, ValidationError):
@@ -89,22 +106,12 @@ class RestApi(Api):
             )
             code = 422
             schema = UnprocessableEntityResponseSchema()
-            self.fill_validation_data(err, data)
+            cls.fill_validation_data(err, data)
 
-        # Call default error handler that propagates error further
-        if code >= 500:
-            try:
-                super().handle_error(err)
-            except Exception:
-                if not schema:
-                    raise
-
-        if data and "message" in data:
-            data["message"] = gettext(data["message"])
-
-        return schema.dump(data), code
+        return data, code, schema
 
-    def fill_validation_data(self, err: ValidationError, data: dict):
+    @classmethod
+    def fill_validation_data(cls, err: ValidationError, data: dict):
         if (
             getattr(err, "args", None)
             and isinstance(err.args, tuple)
@@ -28,13 +28,21 @@ from project.api.event_date.schemas import (
 )
 from project.api.resources import (
     BaseResource,
+    etag_version,
     require_api_access,
     require_organization_api_access,
 )
 from project.api.schemas import NoneSchema
 from project.application.commands.delete_event_command import DeleteEventCommand
 from project.models import AdminUnit, Event, EventDate, EventPublicStatus
-from project.services.event import get_event_with_details_or_404, get_events_query
+from project.pagination import paginate
+from project.services.event import (
+    event_keyset,
+    get_event_version,
+    get_event_with_details_or_404,
+    get_events_keyset,
+    get_events_query,
+)
 from project.services.event_service import EventService
 from project.services.search_params import EventSearchParams
 from project.views.event import send_event_report_mails
@@ -54,6 +62,23 @@ def api_can_read_private_events(admin_unit: AdminUnit):
     return can_read_private_events(admin_unit)
 
 
+def get_event_etag_version(id, **kwargs):
+    # Responses for users contain user specific fields like is_favored
+    if login_api_user():
+        return None
+
+    version = get_event_version(id)
+
+    if (
+        not version
+        or version.public_status != EventPublicStatus.published
+        or not version.is_verified
+    ):
+        return None
+
+    return version
+
+
 class EventListResource(BaseResource):
     @doc(summary="List events", tags=["Events"])
     @use_kwargs(EventListRequestSchema, location=("query"))
@@ -71,9 +96,14 @@ class EventListResource(BaseResource):
         )
         query = params.get_trackable_query(query, Event)
         query = params.get_trackable_order_by(query, Event)
-        query = query.order_by(Event.min_start)
+        query = query.order_by(*event_keyset.columns)
 
-        return query.paginate()
+        return paginate(
+            query,
+            get_events_keyset(params),
+            kwargs.get("cursor"),
+            kwargs["include_total"],
+        )
 
 
 class EventResource(BaseResource):
@@ -82,6 +112,7 @@ class EventResource(BaseResource):
     @doc(summary="Get event", tags=["Events"])
     @marshal_with(EventSchema)
     @require_api_access()
+    @etag_version(get_event_etag_version)
     def get(self, id):
         login_api_user()
         event = get_event_with_details_or_404(id)
@@ -161,7 +192,12 @@ class EventSearchResource(BaseResource):
         login_api_user()
         params = EventSearchParams()
         params.load_from_request(**kwargs)
-        pagination = get_events_query(params).paginate()
+        pagination = paginate(
+            get_events_query(params),
+            get_events_keyset(params),
+            kwargs.get("cursor"),
+            kwargs["include_total"],
+        )
         return pagination
 
 
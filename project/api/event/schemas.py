@@ -41,6 +41,7 @@ from project.api.place.schemas import (
     PlaceWriteIdSchema,
 )
 from project.api.schemas import (
+    CursorPaginationRequestSchemaMixin,
     IdPlainSchemaMixin,
     IdSchemaMixin,
     PaginationRequestSchema,
@@ -269,7 +270,11 @@ class EventSearchItemSchema(
     custom_categories = fields.List(fields.Nested(CustomEventCategoryRefSchema))
 
 
-class EventListRequestSchema(PaginationRequestSchema, TrackableRequestSchemaMixin):
+class EventListRequestSchema(
+    PaginationRequestSchema,
+    CursorPaginationRequestSchemaMixin,
+    TrackableRequestSchemaMixin,
+):
     sort = fields.Str(
         metadata={"description": "Sort result items."},
         validate=validate.OneOf(
@@ -315,7 +320,11 @@ class UserFavoriteEventListResponseSchema(PaginationResponseSchema):
     )
 
 
-class EventSearchRequestSchema(PaginationRequestSchema, TrackableRequestSchemaMixin):
+class EventSearchRequestSchema(
+    PaginationRequestSchema,
+    CursorPaginationRequestSchemaMixin,
+    TrackableRequestSchemaMixin,
+):
     keyword = fields.Str(
         metadata={"description": "Looks for keyword in name, description and tags."},
     )
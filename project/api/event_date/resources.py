@@ -1,4 +1,4 @@
-from flask import request
+from flask import jsonify, request
 from flask_apispec import doc, marshal_with, use_kwargs
 from sqlalchemy import and_
 from sqlalchemy.orm import defaultload, lazyload
@@ -15,7 +15,13 @@ from project.api.event_date.schemas import (
 )
 from project.api.resources import BaseResource, require_api_access
 from project.models import AdminUnit, Event, EventDate, EventPublicStatus
-from project.services.event import get_event_dates_query
+from project.pagination import paginate
+from project.response_cache import cached_response
+from project.services.event import (
+    event_date_keyset,
+    get_event_dates_keyset,
+    get_event_dates_query,
+)
 from project.services.search_params import EventSearchParams
 from project.views.utils import get_current_admin_unit_for_api
 
@@ -42,8 +48,13 @@ class EventDateListResource(BaseResource):
         params.load_from_request(**kwargs)
         query = params.get_trackable_query(query, Event)
         query = params.get_trackable_order_by(query, Event)
-        query = query.order_by(EventDate.start)
-        return query.paginate()
+        query = query.order_by(*event_date_keyset.columns)
+        return paginate(
+            query,
+            event_date_keyset if params.is_sorted_by_start() else None,
+            kwargs.get("cursor"),
+            kwargs["include_total"],
+        )
 
 
 class EventDateResource(BaseResource):
@@ -78,8 +89,35 @@ class EventDateSearchResource(BaseResource):
             if admin_unit:
                 params.not_referenced_by_organization_id = admin_unit.id
 
-        pagination = get_event_dates_query(params).paginate()
-        return pagination
+            pagination = paginate(
+                get_event_dates_query(params),
+                get_event_dates_keyset(params),
+                kwargs.get("cursor"),
+                kwargs["include_total"],
+            )
+            return pagination
+
+        def build_response():
+            pagination = paginate(
+                get_event_dates_query(params),
+                get_event_dates_keyset(params),
+                kwargs.get("cursor"),
+                kwargs["include_total"],
+            )
+            return jsonify(EventDateSearchResponseSchema().dump(pagination))
+
+        return cached_response(
+            "api_v1_event_date_search",
+            params.admin_unit_id,
+            {
+                "params": params.get_cache_key_data(),
+                "page": request.args.get("page"),
+                "per_page": request.args.get("per_page"),
+                "cursor": request.args.get("cursor"),
+                "include_total": kwargs["include_total"],
+            },
+            build_response,
+        )
 
 
 add_api_resource(EventDateListResource, "/event-dates", "api_v1_event_date_list")
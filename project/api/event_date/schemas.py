@@ -8,6 +8,7 @@ from project.api.event.schemas import (
 )
 from project.api.fields import CustomDateTimeField
 from project.api.schemas import (
+    CursorPaginationRequestSchemaMixin,
     PaginationRequestSchema,
     PaginationResponseSchema,
     TrackableRequestSchemaMixin,
@@ -37,7 +38,11 @@ class EventDateRefSchema(marshmallow.SQLAlchemySchema):
     start = CustomDateTimeField()
 
 
-class EventDateListRequestSchema(PaginationRequestSchema, TrackableRequestSchemaMixin):
+class EventDateListRequestSchema(
+    PaginationRequestSchema,
+    CursorPaginationRequestSchemaMixin,
+    TrackableRequestSchemaMixin,
+):
     sort = fields.Str(
         metadata={"description": "Sort result items."},
         validate=validate.OneOf(
@@ -1,6 +1,7 @@
 from marshmallow import ValidationError, fields
 
 from project.dateutils import berlin_tz, gmt_tz
+from project.pagination import decode_cursor
 
 
 class NumericStr(fields.String):
@@ -17,6 +18,22 @@ class NumericStr(fields.String):
             raise ValidationError("Must be a numeric value.") from error
 
 
+class CursorField(fields.String):
+    def _deserialize(self, value, attr, data, **kwargs):
+        value = super()._deserialize(value, attr, data, **kwargs)
+
+        try:
+            result = decode_cursor(value)
+        except ValueError as error:
+            raise ValidationError("Invalid cursor.") from error
+
+        # All keysets are ordered by a date time and an id
+        if len(result) != 2:
+            raise ValidationError("Invalid cursor.")
+
+        return result
+
+
 class TimezoneDateTimeField(fields.DateTime):
     def __init__(self, format: str | None = None, **kwargs) -> None:
         super().__init__(format, **kwargs)
@@ -23,6 +23,7 @@ from project.api.event.schemas import (
     EventIdPlainSchema,
     EventListRequestSchema,
     EventListResponseSchema,
+    EventPutRequestPlainSchema,
     EventSearchRequestSchema,
     EventSearchResponseSchema,
 )
@@ -78,24 +79,35 @@ from project.api.organizer.schemas import (
     OrganizerIdPlainSchema,
     OrganizerListRequestSchema,
     OrganizerListResponseSchema,
+    OrganizerPutRequestPlainSchema,
 )
 from project.api.place.schemas import (
     PlaceCreateRequestPlainSchema,
     PlaceIdPlainSchema,
     PlaceListRequestSchema,
     PlaceListResponseSchema,
+    PlacePutRequestPlainSchema,
 )
 from project.api.resources import (
     BaseResource,
+    etag_version,
     require_api_access,
     require_organization_api_access,
 )
+from project.api.schemas import BatchRequestSchema, BatchResponseSchema
 from project.extensions import db
-from project.models import AdminUnit, Event, EventPublicStatus
+from project.models import (
+    AdminUnit,
+    Event,
+    EventOrganizer,
+    EventPlace,
+    EventPublicStatus,
+)
 from project.models.admin_unit import AdminUnitInvitation, AdminUnitRelation
 from project.models.admin_unit_verification_request import (
     AdminUnitVerificationRequestReviewStatus,
 )
+from project.pagination import paginate
 from project.services import organization_service
 from project.services.admin_unit import (
     get_admin_unit_invitation_query,
@@ -106,7 +118,14 @@ from project.services.admin_unit import (
     get_organizer_query,
     get_place_query,
 )
-from project.services.event import get_event_dates_query, get_events_query
+from project.services.event import (
+    event_keyset,
+    get_admin_unit_events_version,
+    get_event_dates_keyset,
+    get_event_dates_query,
+    get_events_keyset,
+    get_events_query,
+)
 from project.services.event_service import EventService
 from project.services.organization_invitation_service import (
     OrganizationInvitationService,
@@ -165,7 +184,12 @@ class OrganizationEventDateSearchResource(BaseResource):
         params.admin_unit_id = admin_unit.id
         params.can_read_private_events = api_can_read_private_events(admin_unit)
 
-        pagination = get_event_dates_query(params).paginate()
+        pagination = paginate(
+            get_event_dates_query(params),
+            get_event_dates_keyset(params),
+            kwargs.get("cursor"),
+            kwargs["include_total"],
+        )
         return pagination
 
 
@@ -182,10 +206,29 @@ class OrganizationEventSearchResource(BaseResource):
         params.admin_unit_id = admin_unit.id
         params.can_read_private_events = api_can_read_private_events(admin_unit)
 
-        pagination = get_events_query(params).paginate()
+        pagination = paginate(
+            get_events_query(params),
+            get_events_keyset(params),
+            kwargs.get("cursor"),
+            kwargs["include_total"],
+        )
         return pagination
 
 
+def get_organization_events_etag_version(id, **kwargs):
+    admin_unit = db.session.get(AdminUnit, id)
+
+    if not admin_unit:
+        return None
+
+    return (
+        admin_unit.last_modified_at,
+        admin_unit.is_verified,
+        api_can_read_private_events(admin_unit),
+        *get_admin_unit_events_version(admin_unit.id),
+    )
+
+
 class OrganizationEventListResource(BaseResource):
     event_service: Annotated[EventService, Provide["services.event_service"]]
 
@@ -193,6 +236,7 @@ class OrganizationEventListResource(BaseResource):
     @use_kwargs(EventListRequestSchema, location=("query"))
     @marshal_with(EventListResponseSchema)
     @require_api_access()
+    @etag_version(get_organization_events_etag_version)
     def get(self, id, **kwargs):
         params = EventSearchParams()
         params.load_from_request(**kwargs)
@@ -210,9 +254,14 @@ class OrganizationEventListResource(BaseResource):
         query = Event.query.join(Event.admin_unit).filter(event_filter)
         query = params.get_trackable_query(query, Event)
         query = params.get_trackable_order_by(query, Event)
-        query = query.order_by(Event.min_start)
+        query = query.order_by(*event_keyset.columns)
 
-        return query.paginate()
+        return paginate(
+            query,
+            get_events_keyset(params),
+            kwargs.get("cursor"),
+            kwargs["include_total"],
+        )
 
     @doc(
         summary="Add new event",
@@ -229,6 +278,21 @@ class OrganizationEventListResource(BaseResource):
         return cmd_result, 201
 
 
+class OrganizationEventBatchResource(BaseResource):
+    @doc(
+        summary="Add or update events in a batch",
+        description="Each item is handled like a single request. Failing items don't affect the other items.",
+        tags=["Organizations", "Events"],
+    )
+    @use_kwargs(BatchRequestSchema, location="json", apply=False)
+    @marshal_with(BatchResponseSchema)
+    @require_organization_api_access("organization.events:write")
+    def post(self, id):
+        return self.handle_command_batch(
+            Event, EventCreateRequestPlainSchema, EventPutRequestPlainSchema
+        )
+
+
 class OrganizationListResource(BaseResource):
     @doc(
         summary="List organizations",
@@ -287,6 +351,23 @@ class OrganizationOrganizerListResource(BaseResource):
         return cmd_result, 201
 
 
+class OrganizationOrganizerBatchResource(BaseResource):
+    @doc(
+        summary="Add or update organizers in a batch",
+        description="Each item is handled like a single request. Failing items don't affect the other items.",
+        tags=["Organizations", "Organizers"],
+    )
+    @use_kwargs(BatchRequestSchema, location="json", apply=False)
+    @marshal_with(BatchResponseSchema)
+    @require_organization_api_access("organization.event_organizers:write")
+    def post(self, id):
+        return self.handle_command_batch(
+            EventOrganizer,
+            OrganizerCreateRequestPlainSchema,
+            OrganizerPutRequestPlainSchema,
+        )
+
+
 class OrganizationPlaceListResource(BaseResource):
     @doc(summary="List places of organization", tags=["Organizations", "Places"])
     @use_kwargs(PlaceListRequestSchema, location=("query"))
@@ -316,6 +397,21 @@ class OrganizationPlaceListResource(BaseResource):
         return cmd_result, 201
 
 
+class OrganizationPlaceBatchResource(BaseResource):
+    @doc(
+        summary="Add or update places in a batch",
+        description="Each item is handled like a single request. Failing items don't affect the other items.",
+        tags=["Organizations", "Places"],
+    )
+    @use_kwargs(BatchRequestSchema, location="json", apply=False)
+    @marshal_with(BatchResponseSchema)
+    @require_organization_api_access("organization.event_places:write")
+    def post(self, id):
+        return self.handle_command_batch(
+            EventPlace, PlaceCreateRequestPlainSchema, PlacePutRequestPlainSchema
+        )
+
+
 class OrganizationIncomingEventReferenceListResource(BaseResource):
     @doc(
         summary="List incoming event references of organization",
@@ -713,6 +809,11 @@ add_api_resource(
     "/organizations/<int:id>/events",
     "api_v1_organization_event_list",
 )
+add_api_resource(
+    OrganizationEventBatchResource,
+    "/organizations/<int:id>/events/batch",
+    "api_v1_organization_event_batch",
+)
 add_api_resource(
     OrganizationEventListListResource,
     "/organizations/<int:id>/event-lists",
@@ -729,11 +830,21 @@ add_api_resource(
     "/organizations/<int:id>/organizers",
     "api_v1_organization_organizer_list",
 )
+add_api_resource(
+    OrganizationOrganizerBatchResource,
+    "/organizations/<int:id>/organizers/batch",
+    "api_v1_organization_organizer_batch",
+)
 add_api_resource(
     OrganizationPlaceListResource,
     "/organizations/<int:id>/places",
     "api_v1_organization_place_list",
 )
+add_api_resource(
+    OrganizationPlaceBatchResource,
+    "/organizations/<int:id>/places/batch",
+    "api_v1_organization_place_batch",
+)
 add_api_resource(
     OrganizationIncomingEventReferenceListResource,
     "/organizations/<int:id>/event-references/incoming",
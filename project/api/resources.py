@@ -1,27 +1,35 @@
+import hashlib
+import json
 from functools import wraps
 
 from authlib.integrations.flask_oauth2 import current_token
 from authlib.oauth2 import OAuth2Error
 from dependency_injector.wiring import Provide, inject
-from flask import abort, current_app, request
+from flask import Response, abort, current_app, g, request
 from flask_apispec import marshal_with
 from flask_apispec.annotations import annotate
 from flask_apispec.views import MethodResource
+from flask_babel import gettext
 from flask_limiter.extension import LimitDecorator
 from flask_wtf.csrf import validate_csrf
+from marshmallow import ValidationError
+from sqlalchemy import select
+from werkzeug.http import is_resource_modified, quote_etag
 
 from project.api.schemas import (
+    BatchItemIdSchema,
+    BatchRequestSchema,
     ErrorResponseSchema,
     TooManyRequestsResponseSchema,
     UnprocessableEntityResponseSchema,
 )
+from project.api_auth_cache import query_api_key
 from project.application.message_bus import MessageBus
 from project.application.services.abstract_app_context_provider import (
     AbstractAppContextProvider,
 )
 from project.container import Application
 from project.extensions import csrf, db, limiter
-from project.models.api_key import ApiKey
 from project.models.mixins.rate_limit_provider_mixin import RateLimitProviderMixin
 from project.oauth2_extensions import require_oauth
 from project.utils import getattr_keypath, hash_api_key
@@ -44,12 +52,68 @@ def etag_cache(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
         response = func(*args, **kwargs)
+        # Keeps the etag of etag_version
         response.add_etag()
         return response.make_conditional(request)
 
     return wrapper
 
 
+def get_etag_identity() -> str | None:
+    if current_token:
+        return f"token:{current_token.id}"
+
+    request_api_key = request.headers.get("X-API-Key")
+    if request_api_key:
+        return f"api_key:{hash_api_key(request_api_key)}"
+
+    return None
+
+
+def get_version_etag(version) -> str:
+    data = json.dumps(
+        [request.full_path, get_etag_identity(), list(version)],
+        default=str,
+    )
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def etag_version(get_version):
+    """Answers conditional requests before the handler runs.
+
+    get_version is called with the view arguments and returns values that
+    change whenever the response changes, or None if the request has to be
+    handled regardless. It has to be a lot cheaper than the handler.
+    """
+
+    def inner_decorator(func):
+        @wraps(func)
+        def wrapped(*args, **kwargs):
+            version = get_version(**kwargs) if request.method == "GET" else None
+
+            if version is None:
+                return func(*args, **kwargs)
+
+            etag = get_version_etag(version)
+
+            if not is_resource_modified(request.environ, etag=etag):
+                response = Response(status=304)
+                response.set_etag(etag)
+                return response
+
+            result = func(*args, **kwargs)
+
+            if isinstance(result, Response):
+                result.set_etag(etag)
+                return result
+
+            return result, {"ETag": quote_etag(etag)}
+
+        return wrapped
+
+    return inner_decorator
+
+
 def is_internal_request() -> bool:
     try:
         validate_csrf(csrf._get_csrf_token())
@@ -63,8 +127,7 @@ def get_api_key_from_request() -> bool:
     if not request_api_key:
         return False
 
-    key_hash = hash_api_key(request_api_key)
-    api_key = db.session.query(ApiKey).filter_by(key_hash=key_hash).first()
+    api_key = query_api_key(hash_api_key(request_api_key))
     if not api_key:
         return False
 
@@ -219,6 +282,88 @@ class BaseResource(MethodResource):
 
         return instance
 
+    def handle_command_batch(self, model, create_schema_cls, put_schema_cls):
+        from project.api import RestApi
+
+        items = BatchRequestSchema().load(request.json)["items"]
+        context = g.api_command_context
+
+        results = [None] * len(items)
+        item_ids = [None] * len(items)
+        id_schema = BatchItemIdSchema()
+
+        for index, item in enumerate(items):
+            try:
+                item_ids[index] = id_schema.load(item).get("id")
+            except ValidationError as e:
+                results[index] = e
+
+        # Only items of the organization may be updated
+        ids = {item_id for item_id in item_ids if item_id is not None}
+        own_ids = (
+            set(
+                db.session.scalars(
+                    select(model.id).where(
+                        model.id.in_(ids),
+                        model.admin_unit_id == context["admin_unit_id"],
+                    )
+                )
+            )
+            if ids
+            else set()
+        )
+
+        batch = list()
+
+        for index, item in enumerate(items):
+            if results[index] is not None:
+                continue
+
+            item = dict(item)
+            item.pop("id", None)
+            item_id = item_ids[index]
+
+            if item_id is None:
+                schema = create_schema_cls(context=context)
+            elif item_id in own_ids:
+                schema = put_schema_cls(context={**context, "id": item_id})
+            else:
+                results[index] = {"status": 404, "id": item_id, "name": "Not Found"}
+                continue
+
+            try:
+                batch.append((index, item_id, schema.load(item)))
+            except Exception as e:
+                results[index] = e
+
+        cmd_results = self.message_bus.handle_command_batch(
+            [cmd for _, _, cmd in batch]
+        )
+
+        for (index, item_id, _), cmd_result in zip(batch, cmd_results):
+            if isinstance(cmd_result, Exception):
+                results[index] = cmd_result
+            elif item_id is None:
+                results[index] = {"status": 201, "id": cmd_result.id}
+            else:
+                results[index] = {"status": 200, "id": item_id}
+
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                data, code, schema = RestApi.get_error_data(result)
+
+                if not schema:
+                    current_app.logger.exception(
+                        "Exception handling batch item", exc_info=result
+                    )
+                    data = {"name": "Internal Server Error"}
+                elif "message" in data:
+                    data["message"] = gettext(data["message"])
+
+                results[index] = {"status": code, **data}
+
+        return {"items": results}
+
     def update_instance(self, schema_cls, instance):
         with db.session.no_autoflush:
             instance = schema_cls().load(
@@ -1,8 +1,18 @@
-from marshmallow import ValidationError, fields, missing, post_load, validate
+from marshmallow import (
+    EXCLUDE,
+    ValidationError,
+    fields,
+    missing,
+    post_load,
+    validate,
+    validates_schema,
+)
 from marshmallow.decorators import pre_load
 
 from project.api import marshmallow
-from project.api.fields import GmtDateTimeField
+from project.api.fields import CursorField, GmtDateTimeField
+
+BATCH_MAX_ITEMS = 100
 
 
 class PostPatchSchemaMixin(object):
@@ -131,6 +141,27 @@ class PaginationRequestSchema(marshmallow.Schema):
     )
 
 
+class CursorPaginationRequestSchemaMixin(object):
+    cursor = CursorField(
+        metadata={
+            "description": "Returns the items after the given cursor instead of a page. Use next_cursor of the previous response. Only works with the default sort order."
+        },
+    )
+    include_total = fields.Boolean(
+        load_default=True,
+        metadata={
+            "description": "If false, total and pages are not calculated. Only works with the default sort order and starts cursor pagination."
+        },
+    )
+
+    @validates_schema
+    def validate_cursor_sort(self, data, **kwargs):
+        if data.get("cursor") and data.get("sort") not in (None, "start"):
+            raise ValidationError(
+                "Cursor pagination only works with the default sort order.", "cursor"
+            )
+
+
 class PaginationResponseSchema(marshmallow.Schema):
     has_next = fields.Boolean(
         required=True, metadata={"description": "True if a next page exists."}
@@ -155,6 +186,45 @@ class PaginationResponseSchema(marshmallow.Schema):
         required=True,
         metadata={"description": "The total number of items matching the query"},
     )
+    next_cursor = fields.Str(
+        metadata={
+            "description": "Cursor of the next items. Only set if there is a next page and with the default sort order."
+        },
+    )
+
+
+class BatchRequestSchema(marshmallow.Schema):
+    items = fields.List(
+        fields.Dict(),
+        required=True,
+        validate=validate.Length(min=1, max=BATCH_MAX_ITEMS),
+        metadata={
+            "description": f"Up to {BATCH_MAX_ITEMS} items like in the requests to add a single item. Items with id update the existing item like in the requests to update a single item."
+        },
+    )
+
+
+class BatchItemIdSchema(marshmallow.Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    id = fields.Integer(strict=True, allow_none=True, validate=validate.Range(min=1))
+
+
+class BatchItemResultSchema(ErrorResponseSchema):
+    status = fields.Integer(
+        required=True,
+        metadata={"description": "Status code of the item like for a single request."},
+    )
+    id = fields.Integer(metadata={"description": "Id of the added or updated item."})
+    errors = fields.List(fields.Nested(UnprocessableEntityErrorSchema))
+
+
+class BatchResponseSchema(marshmallow.Schema):
+    items = fields.List(
+        fields.Nested(BatchItemResultSchema),
+        metadata={"description": "Results in the order of the request items."},
+    )
 
 
 class NoneSchema(marshmallow.Schema):
@@ -0,0 +1,135 @@
+import hashlib
+import itertools
+
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from project.application.services.abstract_api_auth_cache import AbstractApiAuthCache
+from project.extensions import db
+from project.models import ApiKey, AppInstallation, OAuth2Token
+
+# Secrets like the access token itself are never cached
+TOKEN_COLUMNS = (
+    "id",
+    "client_id",
+    "token_type",
+    "scope",
+    "issued_at",
+    "access_token_revoked_at",
+    "refresh_token_revoked_at",
+    "expires_in",
+    "user_id",
+    "app_id",
+    "app_installation_id",
+)
+APP_INSTALLATION_COLUMNS = ("id", "admin_unit_id", "oauth2_client_id", "permissions")
+API_KEY_COLUMNS = ("id", "admin_unit_id", "user_id", "rate_limit_value")
+
+INVALIDATED_KEYS = "api_auth_cache_invalidated_keys"
+
+
+def get_api_auth_cache() -> AbstractApiAuthCache:
+    return current_app.container.infrastructure.api_auth_cache()
+
+
+def get_token_cache_key(access_token: str) -> str:
+    digest = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+    return f"token:{digest}"
+
+
+def get_api_key_cache_key(key_hash: str) -> str:
+    return f"api_key:{key_hash}"
+
+
+def query_token(access_token: str) -> OAuth2Token | None:
+    api_auth_cache = get_api_auth_cache()
+    key = get_token_cache_key(access_token)
+    values = api_auth_cache.get(key)
+
+    if values is None:
+        token = OAuth2Token.query.filter_by(access_token=access_token).first()
+
+        if token:
+            app_installation = token.app_installation
+            api_auth_cache.set(
+                key,
+                {
+                    "token": _get_values(token, TOKEN_COLUMNS),
+                    "app_installation": (
+                        _get_values(app_installation, APP_INSTALLATION_COLUMNS)
+                        if app_installation
+                        else None
+                    ),
+                },
+            )
+
+        return token
+
+    # Merged first, so that token.app_installation is found without a query
+    if values["app_installation"]:
+        _merge_values(AppInstallation, values["app_installation"])
+
+    return _merge_values(OAuth2Token, values["token"])
+
+
+def query_api_key(key_hash: str) -> ApiKey | None:
+    api_auth_cache = get_api_auth_cache()
+    key = get_api_key_cache_key(key_hash)
+    values = api_auth_cache.get(key)
+
+    if values is None:
+        api_key = db.session.query(ApiKey).filter_by(key_hash=key_hash).first()
+
+        if api_key:
+            api_auth_cache.set(key, _get_values(api_key, API_KEY_COLUMNS))
+
+        return api_key
+
+    return _merge_values(ApiKey, values)
+
+
+def _get_values(instance, columns: tuple) -> dict:
+    return {column: getattr(instance, column) for column in columns}
+
+
+def _merge_values(model, values: dict):
+    # Attaches the instance as if it was loaded, without a query. Columns
+    # that are not cached are loaded on first access.
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return db.session.merge(instance, load=False)
+
+
+def _get_cache_key(instance) -> str | None:
+    if isinstance(instance, OAuth2Token) and instance.access_token:
+        return get_token_cache_key(instance.access_token)
+
+    if isinstance(instance, ApiKey) and instance.key_hash:
+        return get_api_key_cache_key(instance.key_hash)
+
+    return None
+
+
+@event.listens_for(Session, "before_flush")
+def collect_invalidated_keys(session, flush_context, instances):
+    # Revoked or deleted credentials are dropped from the cache after the
+    # commit, so that concurrent requests can't cache them again in between.
+    for instance in itertools.chain(session.dirty, session.deleted):
+        key = _get_cache_key(instance)
+
+        if key:
+            session.info.setdefault(INVALIDATED_KEYS, set()).add(key)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_keys(session):
+    keys = session.info.pop(INVALIDATED_KEYS, None)
+
+    if not keys:
+        return
+
+    api_auth_cache = get_api_auth_cache()
+
+    for key in keys:
+        api_auth_cache.invalidate(key)
@@ -1,4 +1,5 @@
 import abc
+from typing import List
 
 from project.domain import events
 
@@ -7,3 +8,7 @@ class AbstractEventDispatcher(abc.ABC):
     @abc.abstractmethod
     def dispatch(self, event: events.Event):  # pragma: no cover
         raise NotImplementedError
+
+    def dispatch_many(self, pending_events: List[events.Event]):
+        for event in pending_events:
+            self.dispatch(event)
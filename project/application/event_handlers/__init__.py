@@ -1,15 +1,23 @@
 from .abstract_event_handler import AbstractEventHandler
+from .api_auth_cache_event_handler import ApiAuthCacheEventHandler
 from .app_installation_webhook_event_handler import AppInstallationWebhookEventHandler
 from .app_webhook_event_handler import AppWebhookEventHandler
+from .event_date_search_index_event_handler import EventDateSearchIndexEventHandler
+from .ical_feed_event_handler import IcalFeedEventHandler
+from .image_derivative_event_handler import ImageDerivativeEventHandler
 from .organization_deletion_requested_email_event_handler import (
     OrganizationDeletionRequestedEmailEventHandler,
 )
 from .reference_event_changed_email_event_handler import (
     ReferenceEventChangedEmailEventHandler,
 )
+from .response_cache_event_handler import ResponseCacheEventHandler
 from .webhook_delivery_created_attempt_event_handler import (
     WebhookDeliveryCreatedAttemptEventHandler,
 )
+from .webhook_subscription_cache_event_handler import (
+    WebhookSubscriptionCacheEventHandler,
+)
 
 __all__ = [
     "AbstractEventHandler",
@@ -18,4 +26,10 @@ __all__ = [
     "WebhookDeliveryCreatedAttemptEventHandler",
     "AppWebhookEventHandler",
     "ReferenceEventChangedEmailEventHandler",
+    "EventDateSearchIndexEventHandler",
+    "ImageDerivativeEventHandler",
+    "ResponseCacheEventHandler",
+    "IcalFeedEventHandler",
+    "WebhookSubscriptionCacheEventHandler",
+    "ApiAuthCacheEventHandler",
 ]
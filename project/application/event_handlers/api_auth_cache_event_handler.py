@@ -0,0 +1,16 @@
+from project.application.services.abstract_api_auth_cache import AbstractApiAuthCache
+from project.domain import events
+from project.domain.abstract_unit_of_work import AbstractUnitOfWork
+
+from .abstract_event_handler import AbstractEventHandler
+
+
+class ApiAuthCacheEventHandler(AbstractEventHandler):
+    def __init__(self, api_auth_cache: AbstractApiAuthCache):
+        super().__init__()
+        self.api_auth_cache = api_auth_cache
+
+    def handle(self, event: events.Event, uow: AbstractUnitOfWork):
+        # Cached tokens of an installation hold its permissions. The tokens
+        # are not indexed by installation and installations rarely change.
+        self.api_auth_cache.invalidate_all()
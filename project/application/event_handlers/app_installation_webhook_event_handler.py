@@ -1,9 +1,17 @@
+import datetime
+
+from project.application.services.abstract_webhook_subscription_cache import (
+    AbstractWebhookSubscriptionCache,
+)
 from project.application.webhooks.abstract_webhook_mapper_context import (
     AbstractWebhookMapperContext,
 )
 from project.application.webhooks.app_installation_webhooks import (
     get_app_installation_webhook_info_by_event_type,
 )
+from project.application.webhooks.payloads.webhook_value_mapping import (
+    merge_changed_value_data,
+)
 from project.domain import events
 from project.domain.abstract_unit_of_work import AbstractUnitOfWork
 from project.domain.models.aggregates.webhook_delivery_aggregate import (
@@ -30,9 +38,14 @@ _EVENT_WEBHOOK_EVENT_TYPE: dict[type, str] = {
 
 
 class AppInstallationWebhookEventHandler(AbstractEventHandler):
-    def __init__(self, mapper_context: AbstractWebhookMapperContext):
+    def __init__(
+        self,
+        mapper_context: AbstractWebhookMapperContext,
+        webhook_subscription_cache: AbstractWebhookSubscriptionCache,
+    ):
         super().__init__()
         self.mapper_context = mapper_context
+        self.webhook_subscription_cache = webhook_subscription_cache
 
     def handle(self, event: events.Event, uow: AbstractUnitOfWork):
         event_type = _EVENT_WEBHOOK_EVENT_TYPE.get(type(event))
@@ -40,6 +53,12 @@ class AppInstallationWebhookEventHandler(AbstractEventHandler):
         required_permissions = webhook_info.permissions
         admin_unit_id = getattr(event, "admin_unit_id", None)
 
+        # Most organizations have no apps installed
+        if webhook_info.event_type not in self._get_subscribed_event_types(
+            admin_unit_id, uow
+        ):
+            return
+
         installations = uow.organization_app_installations.get_all_with_webhook(
             admin_unit_id, required_permissions, webhook_info.event_type
         )
@@ -48,21 +67,115 @@ class AppInstallationWebhookEventHandler(AbstractEventHandler):
             return
 
         payload_data = webhook_info.payload_cls.from_event(event, self.mapper_context)
+        payload = payload_data.model_dump(mode="json")
         actor = Actor()
+        webhook_event = None
+
+        for installation in installations:
+            debounce_seconds = self._get_debounce_seconds(
+                webhook_info, installation, uow
+            )
+
+            if debounce_seconds:
+                self._add_debounced_delivery(
+                    actor,
+                    uow,
+                    installation,
+                    webhook_info.event_type,
+                    event,
+                    payload,
+                    debounce_seconds,
+                )
+                continue
+
+            if webhook_event is None:
+                webhook_event = WebhookEventAggregate.create(
+                    actor,
+                    event_type=webhook_info.event_type,
+                    timestamp=event.timestamp,
+                    payload=payload,
+                )
+                uow.webhook_events.add(webhook_event)
+
+            self._add_delivery(actor, uow, installation, webhook_event)
+
+    def _get_subscribed_event_types(
+        self, admin_unit_id: int, uow: AbstractUnitOfWork
+    ) -> set[str]:
+        event_types = self.webhook_subscription_cache.get_event_types(admin_unit_id)
+
+        if event_types is None:
+            event_types = uow.organization_app_installations.get_webhook_event_types(
+                admin_unit_id
+            )
+            self.webhook_subscription_cache.set_event_types(admin_unit_id, event_types)
+
+        return event_types
+
+    def _get_debounce_seconds(self, webhook_info, installation, uow) -> int:
+        if not webhook_info.debounceable:
+            return 0
+
+        app = uow.apps.get(installation.app_id)
+
+        if not app or not app.webhook:
+            return 0
+
+        return app.webhook.debounce_seconds or 0
+
+    def _add_debounced_delivery(
+        self,
+        actor: Actor,
+        uow: AbstractUnitOfWork,
+        installation,
+        event_type: str,
+        event: events.Event,
+        payload: dict,
+        debounce_seconds: int,
+    ):
+        # Debounced deliveries own their webhook event, so that its payload
+        # can be merged with subsequent changes until the delivery is sent.
+        delivery = uow.webhook_deliveries.get_debounced(
+            installation.id, event_type, event.id
+        )
+
+        if delivery:
+            webhook_event = uow.webhook_events.get(delivery.webhook_event_id)
+            webhook_event.timestamp = event.timestamp
+            webhook_event.payload = merge_changed_value_data(
+                webhook_event.payload, payload
+            )
+            uow.webhook_events.update(webhook_event)
+            return
 
         webhook_event = WebhookEventAggregate.create(
             actor,
-            event_type=webhook_info.event_type,
+            event_type=event_type,
             timestamp=event.timestamp,
-            payload=payload_data.model_dump(mode="json"),
+            payload=payload,
         )
         uow.webhook_events.add(webhook_event)
 
-        for installation in installations:
-            webhook_delivery = WebhookDeliveryAggregate.create(
-                actor,
-                webhook_event_id=webhook_event.id,
-                app_id=installation.app_id,
-                app_installation_id=installation.id,
-            )
-            uow.webhook_deliveries.add(webhook_delivery)
+        delivery = self._add_delivery(actor, uow, installation, webhook_event)
+
+        # Webhook times are stored as naive UTC
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        uow.webhook_deliveries.schedule_next_attempts(
+            {delivery.id: now + datetime.timedelta(seconds=debounce_seconds)}
+        )
+
+    def _add_delivery(
+        self,
+        actor: Actor,
+        uow: AbstractUnitOfWork,
+        installation,
+        webhook_event: WebhookEventAggregate,
+    ) -> WebhookDeliveryAggregate:
+        webhook_delivery = WebhookDeliveryAggregate.create(
+            actor,
+            webhook_event_id=webhook_event.id,
+            app_id=installation.app_id,
+            app_installation_id=installation.id,
+        )
+        uow.webhook_deliveries.add(webhook_delivery)
+        return webhook_delivery
@@ -0,0 +1,23 @@
+from project.application.services.abstract_event_date_search_indexer import (
+    AbstractEventDateSearchIndexer,
+)
+from project.domain import events
+from project.domain.abstract_unit_of_work import AbstractUnitOfWork
+
+from .abstract_event_handler import AbstractEventHandler
+
+
+class EventDateSearchIndexEventHandler(AbstractEventHandler):
+    def __init__(self, event_date_search_indexer: AbstractEventDateSearchIndexer):
+        super().__init__()
+        self.event_date_search_indexer = event_date_search_indexer
+
+    def handle(self, event: events.Event, uow: AbstractUnitOfWork):
+        if isinstance(event, (events.EventCreated, events.EventUpdated)):
+            self.event_date_search_indexer.index_events([event.id])
+        elif isinstance(event, events.EventDeleted):
+            self.event_date_search_indexer.remove_events([event.id])
+        elif isinstance(event, events.EventPlaceUpdated):
+            self.event_date_search_indexer.index_events_of_event_place(event.id)
+        elif isinstance(event, events.EventOrganizerUpdated):
+            self.event_date_search_indexer.index_events_of_organizer(event.id)
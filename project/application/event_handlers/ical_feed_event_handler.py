@@ -0,0 +1,41 @@
+from project.application.read_repositories.abstract_event_read_repository import (
+    AbstractEventReadRepository,
+)
+from project.application.services.abstract_ical_feed_store import AbstractIcalFeedStore
+from project.domain import events
+from project.domain.abstract_unit_of_work import AbstractUnitOfWork
+
+from .abstract_event_handler import AbstractEventHandler
+
+
+class IcalFeedEventHandler(AbstractEventHandler):
+    def __init__(
+        self,
+        ical_feed_store: AbstractIcalFeedStore,
+        event_read_repo: AbstractEventReadRepository,
+    ):
+        super().__init__()
+        self.ical_feed_store = ical_feed_store
+        self.event_read_repo = event_read_repo
+
+    def handle(self, event: events.Event, uow: AbstractUnitOfWork):
+        admin_unit_ids = {event.admin_unit_id}
+
+        if isinstance(event, (events.EventCreated, events.EventUpdated)):
+            self.ical_feed_store.render_event_feed(event.id)
+
+            # Referenced events are listed by the referencing organizations, too.
+            admin_unit_ids.update(
+                self.event_read_repo.get_referencing_admin_unit_ids(event.id)
+            )
+        elif isinstance(event, events.EventDeleted):
+            self.ical_feed_store.remove_event_feed(event.id)
+        elif isinstance(event, events.EventOrganizerUpdated):
+            self.ical_feed_store.remove_event_feeds_of_organizer(event.id)
+        elif isinstance(event, events.EventPlaceUpdated):
+            self.ical_feed_store.remove_event_feeds_of_event_place(event.id)
+
+        # Organization feeds are large and many events change at once in
+        # batches, so they are rendered again on their next request only.
+        for admin_unit_id in sorted(admin_unit_ids):
+            self.ical_feed_store.invalidate_admin_unit_feed(admin_unit_id)
@@ -0,0 +1,36 @@
+from project.application.services.abstract_image_derivative_cache import (
+    AbstractImageDerivativeCache,
+)
+from project.domain import events
+from project.domain.abstract_unit_of_work import AbstractUnitOfWork
+
+from .abstract_event_handler import AbstractEventHandler
+
+
+class ImageDerivativeEventHandler(AbstractEventHandler):
+    def __init__(self, image_derivative_cache: AbstractImageDerivativeCache):
+        super().__init__()
+        self.image_derivative_cache = image_derivative_cache
+
+    def handle(self, event: events.Event, uow: AbstractUnitOfWork):
+        if isinstance(event, (events.EventCreated, events.EventPlaceCreated)):
+            self._render(event.photo)
+        elif isinstance(event, events.EventOrganizerCreated):
+            self._render(event.logo)
+        elif isinstance(event, (events.EventUpdated, events.EventPlaceUpdated)):
+            self._replace(event.photo)
+        elif isinstance(event, events.EventOrganizerUpdated):
+            self._replace(event.logo)
+
+    def _replace(self, changed_image):
+        if not changed_image:
+            return
+
+        if changed_image.old:
+            self.image_derivative_cache.remove_derivatives(changed_image.old.id)
+
+        self._render(changed_image.new)
+
+    def _render(self, image):
+        if image:
+            self.image_derivative_cache.render_derivatives(image.id)
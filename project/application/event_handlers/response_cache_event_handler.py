@@ -0,0 +1,36 @@
+from project.application.read_repositories.abstract_event_read_repository import (
+    AbstractEventReadRepository,
+)
+from project.application.services.abstract_response_cache import AbstractResponseCache
+from project.domain import events
+from project.domain.abstract_unit_of_work import AbstractUnitOfWork
+
+from .abstract_event_handler import AbstractEventHandler
+
+
+class ResponseCacheEventHandler(AbstractEventHandler):
+    def __init__(
+        self,
+        response_cache: AbstractResponseCache,
+        event_read_repo: AbstractEventReadRepository,
+    ):
+        super().__init__()
+        self.response_cache = response_cache
+        self.event_read_repo = event_read_repo
+
+    def handle(self, event: events.Event, uow: AbstractUnitOfWork):
+        admin_unit_ids = {event.admin_unit_id}
+
+        # Referenced events are listed by the referencing organizations, too.
+        # References of deleted events are gone already, these expire.
+        if isinstance(event, (events.EventCreated, events.EventUpdated)):
+            admin_unit_ids.update(
+                self.event_read_repo.get_referencing_admin_unit_ids(event.id)
+            )
+
+        for admin_unit_id in admin_unit_ids:
+            self.response_cache.invalidate(
+                self.response_cache.get_admin_unit_scope(admin_unit_id)
+            )
+
+        self.response_cache.invalidate(self.response_cache.global_scope)
@@ -11,4 +11,5 @@ class WebhookDeliveryCreatedAttemptEventHandler(AbstractEventHandler):
         self.webhook_delivery_service = webhook_delivery_service
 
     def handle(self, event: events.WebhookDeliveryCreated, uow: AbstractUnitOfWork):
-        self.webhook_delivery_service.send_webhook_delivery_sync(uow, event.id)
+        # Pending deliveries are sent in batches by a separate task
+        self.webhook_delivery_service.dispatch_pending_webhook_deliveries()
@@ -0,0 +1,21 @@
+from project.application.services.abstract_webhook_subscription_cache import (
+    AbstractWebhookSubscriptionCache,
+)
+from project.domain import events
+from project.domain.abstract_unit_of_work import AbstractUnitOfWork
+
+from .abstract_event_handler import AbstractEventHandler
+
+
+class WebhookSubscriptionCacheEventHandler(AbstractEventHandler):
+    def __init__(self, webhook_subscription_cache: AbstractWebhookSubscriptionCache):
+        super().__init__()
+        self.webhook_subscription_cache = webhook_subscription_cache
+
+    def handle(self, event: events.Event, uow: AbstractUnitOfWork):
+        # An app may be installed in many organizations
+        if isinstance(event, events.AppUpdated):
+            self.webhook_subscription_cache.invalidate_all()
+            return
+
+        self.webhook_subscription_cache.invalidate(event.admin_unit_id)
@@ -60,19 +60,65 @@ class MessageBus:
     ) -> commands.CommandResultType:
         return self.handle(command)
 
+    def handle_command_batch(self, command_list: list[commands.Command]) -> list:
+        # All commands share one unit of work and their domain events are
+        # dispatched together. Each command runs in a savepoint, so a failing
+        # command doesn't affect the others. Its exception is returned in
+        # place of the result.
+        results = list()
+        uow = self.create_uow()
+
+        try:
+            for command in command_list:
+                logger.debug("handling command %r", command)
+                self._set_missing_command_fields(command)
+
+                uow.begin_savepoint()
+
+                try:
+                    result = self._handle_command_in_uow(command, uow)
+                    uow.release_savepoint()
+                except Exception as e:
+                    logger.info("Exception handling command %r: %r", command, e)
+                    uow.rollback_savepoint()
+                    result = e
+
+                results.append(result)
+
+            uow.commit()
+        except Exception:
+            logger.exception("Exception handling command batch")
+            uow.rollback()
+            raise
+
+        self._dispatch_pending_events(uow)
+
+        return results
+
     def dispatch_command(self, command: commands.Command):
         self._set_missing_command_fields(command)
         self.command_dispatcher.dispatch(command)
         logger.debug(f"Dispatched {command.__class__.__name__}")
 
-    def _dispatch_event(self, event: events.Event):
-        logger.debug("dispatching event %r", event)
+    def _dispatch_events(self, pending_events: list[events.Event]):
+        valid_events = list()
+
+        for event in pending_events:
+            logger.debug("dispatching event %r", event)
+
+            try:
+                event.validate_self()
+                valid_events.append(event)
+            except Exception:  # pragma: no cover
+                logger.exception("Exception validating event %r", event)
+
+        if not valid_events:
+            return
 
         try:
-            event.validate_self()
-            self.event_dispatcher.dispatch(event)
+            self.event_dispatcher.dispatch_many(valid_events)
         except Exception:  # pragma: no cover
-            logger.exception("Exception dispatching event %r", event)
+            logger.exception("Exception dispatching events %r", valid_events)
 
     def _handle_event(self, event: events.Event):
         handlers = self.event_handler_factory(type(event))
@@ -96,12 +142,7 @@ class MessageBus:
 
         uow = self.create_uow()
         try:
-            command_type = type(command)
-            validated_command = command_type.model_validate(
-                command.model_dump(round_trip=True), strict=True
-            )
-            handler = self.command_handler_factory(command_type)
-            result = handler.handle(validated_command, uow)
+            result = self._handle_command_in_uow(command, uow)
             uow.commit()
         except Exception:
             logger.exception("Exception handling command %r", command)
@@ -112,9 +153,18 @@ class MessageBus:
 
         return result
 
+    def _handle_command_in_uow(
+        self, command: commands.Command, uow: AbstractUnitOfWork
+    ):
+        command_type = type(command)
+        validated_command = command_type.model_validate(
+            command.model_dump(round_trip=True), strict=True
+        )
+        handler = self.command_handler_factory(command_type)
+        return handler.handle(validated_command, uow)
+
     def _dispatch_pending_events(self, uow: AbstractUnitOfWork):
-        for event in uow.collect_pending_events():
-            self._dispatch_event(event)
+        self._dispatch_events(uow.collect_pending_events())
 
     def _set_missing_command_fields(self, command):
         if not hasattr(command, "actor"):
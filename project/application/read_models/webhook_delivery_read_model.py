@@ -1,3 +1,4 @@
+import datetime
 from typing import Optional
 
 from pydantic import ConfigDict
@@ -16,8 +17,11 @@ class WebhookEventReadModel(BaseReadModel):
 class WebhookReadModel(BaseReadModel):
     model_config = ConfigDict(frozen=True)
 
+    id: Optional[ObjectId] = None
     url: str
     secret: Optional[str] = None
+    consecutive_failures: int = 0
+    failing_since: Optional[datetime.datetime] = None
 
 
 class WebhookDeliveryReadModel(BaseReadModel):
@@ -27,3 +31,4 @@ class WebhookDeliveryReadModel(BaseReadModel):
     webhook_event: WebhookEventReadModel
     webhook: WebhookReadModel
     app_installation_id: Optional[ObjectId] = None
+    attempt_count: int = 0
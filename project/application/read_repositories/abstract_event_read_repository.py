@@ -1,4 +1,5 @@
 import abc
+from typing import List
 
 from project.application.read_models.event_read_model import EventReadModel
 
@@ -7,3 +8,9 @@ class AbstractEventReadRepository(abc.ABC):
     @abc.abstractmethod
     def get(self, object_id: int) -> EventReadModel:  # pragma: no cover
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_referencing_admin_unit_ids(
+        self, object_id: int
+    ) -> List[int]:  # pragma: no cover
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 import abc
+from typing import List
 
 from project.application.read_models.webhook_delivery_read_model import (
     WebhookDeliveryReadModel,
@@ -9,3 +10,9 @@ class AbstractWebhookDeliveryReadRepository(abc.ABC):
     @abc.abstractmethod
     def get(self, object_id: int) -> WebhookDeliveryReadModel:  # pragma: no cover
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_pending(
+        self, limit: int
+    ) -> List[WebhookDeliveryReadModel]:  # pragma: no cover
+        raise NotImplementedError
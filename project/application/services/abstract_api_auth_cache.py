@@ -0,0 +1,25 @@
+import abc
+
+
+class AbstractApiAuthCache(abc.ABC):
+    # Caches the column values of resolved access tokens and API keys, so that
+    # API requests with known credentials skip their lookup. The timeout is
+    # short, since processes without a shared cache only see their own
+    # invalidations.
+    timeout = 60
+
+    @abc.abstractmethod
+    def get(self, key: str) -> dict | None:  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, key: str, value: dict):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate(self, key: str):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate_all(self):  # pragma: no cover
+        raise NotImplementedError
@@ -0,0 +1,24 @@
+import abc
+from typing import Iterable
+
+
+class AbstractEventDateSearchIndexer(abc.ABC):
+    @abc.abstractmethod
+    def index_events(self, event_ids: Iterable[int]):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def index_events_of_event_place(self, event_place_id: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def index_events_of_organizer(self, organizer_id: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove_events(self, event_ids: Iterable[int]):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rebuild(self):  # pragma: no cover
+        raise NotImplementedError
@@ -0,0 +1,25 @@
+import abc
+
+
+class AbstractIcalFeedStore(abc.ABC):
+    @abc.abstractmethod
+    def invalidate_admin_unit_feed(self, admin_unit_id: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def render_event_feed(self, event_id: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove_event_feed(self, event_id: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove_event_feeds_of_organizer(self, organizer_id: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove_event_feeds_of_event_place(
+        self, event_place_id: int
+    ):  # pragma: no cover
+        raise NotImplementedError
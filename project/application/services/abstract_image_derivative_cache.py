@@ -0,0 +1,15 @@
+import abc
+
+
+class AbstractImageDerivativeCache(abc.ABC):
+    @abc.abstractmethod
+    def render_derivatives(self, image_id: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def remove_derivatives(self, image_id: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def evict(self):  # pragma: no cover
+        raise NotImplementedError
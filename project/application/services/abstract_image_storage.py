@@ -0,0 +1,24 @@
+import abc
+from typing import Iterator
+
+
+class AbstractImageStorage(abc.ABC):
+    @abc.abstractmethod
+    def get_key(self, data: bytes) -> str:  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def write(self, data: bytes) -> str:  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def read(self, key: str) -> bytes | None:  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, key: str):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def iter_keys(self, min_age: int = 0) -> Iterator[str]:  # pragma: no cover
+        raise NotImplementedError
@@ -0,0 +1,27 @@
+import abc
+
+
+class AbstractResponseCache(abc.ABC):
+    # Entries are stored under keys containing the current generation of their
+    # scope, so incrementing the generation invalidates all of them at once.
+    global_scope = "global"
+
+    @staticmethod
+    def get_admin_unit_scope(admin_unit_id: int) -> str:
+        return f"admin_unit:{admin_unit_id}"
+
+    @abc.abstractmethod
+    def get(self, key: str) -> bytes | None:  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, key: str, value: bytes, timeout: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_generation(self, scope: str) -> int:  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate(self, scope: str):  # pragma: no cover
+        raise NotImplementedError
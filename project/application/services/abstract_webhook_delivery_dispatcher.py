@@ -0,0 +1,7 @@
+import abc
+
+
+class AbstractWebhookDeliveryDispatcher(abc.ABC):
+    @abc.abstractmethod
+    def dispatch_pending(self):  # pragma: no cover
+        raise NotImplementedError
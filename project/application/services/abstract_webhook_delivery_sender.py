@@ -1,5 +1,21 @@
 import abc
-from typing import Optional
+import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from project.application.read_models.webhook_delivery_read_model import (
+    WebhookDeliveryReadModel,
+)
+
+
+class WebhookDeliveryResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    status: str
+    status_code: Optional[str] = None
+    start_at: datetime.datetime
+    end_at: datetime.datetime
 
 
 class AbstractWebhookDeliverySender(abc.ABC):
@@ -15,3 +31,9 @@ class AbstractWebhookDeliverySender(abc.ABC):
         app_installation_id: Optional[int],
     ) -> tuple[str, Optional[str]]:  # pragma: no cover
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def send_many(
+        self, webhook_deliveries: List[WebhookDeliveryReadModel]
+    ) -> List[WebhookDeliveryResult]:  # pragma: no cover
+        raise NotImplementedError
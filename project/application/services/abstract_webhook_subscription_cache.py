@@ -0,0 +1,27 @@
+import abc
+
+
+class AbstractWebhookSubscriptionCache(abc.ABC):
+    # Caches the webhook event types subscribed by the apps installed in an
+    # admin unit, so that units without subscribers skip the lookup.
+    timeout = 60 * 60
+
+    @abc.abstractmethod
+    def get_event_types(
+        self, admin_unit_id: int
+    ) -> set[str] | None:  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set_event_types(
+        self, admin_unit_id: int, event_types: set[str]
+    ):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate(self, admin_unit_id: int):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate_all(self):  # pragma: no cover
+        raise NotImplementedError
@@ -4,9 +4,13 @@ import logging
 from project.application.read_repositories.abstract_webhook_delivery_read_repository import (
     AbstractWebhookDeliveryReadRepository,
 )
+from project.application.services.abstract_webhook_delivery_dispatcher import (
+    AbstractWebhookDeliveryDispatcher,
+)
 from project.application.services.abstract_webhook_delivery_sender import (
     AbstractWebhookDeliverySender,
 )
+from project.application.services.webhook_retry_policy import WebhookRetryPolicy
 from project.domain.abstract_unit_of_work import AbstractUnitOfWork
 from project.domain.models.aggregates.webhook_delivery_attempt_aggregate import (
     WebhookDeliveryAttemptAggregate,
@@ -20,10 +24,110 @@ class WebhookDeliveryService:
         logger: logging.Logger,
         webhook_delivery_sender: AbstractWebhookDeliverySender,
         webhook_delivery_read_repo: AbstractWebhookDeliveryReadRepository,
+        webhook_delivery_dispatcher: AbstractWebhookDeliveryDispatcher,
+        retry_policy: WebhookRetryPolicy,
     ):
         self.logger = logger
         self.webhook_delivery_sender = webhook_delivery_sender
         self.webhook_delivery_read_repo = webhook_delivery_read_repo
+        self.webhook_delivery_dispatcher = webhook_delivery_dispatcher
+        self.retry_policy = retry_policy
+
+    def dispatch_pending_webhook_deliveries(self):
+        self.webhook_delivery_dispatcher.dispatch_pending()
+
+    def send_pending_webhook_deliveries(
+        self, uow: AbstractUnitOfWork, batch_size: int
+    ) -> int:
+        pending_deliveries = self.webhook_delivery_read_repo.get_pending(batch_size)
+
+        if not pending_deliveries:
+            return 0
+
+        # Webhooks whose circuit cooled down get a single probe delivery. The
+        # others stay pending until the probe succeeded.
+        webhook_deliveries = list()
+        probed_webhook_ids = set()
+
+        for webhook_delivery in pending_deliveries:
+            webhook = webhook_delivery.webhook
+
+            if self.retry_policy.is_circuit_half_open(webhook):
+                if webhook.id in probed_webhook_ids:
+                    continue
+                probed_webhook_ids.add(webhook.id)
+
+            webhook_deliveries.append(webhook_delivery)
+
+        results = self.webhook_delivery_sender.send_many(webhook_deliveries)
+
+        attempts = [
+            WebhookDeliveryAttemptAggregate.create(
+                actor=Actor(),
+                url=webhook_delivery.webhook.url,
+                status=result.status,
+                webhook_delivery_id=webhook_delivery.id,
+                status_code=result.status_code,
+                start_at=result.start_at,
+                end_at=result.end_at,
+            )
+            for webhook_delivery, result in zip(webhook_deliveries, results)
+        ]
+        uow.webhook_delivery_attempts.add_many(attempts)
+
+        self._schedule_retries(uow, webhook_deliveries, results)
+
+        return len(pending_deliveries)
+
+    def _schedule_retries(self, uow: AbstractUnitOfWork, webhook_deliveries, results):
+        # Schedule times are stored as naive UTC like the other webhook times
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        next_attempt_at_by_id = dict()
+        webhooks = dict()
+        success_counts = dict()
+        failure_counts = dict()
+
+        for webhook_delivery, result in zip(webhook_deliveries, results):
+            webhook = webhook_delivery.webhook
+            webhooks[webhook.id] = webhook
+            next_attempt_at = None
+
+            if self.retry_policy.is_success(result.status):
+                success_counts[webhook.id] = success_counts.get(webhook.id, 0) + 1
+            else:
+                failure_counts[webhook.id] = failure_counts.get(webhook.id, 0) + 1
+
+                if self.retry_policy.is_retryable(result.status_code):
+                    next_attempt_at = self.retry_policy.get_next_attempt_at(
+                        webhook_delivery.attempt_count + 1, now
+                    )
+
+            next_attempt_at_by_id[webhook_delivery.id] = next_attempt_at
+
+        uow.webhook_deliveries.schedule_next_attempts(next_attempt_at_by_id)
+
+        circuits = list()
+
+        for webhook_id, webhook in webhooks.items():
+            circuit = self.retry_policy.get_circuit(
+                webhook,
+                success_counts.get(webhook_id, 0),
+                failure_counts.get(webhook_id, 0),
+                now,
+            )
+            circuits.append(circuit)
+
+            if circuit.disabled:
+                self.logger.warning(
+                    f"Webhook {webhook_id} disabled after "
+                    f"{circuit.consecutive_failures} consecutive failures."
+                )
+            elif circuit.circuit_open_until:
+                self.logger.info(
+                    f"Webhook {webhook_id} paused until {circuit.circuit_open_until}."
+                )
+
+        uow.webhook_deliveries.update_webhook_circuits(circuits)
 
     def send_webhook_delivery_sync(
         self, uow: AbstractUnitOfWork, webhook_delivery_id: int
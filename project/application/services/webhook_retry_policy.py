@@ -0,0 +1,88 @@
+import datetime
+from typing import Callable, Optional
+
+from project.application.read_models.webhook_delivery_read_model import WebhookReadModel
+from project.domain.models.value_objects.webhook_circuit_value_object import (
+    WebhookCircuitValueObject,
+)
+
+# Deliveries are attempted at most this often, including the first attempt
+MAX_ATTEMPTS = 8
+RETRY_BASE_DELAY = datetime.timedelta(minutes=1)
+RETRY_MAX_DELAY = datetime.timedelta(hours=1)
+
+# Consecutive failed deliveries that open the circuit of a webhook
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_BASE_COOLDOWN = datetime.timedelta(minutes=1)
+CIRCUIT_MAX_COOLDOWN = datetime.timedelta(hours=1)
+
+# Webhooks that keep failing for this long are disabled
+DISABLE_AFTER = datetime.timedelta(days=1)
+
+
+class WebhookRetryPolicy:
+    def __init__(self, get_jitter: Callable[[], float]):
+        # Returns values between 0 and 1, provided by the infrastructure
+        self.get_jitter = get_jitter
+
+    def is_success(self, status: str) -> bool:
+        return status == "OK"
+
+    def is_retryable(self, status_code: Optional[str]) -> bool:
+        # Timeouts and connection errors have no status code
+        if not status_code:
+            return True
+
+        try:
+            code = int(status_code)
+        except ValueError:  # pragma: no cover
+            return True
+
+        return code >= 500 or code in (408, 429)
+
+    def get_next_attempt_at(
+        self, attempt_count: int, now: datetime.datetime
+    ) -> Optional[datetime.datetime]:
+        if attempt_count >= MAX_ATTEMPTS:
+            return None
+
+        delay = min(RETRY_BASE_DELAY * 2 ** (attempt_count - 1), RETRY_MAX_DELAY)
+
+        # Jitter spreads the retries of deliveries that failed together
+        return now + delay / 2 + delay / 2 * self.get_jitter()
+
+    def is_circuit_half_open(self, webhook: WebhookReadModel) -> bool:
+        return webhook.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD
+
+    def get_circuit(
+        self,
+        webhook: WebhookReadModel,
+        success_count: int,
+        failure_count: int,
+        now: datetime.datetime,
+    ) -> WebhookCircuitValueObject:
+        if success_count > 0:
+            return WebhookCircuitValueObject(webhook_id=webhook.id)
+
+        consecutive_failures = webhook.consecutive_failures + failure_count
+        failing_since = webhook.failing_since or now
+        circuit_open_until = None
+        disabled = False
+
+        if consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+            exponent = min(
+                (consecutive_failures - CIRCUIT_FAILURE_THRESHOLD)
+                // CIRCUIT_FAILURE_THRESHOLD,
+                16,
+            )
+            cooldown = min(CIRCUIT_BASE_COOLDOWN * 2**exponent, CIRCUIT_MAX_COOLDOWN)
+            circuit_open_until = now + cooldown
+            disabled = now - failing_since >= DISABLE_AFTER
+
+        return WebhookCircuitValueObject(
+            webhook_id=webhook.id,
+            consecutive_failures=consecutive_failures,
+            failing_since=failing_since,
+            circuit_open_until=circuit_open_until,
+            disabled=disabled,
+        )
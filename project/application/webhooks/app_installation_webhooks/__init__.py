@@ -20,6 +20,7 @@ app_installation_webhook_infos.append(
         action="updated",
         permissions=["events:read"],
         payload_cls=payloads.EventUpdatedPayload,
+        debounceable=True,
     )
 )
 app_installation_webhook_infos.append(
@@ -1,7 +1,15 @@
 class AppInstallationWebhookInfo:
-    def __init__(self, entity: str, action: str, permissions: list[str], payload_cls):
+    def __init__(
+        self,
+        entity: str,
+        action: str,
+        permissions: list[str],
+        payload_cls,
+        debounceable: bool = False,
+    ):
         self.entity = entity
         self.action = action
         self.event_type = f"{entity}.{action}"
         self.permissions = permissions
         self.payload_cls = payload_cls
+        self.debounceable = debounceable
@@ -29,3 +29,30 @@ def map_changed_list_value(
 
 def map_list_value(values: List[T], converter: Callable[[T], U]) -> List[U]:
     return [converter(v) for v in values]
+
+
+def _is_changed_value_data(value) -> bool:
+    return isinstance(value, dict) and value.keys() == {"old", "new"}
+
+
+def merge_changed_value_data(data: dict, other: dict) -> dict:
+    """Merges two dumped payloads with changed values into one.
+
+    Changed values keep the old value of ``data`` and the new value of
+    ``other``. Changes that were reverted in between are dropped.
+    """
+    result = dict(data)
+
+    for key, value in other.items():
+        previous = result.get(key)
+
+        if _is_changed_value_data(value) and _is_changed_value_data(previous):
+            value = {"old": previous["old"], "new": value["new"]}
+
+            if value["old"] == value["new"]:
+                result.pop(key)
+                continue
+
+        result[key] = value
+
+    return result
@@ -1,9 +1,19 @@
+import functools
 import importlib
 
 from flask import current_app
 
 from project.celery_init import celery, force_locale
 
+WEBHOOK_DELIVERY_BATCH_SIZE = 100
+
+
+@functools.cache
+def get_class_by_path(class_path: str) -> type:
+    module_path, class_name = class_path.rsplit(".", 1)
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
+
 
 @celery.task(
     priority=0,
@@ -21,9 +31,7 @@ def send_mail_with_body_task(recipient, subject, body, html):
 )
 def process_delayed_event(event_class_path: str, event_dict: dict):
     # Import the event class dynamically
-    module_path, class_name = event_class_path.rsplit(".", 1)
-    module = importlib.import_module(module_path)
-    event_class = getattr(module, class_name)
+    event_class = get_class_by_path(event_class_path)
 
     # Reconstruct the event using Pydantic's model_validate
     event = event_class.model_validate(event_dict)
@@ -38,25 +46,33 @@ def process_delayed_event(event_class_path: str, event_dict: dict):
     reject_on_worker_lost=True,
 )
 def process_delayed_event_v2(event_class_path: str, event_json: str):
-    module_path, class_name = event_class_path.rsplit(".", 1)
-    module = importlib.import_module(module_path)
-    event_class = getattr(module, class_name)
-
+    event_class = get_class_by_path(event_class_path)
     event = event_class.model_validate_json(event_json)
 
     message_bus = current_app.container.cqrs.message_bus()
     message_bus.handle(event)
 
 
+@celery.task(
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def process_delayed_events(serialized_events: list[tuple[str, str]]):
+    message_bus = current_app.container.cqrs.message_bus()
+
+    for event_class_path, event_json in serialized_events:
+        event_class = get_class_by_path(event_class_path)
+        event = event_class.model_validate_json(event_json)
+        message_bus.handle(event)
+
+
 @celery.task(
     acks_late=True,
     reject_on_worker_lost=True,
 )
 def process_delayed_command(command_class_path: str, command_dict: dict):
     # Import the command class dynamically
-    module_path, class_name = command_class_path.rsplit(".", 1)
-    module = importlib.import_module(module_path)
-    command_class = getattr(module, class_name)
+    command_class = get_class_by_path(command_class_path)
 
     # Reconstruct the command using Pydantic's model_validate
     command = command_class.model_validate(command_dict)
@@ -71,11 +87,32 @@ def process_delayed_command(command_class_path: str, command_dict: dict):
     reject_on_worker_lost=True,
 )
 def process_delayed_command_v2(command_class_path: str, command_json: str):
-    module_path, class_name = command_class_path.rsplit(".", 1)
-    module = importlib.import_module(module_path)
-    command_class = getattr(module, class_name)
-
+    command_class = get_class_by_path(command_class_path)
     command = command_class.model_validate_json(command_json)
 
     message_bus = current_app.container.cqrs.message_bus()
     message_bus.handle(command)
+
+
+@celery.task(
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def send_pending_webhook_deliveries_task():
+    webhook_delivery_service = current_app.container.services.webhook_delivery_service()
+
+    while True:
+        uow = current_app.container.cqrs.uow()
+
+        try:
+            count = webhook_delivery_service.send_pending_webhook_deliveries(
+                uow, WEBHOOK_DELIVERY_BATCH_SIZE
+            )
+            uow.commit()
+        except Exception:
+            current_app.logger.exception("Sending pending webhook deliveries")
+            uow.rollback()
+            raise
+
+        if count < WEBHOOK_DELIVERY_BATCH_SIZE:
+            break
@@ -1,4 +1,6 @@
-from celery import group
+import time
+
+from celery import chord, group
 from celery.schedules import crontab
 from flask import current_app
 
@@ -9,7 +11,8 @@ from project.extensions import db
 
 @celery.on_after_configure.connect
 def setup_periodic_tasks(sender, **kwargs):
-    sender.add_periodic_task(crontab(hour=0, minute=0), clear_images_task)
+    sender.add_periodic_task(crontab(minute=15), evict_images_task)
+    sender.add_periodic_task(crontab(), dispatch_pending_webhook_deliveries_task)
     sender.add_periodic_task(crontab(hour=0, minute=5), clear_admin_unit_dumps_task)
     sender.add_periodic_task(
         crontab(hour=0, minute=30), delete_admin_units_with_due_request_task
@@ -21,11 +24,21 @@ def setup_periodic_tasks(sender, **kwargs):
     sender.add_periodic_task(crontab(hour=0, minute=50), delete_old_events_task)
     sender.add_periodic_task(crontab(hour=0, minute=55), delete_old_webhook_events_task)
     sender.add_periodic_task(crontab(hour=1, minute=0), update_recurring_dates_task)
-    sender.add_periodic_task(crontab(hour=2, minute=0), dump_all_task)
+    sender.add_periodic_task(crontab(hour=2, minute=0), dump_scheduled_task)
     sender.add_periodic_task(crontab(hour=3, minute=0), seo_generate_sitemap_task)
     sender.add_periodic_task(crontab(hour=4, minute=0), generate_robots_txt_task)
 
 
+@celery.task(
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def dispatch_pending_webhook_deliveries_task():
+    # Picks up due retries and deliveries whose send task got lost
+    dispatcher = current_app.container.infrastructure.webhook_delivery_dispatcher()
+    dispatcher.dispatch_pending()
+
+
 @celery.task(
     acks_late=True,
     reject_on_worker_lost=True,
@@ -48,15 +61,40 @@ def clear_images_task():
     clear_images()
 
 
+@celery.task(
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def evict_images_task():
+    from project.services.cache import evict_images
+
+    try:
+        evict_images()
+    except Exception:
+        current_app.logger.exception("Failed evict_images_task")
+        db.session.rollback()
+        raise
+    finally:
+        db.session.close()
+
+
 @celery.task(
     acks_late=True,
     reject_on_worker_lost=True,
 )
 def update_recurring_dates_task():
-    from project.services.event import update_recurring_dates
+    from project.services.event import get_recurring_event_id_ranges
 
     try:
-        update_recurring_dates()
+        event_id_ranges = get_recurring_event_id_ranges()
+
+        if not event_id_ranges:
+            return
+
+        chord(
+            update_recurring_dates_shard_task.s(min_event_id, max_event_id)
+            for min_event_id, max_event_id in event_id_ranges
+        )(update_recurring_dates_finished_task.s())
     except Exception:
         current_app.logger.exception("Failed update_recurring_dates_task")
         db.session.rollback()
@@ -65,6 +103,51 @@ def update_recurring_dates_task():
         db.session.close()
 
 
+@celery.task(
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def update_recurring_dates_shard_task(min_event_id, max_event_id):
+    from project.services.event import update_recurring_dates
+
+    try:
+        start = time.perf_counter()
+        result = update_recurring_dates(min_event_id, max_event_id)
+        result["min_event_id"] = min_event_id
+        result["max_event_id"] = max_event_id
+        result["duration"] = time.perf_counter() - start
+        return result
+    except Exception:
+        current_app.logger.exception(
+            f"Failed update_recurring_dates_shard_task {min_event_id}-{max_event_id}"
+        )
+        db.session.rollback()
+        raise
+    finally:
+        db.session.close()
+
+
+@celery.task(
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def update_recurring_dates_finished_task(results):
+    for result in results:
+        current_app.logger.info(
+            f"Shard {result['min_event_id']}-{result['max_event_id']}:"
+            f" {result['events']} event(s), {result['added']} date(s) added,"
+            f" {result['removed']} date(s) removed in {result['duration']:.1f}s."
+        )
+
+    current_app.logger.info(
+        f"{sum(result['events'] for result in results)} event(s) were updated"
+        f" in {len(results)} shard(s)"
+        f" ({sum(result['added'] for result in results)} date(s) added,"
+        f" {sum(result['removed'] for result in results)} date(s) removed,"
+        f" {max(result['duration'] for result in results):.1f}s longest shard)."
+    )
+
+
 @celery.task(
     acks_late=True,
     reject_on_worker_lost=True,
@@ -82,6 +165,23 @@ def dump_all_task():
         db.session.close()
 
 
+@celery.task(
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def dump_scheduled_task():
+    from project.services.dump import dump_scheduled
+
+    try:
+        dump_scheduled()
+    except Exception:
+        current_app.logger.exception("Failed dump_scheduled_task")
+        db.session.rollback()
+        raise
+    finally:
+        db.session.close()
+
+
 @celery.task(
     acks_late=True,
     reject_on_worker_lost=True,
@@ -204,15 +304,10 @@ def delete_ghost_users_task():
     reject_on_worker_lost=True,
 )
 def delete_old_events_task():
-    from project.services.event import get_old_events
+    from project.services.event import purge_old_events
 
     try:
-        events = get_old_events()
-
-        if not events:
-            return
-
-        group(delete_event_task.s(event.id) for event in events).delay()
+        purge_old_events()
     except Exception:
         current_app.logger.exception("Failed delete_old_events_task")
         db.session.rollback()
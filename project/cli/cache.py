@@ -10,3 +10,9 @@ cache_cli = AppGroup("cache")
 @click_logging
 def clear_images():
     cache.clear_images()
+
+
+@cache_cli.command("evict-images")
+@click_logging
+def evict_images():
+    cache.evict_images()
@@ -13,6 +13,18 @@ def dump_all():
     dump.dump_all()
 
 
+@dump_cli.command("delta")
+@click_logging
+def dump_delta():
+    dump.dump_delta()
+
+
+@dump_cli.command("scheduled")
+@click_logging
+def dump_scheduled():
+    dump.dump_scheduled()
+
+
 @dump_cli.command("organization")
 @click.argument("admin_unit_id")
 @click_logging
@@ -13,6 +13,27 @@ def update_recurring_dates():
     event.update_recurring_dates()
 
 
+@event_cli.command("rebuild-search-index")
+@click_logging
+def rebuild_event_date_search_index():
+    event.rebuild_event_date_search_index()
+
+
+@event_cli.command("backfill-summaries")
+@click.option("--batch-size", type=int, default=event.EVENT_SUMMARIES_BATCH_SIZE)
+@click_logging
+def backfill_event_summaries(batch_size):
+    event.backfill_event_summaries(batch_size=batch_size)
+
+
+@event_cli.command("purge-old")
+@click.option("--dry-run", is_flag=True)
+@click.option("--batch-size", type=int, default=event.OLD_EVENTS_PURGE_BATCH_SIZE)
+@click_logging
+def purge_old_events(dry_run, batch_size):
+    event.purge_old_events(batch_size=batch_size, dry_run=dry_run)
+
+
 @event_cli.command("create-bulk-references")
 @click.argument("admin_unit_id")
 @click.argument("postal_codes", nargs=-1)
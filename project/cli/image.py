@@ -0,0 +1,20 @@
+import click
+from flask.cli import AppGroup
+
+from project.cli import click_logging
+from project.services import image
+
+image_cli = AppGroup("image")
+
+
+@image_cli.command("migrate-storage")
+@click.option("--batch-size", type=int, default=image.IMAGE_STORAGE_BATCH_SIZE)
+@click_logging
+def migrate_storage(batch_size):
+    image.migrate_images_to_storage(batch_size)
+
+
+@image_cli.command("clean-storage")
+@click_logging
+def clean_storage():
+    image.remove_orphaned_stored_images()
@@ -1,15 +1,18 @@
 """Dependency Injection Container for EventCally application."""
 
+import random
+
 from dependency_injector import containers, providers
 from flask import current_app
 
-from project import repos, services
+from project import ical_path, image_storage_path, img_path, repos, services
 from project.application import command_handlers, commands, event_handlers
 from project.application.message_bus import MessageBus
 from project.application.services.organization_application_service import (
     OrganizationApplicationService,
 )
 from project.application.services.webhook_delivery_service import WebhookDeliveryService
+from project.application.services.webhook_retry_policy import WebhookRetryPolicy
 from project.application.webhooks.webhook_mapper_context import WebhookMapperContext
 from project.context import ContextProvider
 from project.domain import events
@@ -26,6 +29,14 @@ from project.infrastructure.read_repositories.sql_alchemy_webhook_delivery_read_
 )
 from project.infrastructure.services.app_context_provider import AppContextProvider
 from project.infrastructure.services.celery_email_service import CeleryEmailService
+from project.infrastructure.services.celery_webhook_delivery_dispatcher import (
+    CeleryWebhookDeliveryDispatcher,
+)
+from project.infrastructure.services.file_ical_feed_store import FileIcalFeedStore
+from project.infrastructure.services.file_image_derivative_cache import (
+    FileImageDerivativeCache,
+)
+from project.infrastructure.services.file_image_storage import FileImageStorage
 from project.infrastructure.services.flask_babel_localization_service import (
     FlaskBabelLocalizationService,
 )
@@ -33,9 +44,26 @@ from project.infrastructure.services.flask_template_render_service import (
     FlaskTemplateRenderService,
 )
 from project.infrastructure.services.flask_url_provider import FlaskUrlProvider
+from project.infrastructure.services.in_memory_api_auth_cache import (
+    InMemoryApiAuthCache,
+)
+from project.infrastructure.services.in_memory_response_cache import (
+    InMemoryResponseCache,
+)
+from project.infrastructure.services.in_memory_webhook_subscription_cache import (
+    InMemoryWebhookSubscriptionCache,
+)
+from project.infrastructure.services.redis_api_auth_cache import RedisApiAuthCache
+from project.infrastructure.services.redis_response_cache import RedisResponseCache
+from project.infrastructure.services.redis_webhook_subscription_cache import (
+    RedisWebhookSubscriptionCache,
+)
 from project.infrastructure.services.requests_webhook_delivery_sender import (
     RequestsWebhookDeliverySender,
 )
+from project.infrastructure.services.sql_alchemy_event_date_search_indexer import (
+    SqlAlchemyEventDateSearchIndexer,
+)
 from project.infrastructure.sql_alchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 
@@ -43,6 +71,16 @@ def get_app_logger():  # pragma: no cover
     return current_app.logger
 
 
+def create_cache(redis_cache_class, in_memory_cache_class):
+    redis_url = current_app.config.get("REDIS_URL")
+
+    # Each test recreates the database, so shared entries would outlive it
+    if redis_url and not current_app.config.get("TESTING"):
+        return redis_cache_class(redis_url)
+
+    return in_memory_cache_class()
+
+
 class Infrastructure(containers.DeclarativeContainer):
     db = providers.Object(db)  # SQLAlchemy database instance
     session_factory = providers.Callable(lambda: db.session)
@@ -60,6 +98,36 @@ class Infrastructure(containers.DeclarativeContainer):
         RequestsWebhookDeliverySender,
         logger=logger,
     )
+    webhook_delivery_dispatcher = providers.Singleton(
+        CeleryWebhookDeliveryDispatcher,
+    )
+    event_date_search_indexer = providers.Factory(
+        SqlAlchemyEventDateSearchIndexer,
+        session=session_factory,
+    )
+    image_storage = providers.Singleton(
+        FileImageStorage,
+        path=image_storage_path,
+    )
+    image_derivative_cache = providers.Factory(
+        FileImageDerivativeCache,
+        session=session_factory,
+        path=img_path,
+    )
+    ical_feed_store = providers.Factory(
+        FileIcalFeedStore,
+        session=session_factory,
+        path=ical_path,
+    )
+    response_cache = providers.Singleton(
+        create_cache, RedisResponseCache, InMemoryResponseCache
+    )
+    webhook_subscription_cache = providers.Singleton(
+        create_cache, RedisWebhookSubscriptionCache, InMemoryWebhookSubscriptionCache
+    )
+    api_auth_cache = providers.Singleton(
+        create_cache, RedisApiAuthCache, InMemoryApiAuthCache
+    )
 
 
 class Context(containers.DeclarativeContainer):
@@ -236,11 +304,17 @@ class Services(containers.DeclarativeContainer):
         localization_service=infrastructure.localization_service,
         template_render_service=infrastructure.template_render_service,
     )
+    webhook_retry_policy = providers.Factory(
+        WebhookRetryPolicy,
+        get_jitter=providers.Object(random.random),
+    )
     webhook_delivery_service = providers.Factory(
         WebhookDeliveryService,
         logger=infrastructure.logger,
         webhook_delivery_sender=infrastructure.webhook_delivery_sender,
         webhook_delivery_read_repo=read_repos.webhook_delivery_read_repo,
+        webhook_delivery_dispatcher=infrastructure.webhook_delivery_dispatcher,
+        retry_policy=webhook_retry_policy,
     )
     organization_application_service = providers.Factory(
         OrganizationApplicationService,
@@ -517,59 +591,162 @@ class Cqrs(containers.DeclarativeContainer):
                     providers.Factory(
                         event_handlers.AppInstallationWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.EventDateSearchIndexEventHandler,
+                        event_date_search_indexer=infrastructure.event_date_search_indexer,
+                    ),
+                    providers.Factory(
+                        event_handlers.ImageDerivativeEventHandler,
+                        image_derivative_cache=infrastructure.image_derivative_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.ResponseCacheEventHandler,
+                        response_cache=infrastructure.response_cache,
+                        event_read_repo=read_repos.event_read_repo,
+                    ),
+                    providers.Factory(
+                        event_handlers.IcalFeedEventHandler,
+                        ical_feed_store=infrastructure.ical_feed_store,
+                        event_read_repo=read_repos.event_read_repo,
                     ),
                 ),
                 events.EventUpdated: providers.List(
                     providers.Factory(
                         event_handlers.AppInstallationWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.EventDateSearchIndexEventHandler,
+                        event_date_search_indexer=infrastructure.event_date_search_indexer,
                     ),
                     providers.Factory(
                         event_handlers.ReferenceEventChangedEmailEventHandler,
                         organization_service=services.organization_application_service,
                         event_read_repo=read_repos.event_read_repo,
                     ),
+                    providers.Factory(
+                        event_handlers.ImageDerivativeEventHandler,
+                        image_derivative_cache=infrastructure.image_derivative_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.ResponseCacheEventHandler,
+                        response_cache=infrastructure.response_cache,
+                        event_read_repo=read_repos.event_read_repo,
+                    ),
+                    providers.Factory(
+                        event_handlers.IcalFeedEventHandler,
+                        ical_feed_store=infrastructure.ical_feed_store,
+                        event_read_repo=read_repos.event_read_repo,
+                    ),
                 ),
                 events.EventDeleted: providers.List(
                     providers.Factory(
                         event_handlers.AppInstallationWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.EventDateSearchIndexEventHandler,
+                        event_date_search_indexer=infrastructure.event_date_search_indexer,
+                    ),
+                    providers.Factory(
+                        event_handlers.ResponseCacheEventHandler,
+                        response_cache=infrastructure.response_cache,
+                        event_read_repo=read_repos.event_read_repo,
+                    ),
+                    providers.Factory(
+                        event_handlers.IcalFeedEventHandler,
+                        ical_feed_store=infrastructure.ical_feed_store,
+                        event_read_repo=read_repos.event_read_repo,
                     ),
                 ),
                 events.EventOrganizerCreated: providers.List(
                     providers.Factory(
                         event_handlers.AppInstallationWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.ImageDerivativeEventHandler,
+                        image_derivative_cache=infrastructure.image_derivative_cache,
                     ),
                 ),
                 events.EventOrganizerUpdated: providers.List(
                     providers.Factory(
                         event_handlers.AppInstallationWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.EventDateSearchIndexEventHandler,
+                        event_date_search_indexer=infrastructure.event_date_search_indexer,
+                    ),
+                    providers.Factory(
+                        event_handlers.ImageDerivativeEventHandler,
+                        image_derivative_cache=infrastructure.image_derivative_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.ResponseCacheEventHandler,
+                        response_cache=infrastructure.response_cache,
+                        event_read_repo=read_repos.event_read_repo,
+                    ),
+                    providers.Factory(
+                        event_handlers.IcalFeedEventHandler,
+                        ical_feed_store=infrastructure.ical_feed_store,
+                        event_read_repo=read_repos.event_read_repo,
                     ),
                 ),
                 events.EventOrganizerDeleted: providers.List(
                     providers.Factory(
                         event_handlers.AppInstallationWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
                     ),
                 ),
                 events.EventPlaceCreated: providers.List(
                     providers.Factory(
                         event_handlers.AppInstallationWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.ImageDerivativeEventHandler,
+                        image_derivative_cache=infrastructure.image_derivative_cache,
                     ),
                 ),
                 events.EventPlaceUpdated: providers.List(
                     providers.Factory(
                         event_handlers.AppInstallationWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.EventDateSearchIndexEventHandler,
+                        event_date_search_indexer=infrastructure.event_date_search_indexer,
+                    ),
+                    providers.Factory(
+                        event_handlers.ImageDerivativeEventHandler,
+                        image_derivative_cache=infrastructure.image_derivative_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.ResponseCacheEventHandler,
+                        response_cache=infrastructure.response_cache,
+                        event_read_repo=read_repos.event_read_repo,
+                    ),
+                    providers.Factory(
+                        event_handlers.IcalFeedEventHandler,
+                        ical_feed_store=infrastructure.ical_feed_store,
+                        event_read_repo=read_repos.event_read_repo,
                     ),
                 ),
                 events.EventPlaceDeleted: providers.List(
                     providers.Factory(
                         event_handlers.AppInstallationWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
                     ),
                 ),
                 events.AppInstallationCreated: providers.List(
@@ -577,18 +754,44 @@ class Cqrs(containers.DeclarativeContainer):
                         event_handlers.AppWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
                     ),
+                    providers.Factory(
+                        event_handlers.WebhookSubscriptionCacheEventHandler,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
                 ),
                 events.AppInstallationPermissionsUpdated: providers.List(
                     providers.Factory(
                         event_handlers.AppWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
                     ),
+                    providers.Factory(
+                        event_handlers.WebhookSubscriptionCacheEventHandler,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.ApiAuthCacheEventHandler,
+                        api_auth_cache=infrastructure.api_auth_cache,
+                    ),
                 ),
                 events.AppInstallationDeleted: providers.List(
                     providers.Factory(
                         event_handlers.AppWebhookEventHandler,
                         mapper_context=webhook_mapper_context,
                     ),
+                    providers.Factory(
+                        event_handlers.WebhookSubscriptionCacheEventHandler,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
+                    providers.Factory(
+                        event_handlers.ApiAuthCacheEventHandler,
+                        api_auth_cache=infrastructure.api_auth_cache,
+                    ),
+                ),
+                events.AppUpdated: providers.List(
+                    providers.Factory(
+                        event_handlers.WebhookSubscriptionCacheEventHandler,
+                        webhook_subscription_cache=infrastructure.webhook_subscription_cache,
+                    ),
                 ),
                 events.OrganizationDeletionRequested: providers.List(
                     providers.Factory(
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from typing import Iterable, Iterator
 
 import icalendar
 import pytz
@@ -256,3 +257,23 @@ def create_icalendar() -> icalendar.Calendar:
     cal.add_component(tzc)
 
     return cal
+
+
+ICALENDAR_END = b"END:VCALENDAR\r\n"
+
+
+def stream_icalendar(
+    ical_events: Iterable[icalendar.Event], calendar_name: str | None = None
+) -> Iterator[bytes]:
+    # Yields the calendar in chunks, so that large feeds are never built in memory
+    cal = create_icalendar()
+
+    if calendar_name:
+        cal.add("x-wr-calname", calendar_name)
+
+    yield cal.to_ical()[: -len(ICALENDAR_END)]
+
+    for ical_event in ical_events:
+        yield ical_event.to_ical()
+
+    yield ICALENDAR_END
@@ -56,31 +56,55 @@ class AbstractUnitOfWork(abc.ABC):
         self.pending_events.clear()
         return result
 
+    def begin_savepoint(self):
+        self._begin_nested()
+
+    def release_savepoint(self):
+        self._release_nested()
+        self._collect_domain_events()
+
+    def rollback_savepoint(self):
+        # Changes and domain events since the savepoint are discarded, while
+        # the rest of the unit of work is kept.
+        self._rollback_nested()
+        self._discard_domain_events()
+
     def get_first_pending_event_by_type(self, event_type: type) -> Event | None:
         for event in self.pending_events:
             if isinstance(event, event_type):
                 return event
         return None  # pragma: no cover
 
+    def _get_repos(self) -> list:
+        return [
+            self.events,
+            self.event_organizers,
+            self.event_references,
+            self.event_places,
+            self.organizations,
+            self.webhook_events,
+            self.apps,
+            self.organization_app_installations,
+            self.organization_members,
+            self.webhook_deliveries,
+            self.webhook_delivery_attempts,
+            self.users,
+        ]
+
     def _collect_domain_events(self):
-        self._collect_domain_events_from_repo(self.events)
-        self._collect_domain_events_from_repo(self.event_organizers)
-        self._collect_domain_events_from_repo(self.event_references)
-        self._collect_domain_events_from_repo(self.event_places)
-        self._collect_domain_events_from_repo(self.organizations)
-        self._collect_domain_events_from_repo(self.webhook_events)
-        self._collect_domain_events_from_repo(self.apps)
-        self._collect_domain_events_from_repo(self.organization_app_installations)
-        self._collect_domain_events_from_repo(self.organization_members)
-        self._collect_domain_events_from_repo(self.webhook_deliveries)
-        self._collect_domain_events_from_repo(self.webhook_delivery_attempts)
-        self._collect_domain_events_from_repo(self.users)
+        for repo in self._get_repos():
+            self._collect_domain_events_from_repo(repo)
 
     def _collect_domain_events_from_repo(self, repo):
         for model in repo.seen:
             self.pending_events.extend(model.domain_events)
             model.domain_events.clear()
 
+    def _discard_domain_events(self):
+        for repo in self._get_repos():
+            for model in repo.seen:
+                model.domain_events.clear()
+
     @abc.abstractmethod
     def _commit(self):  # pragma: no cover
         raise NotImplementedError
@@ -88,3 +112,15 @@ class AbstractUnitOfWork(abc.ABC):
     @abc.abstractmethod
     def rollback(self):  # pragma: no cover
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def _begin_nested(self):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _release_nested(self):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _rollback_nested(self):  # pragma: no cover
+        raise NotImplementedError
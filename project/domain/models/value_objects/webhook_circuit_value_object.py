@@ -0,0 +1,13 @@
+import datetime
+from typing import Optional
+
+from project.domain.types.custom_base_model import CustomBaseModel
+from project.domain.types.object_id import ObjectId
+
+
+class WebhookCircuitValueObject(CustomBaseModel):
+    webhook_id: ObjectId
+    consecutive_failures: int = 0
+    failing_since: Optional[datetime.datetime] = None
+    circuit_open_until: Optional[datetime.datetime] = None
+    disabled: bool = False
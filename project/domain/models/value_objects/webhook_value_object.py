@@ -8,6 +8,7 @@ class WebhookValueObject(CustomBaseModel):
     secret: Optional[str] = None
     disabled: bool = False
     event_types: set[str] = set()
+    debounce_seconds: Optional[int] = None
 
     def is_enabled_for_event_type(self, event_type: str) -> bool:
         return (
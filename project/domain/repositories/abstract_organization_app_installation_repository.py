@@ -39,6 +39,9 @@ class AbstractOrganizationAppInstallationRepository(abc.ABC):
             if all(p in (i.permissions or []) for p in permissions)
         ]
 
+    def get_webhook_event_types(self, admin_unit_id: ObjectId) -> set[str]:
+        return self._get_webhook_event_types(admin_unit_id)
+
     @abc.abstractmethod
     def _add(self, app: OrganisationAppInstallationAggregate):  # pragma: no cover
         raise NotImplementedError
@@ -62,3 +65,9 @@ class AbstractOrganizationAppInstallationRepository(abc.ABC):
         self, admin_unit_id: ObjectId, event_type: str
     ) -> list[OrganisationAppInstallationAggregate]:  # pragma: no cover
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def _get_webhook_event_types(
+        self, admin_unit_id: ObjectId
+    ) -> set[str]:  # pragma: no cover
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 import abc
+from typing import List
 
 from project.domain.models.aggregates.webhook_delivery_attempt_aggregate import (
     WebhookDeliveryAttemptAggregate,
@@ -13,6 +14,10 @@ class AbstractWebhookDeliveryAttemptRepository(abc.ABC):
         self._add(event)
         self.seen.add(event)
 
+    def add_many(self, attempts: List[WebhookDeliveryAttemptAggregate]):
+        self._add_many(attempts)
+        self.seen.update(attempts)
+
     def get(self, object_id: int) -> WebhookDeliveryAttemptAggregate:
         attempt = self._get(object_id)
         if attempt:
@@ -23,6 +28,12 @@ class AbstractWebhookDeliveryAttemptRepository(abc.ABC):
     def _add(self, event: WebhookDeliveryAttemptAggregate):  # pragma: no cover
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _add_many(
+        self, attempts: List[WebhookDeliveryAttemptAggregate]
+    ):  # pragma: no cover
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _get(
         self, object_id: int
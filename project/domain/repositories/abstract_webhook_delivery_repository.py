@@ -1,8 +1,14 @@
 import abc
+import datetime
+from typing import Dict, List, Optional
 
 from project.domain.models.aggregates.webhook_delivery_aggregate import (
     WebhookDeliveryAggregate,
 )
+from project.domain.models.value_objects.webhook_circuit_value_object import (
+    WebhookCircuitValueObject,
+)
+from project.domain.types.object_id import ObjectId
 
 
 class AbstractWebhookDeliveryRepository(abc.ABC):
@@ -19,6 +25,24 @@ class AbstractWebhookDeliveryRepository(abc.ABC):
             self.seen.add(delivery)
         return delivery
 
+    def get_debounced(
+        self, app_installation_id: ObjectId, event_type: str, object_id: ObjectId
+    ) -> Optional[WebhookDeliveryAggregate]:
+        delivery = self._get_debounced(app_installation_id, event_type, object_id)
+        if delivery:
+            self.seen.add(delivery)
+        return delivery
+
+    def schedule_next_attempts(
+        self, next_attempt_at_by_id: Dict[ObjectId, Optional[datetime.datetime]]
+    ):
+        if next_attempt_at_by_id:
+            self._schedule_next_attempts(next_attempt_at_by_id)
+
+    def update_webhook_circuits(self, circuits: List[WebhookCircuitValueObject]):
+        if circuits:
+            self._update_webhook_circuits(circuits)
+
     @abc.abstractmethod
     def _add(self, event: WebhookDeliveryAggregate):  # pragma: no cover
         raise NotImplementedError
@@ -26,3 +50,21 @@ class AbstractWebhookDeliveryRepository(abc.ABC):
     @abc.abstractmethod
     def _get(self, object_id: int) -> WebhookDeliveryAggregate:  # pragma: no cover
         raise NotImplementedError
+
+    @abc.abstractmethod
+    def _get_debounced(
+        self, app_installation_id: ObjectId, event_type: str, object_id: ObjectId
+    ) -> Optional[WebhookDeliveryAggregate]:  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _schedule_next_attempts(
+        self, next_attempt_at_by_id: Dict[ObjectId, Optional[datetime.datetime]]
+    ):  # pragma: no cover
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _update_webhook_circuits(
+        self, circuits: List[WebhookCircuitValueObject]
+    ):  # pragma: no cover
+        raise NotImplementedError
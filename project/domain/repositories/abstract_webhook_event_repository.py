@@ -13,6 +13,10 @@ class AbstractWebhookEventRepository(abc.ABC):
         self._add(event)
         self.seen.add(event)
 
+    def update(self, event: WebhookEventAggregate):
+        self._update(event)
+        self.seen.add(event)
+
     def get(self, object_id: int) -> WebhookEventAggregate:
         event = self._get(object_id)
         if event:
@@ -26,6 +30,10 @@ class AbstractWebhookEventRepository(abc.ABC):
     def _add(self, event: WebhookEventAggregate):  # pragma: no cover
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def _update(self, event: WebhookEventAggregate):  # pragma: no cover
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _get(self, object_id: int) -> WebhookEventAggregate:  # pragma: no cover
         raise NotImplementedError
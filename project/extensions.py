@@ -13,7 +13,7 @@ from flask_migrate import Migrate
 from flask_security import Security
 from flask_sqlalchemy import SQLAlchemy
 from flask_wtf.csrf import CSRFProtect
-from sqlalchemy import MetaData
+from sqlalchemy import DDL, MetaData, event
 
 from project.base_model import CustomModel
 
@@ -27,6 +27,9 @@ convention = {
 }
 metadata = MetaData(naming_convention=convention)
 
+# Trigram indexes require pg_trgm to exist before the tables are created
+event.listen(metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
 # Extension instances (not bound to app yet)
 # Note: Flask-Gzip doesn't support init_app pattern, so it's created directly in create_app()
 babel = Babel()
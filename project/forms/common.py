@@ -1,8 +1,15 @@
 from flask import url_for
 from flask_babel import gettext, lazy_gettext
 from markupsafe import Markup
-from wtforms import BooleanField, DecimalField, HiddenField, SelectField, StringField
-from wtforms.validators import DataRequired, Length, Optional
+from wtforms import (
+    BooleanField,
+    DecimalField,
+    HiddenField,
+    IntegerField,
+    SelectField,
+    StringField,
+)
+from wtforms.validators import DataRequired, Length, NumberRange, Optional
 
 from project.domain.models.value_objects.image_value_object import ImageValueObject
 from project.domain.models.value_objects.location_value_object import (
@@ -125,11 +132,12 @@ class Base64ImageForm(BaseForm):
         self._original_image_data = None
         self._original_encoding_format = None
 
-        if obj and obj.data:
+        if obj and not obj.is_empty():
+            original_image_data = obj.get_data()
             self._original_base64 = get_data_uri_from_bytes(
-                obj.data, obj.encoding_format
+                original_image_data, obj.encoding_format
             )
-            self._original_image_data = obj.data
+            self._original_image_data = original_image_data
             self._original_encoding_format = obj.encoding_format
 
             if self.image_base64.data is None:
@@ -213,6 +221,13 @@ class WebhookForm(BaseForm):
         validators=[Optional()],
         render_kw={"ri": "multicheckbox"},
     )
+    debounce_seconds = IntegerField(
+        lazy_gettext("Debounce window (seconds)"),
+        description=lazy_gettext(
+            "Consecutive event updates within this window are merged into one delivery."
+        ),
+        validators=[Optional(), NumberRange(min=0, max=3600)],
+    )
 
     def create_create_command(self):
         if not self.url.data:
@@ -223,6 +238,7 @@ class WebhookForm(BaseForm):
             secret=self.secret.data,
             disabled=self.disabled.data,
             event_types=self.event_types.data,
+            debounce_seconds=self.debounce_seconds.data,
         )
 
     def create_update_command(self):
@@ -234,6 +250,7 @@ class WebhookForm(BaseForm):
             secret=self.secret.data,
             disabled=self.disabled.data,
             event_types=self.event_types.data,
+            debounce_seconds=self.debounce_seconds.data,
         )
 
 
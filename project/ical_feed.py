@@ -0,0 +1,31 @@
+from flask import Response, current_app, request, send_file
+
+from project.infrastructure.services.file_ical_feed_store import FileIcalFeedStore
+
+
+def get_ical_feed_store() -> FileIcalFeedStore:
+    return current_app.container.infrastructure.ical_feed_store()
+
+
+def is_ical_feed_servable() -> bool:
+    # Feed files contain the unfiltered public feed only
+    return (
+        current_app.config["ICAL_FEED_MAX_AGE"] > 0
+        and request.method == "GET"
+        and not request.args
+    )
+
+
+def send_ical_feed(file_path: str, download_name: str) -> Response:
+    # Conditional requests are answered from the file stats and the cached
+    # content hash, without touching the database.
+    response = send_file(
+        file_path,
+        mimetype="text/calendar",
+        as_attachment=True,
+        download_name=download_name,
+        etag=get_ical_feed_store().get_etag(file_path),
+        conditional=True,
+    )
+    response.cache_control.public = True
+    return response
@@ -1,11 +1,32 @@
+from typing import List
+
 from project.application.abstract_event_dispatcher import AbstractEventDispatcher
 from project.domain import events
 
+# Events per task, so that a lost worker redelivers a bounded number of events
+EVENT_BATCH_SIZE = 100
+
 
 class CeleryEventDispatcher(AbstractEventDispatcher):
     def dispatch(self, event: events.Event):
         from project.base_tasks import process_delayed_event_v2
 
+        process_delayed_event_v2.delay(*self._serialize(event))
+
+    def dispatch_many(self, pending_events: List[events.Event]):
+        from project.base_tasks import process_delayed_events
+
+        if len(pending_events) == 1:
+            self.dispatch(pending_events[0])
+            return
+
+        # Events of one unit of work are sent as one task to save broker round
+        # trips. The task handles them in order.
+        for i in range(0, len(pending_events), EVENT_BATCH_SIZE):
+            batch = pending_events[i : i + EVENT_BATCH_SIZE]
+            process_delayed_events.delay([self._serialize(event) for event in batch])
+
+    def _serialize(self, event: events.Event) -> tuple[str, str]:
         event_class_path = f"{event.__class__.__module__}.{event.__class__.__name__}"
         event_json = event.model_dump_json(exclude_unset=True)
-        process_delayed_event_v2.delay(event_class_path, event_json)
+        return event_class_path, event_json
@@ -1,10 +1,13 @@
-from typing import Optional
+from typing import List, Optional
+
+from sqlalchemy import select
 
 from project.application.read_models.event_read_model import EventReadModel
 from project.application.read_repositories.abstract_event_read_repository import (
     AbstractEventReadRepository,
 )
 from project.models.event import Event
+from project.models.event_reference import EventReference
 
 
 class SqlAlchemyEventReadRepository(AbstractEventReadRepository):
@@ -18,3 +21,12 @@ class SqlAlchemyEventReadRepository(AbstractEventReadRepository):
     def get(self, object_id: int) -> Optional[EventReadModel]:
         model = self._get_model(object_id)
         return Event.to_read_model(model)
+
+    def get_referencing_admin_unit_ids(self, object_id: int) -> List[int]:
+        return list(
+            self.session.scalars(
+                select(EventReference.admin_unit_id).where(
+                    EventReference.event_id == object_id
+                )
+            )
+        )
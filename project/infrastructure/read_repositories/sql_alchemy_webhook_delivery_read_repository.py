@@ -1,4 +1,8 @@
-from typing import Optional
+import datetime
+from typing import List, Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import selectinload
 
 from project.application.read_models.webhook_delivery_read_model import (
     WebhookDeliveryReadModel,
@@ -6,7 +10,13 @@ from project.application.read_models.webhook_delivery_read_model import (
 from project.application.read_repositories.abstract_webhook_delivery_read_repository import (
     AbstractWebhookDeliveryReadRepository,
 )
+from project.models.webhook import Webhook
 from project.models.webhook_delivery import WebhookDelivery
+from project.models.webhook_delivery_attempt import WebhookDeliveryAttempt
+from project.models.webhook_event import WebhookEvent
+
+# Deliveries that were not attempted within this period are not sent anymore
+PENDING_MAX_AGE = datetime.timedelta(days=1)
 
 
 class SqlAlchemyWebhookDeliveryReadRepository(AbstractWebhookDeliveryReadRepository):
@@ -20,3 +30,53 @@ class SqlAlchemyWebhookDeliveryReadRepository(AbstractWebhookDeliveryReadReposit
     def get(self, object_id: int) -> Optional[WebhookDeliveryReadModel]:
         model = self._get_model(object_id)
         return WebhookDelivery.to_read_model(model)
+
+    def get_pending(self, limit: int) -> List[WebhookDeliveryReadModel]:
+        # Webhook times are stored as naive UTC
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        first_attempt = and_(
+            WebhookDelivery.next_attempt_at.is_(None),
+            WebhookEvent.timestamp >= now - PENDING_MAX_AGE,
+            ~WebhookDelivery.attempts.any(),
+        )
+        retry = WebhookDelivery.next_attempt_at <= now
+
+        # The deliveries stay locked until the transaction ends, so that
+        # concurrent workers skip them and pick the next batch.
+        models = (
+            self.session.query(WebhookDelivery)
+            .join(WebhookDelivery.webhook_event)
+            .join(WebhookDelivery.webhook)
+            .filter(
+                or_(first_attempt, retry),
+                Webhook.disabled.isnot(True),
+                or_(
+                    Webhook.circuit_open_until.is_(None),
+                    Webhook.circuit_open_until <= now,
+                ),
+            )
+            .options(
+                selectinload(WebhookDelivery.webhook_event),
+                selectinload(WebhookDelivery.webhook),
+            )
+            .order_by(WebhookDelivery.id)
+            .limit(limit)
+            .with_for_update(of=WebhookDelivery, skip_locked=True)
+            .all()
+        )
+
+        delivery_ids = [model.id for model in models]
+        attempt_counts = dict(
+            self.session.query(
+                WebhookDeliveryAttempt.webhook_delivery_id,
+                func.count(WebhookDeliveryAttempt.id),
+            )
+            .filter(WebhookDeliveryAttempt.webhook_delivery_id.in_(delivery_ids))
+            .group_by(WebhookDeliveryAttempt.webhook_delivery_id)
+            .all()
+        )
+
+        return [
+            WebhookDelivery.to_read_model(model, attempt_counts.get(model.id, 0))
+            for model in models
+        ]
@@ -61,6 +61,20 @@ class SqlAlchemyOrganizationAppInstallationRepository(
         )
         return [AppInstallation.to_aggregate(m) for m in models]
 
+    def _get_webhook_event_types(self, admin_unit_id: int) -> set[str]:
+        rows = (
+            self.session.query(Webhook.event_types)
+            .select_from(AppInstallation)
+            .join(AppInstallation.oauth2_client)
+            .join(OAuth2Client.webhook)
+            .filter(OAuth2Client.is_app)
+            .filter(AppInstallation.admin_unit_id == admin_unit_id)
+            .filter(Webhook.url.isnot(None))
+            .filter(Webhook.disabled.isnot(True))
+            .all()
+        )
+        return {event_type for (event_types,) in rows for event_type in event_types}
+
     def _remove(self, app: OrganisationAppInstallationAggregate):
         model = self._get_model(app.id)
         self.session.delete(model)
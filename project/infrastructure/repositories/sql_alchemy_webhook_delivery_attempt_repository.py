@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from project.domain.models.aggregates.webhook_delivery_attempt_aggregate import (
     WebhookDeliveryAttemptAggregate,
@@ -23,6 +23,14 @@ class SqlAlchemyWebhookDeliveryAttemptRepository(
 
         attempt.id = model.id
 
+    def _add_many(self, attempts: List[WebhookDeliveryAttemptAggregate]):
+        models = [WebhookDeliveryAttempt.from_aggregate(a) for a in attempts]
+        self.session.add_all(models)
+        self.session.flush()
+
+        for attempt, model in zip(attempts, models):
+            attempt.id = model.id
+
     def _get_model(self, object_id: int) -> Optional[WebhookDeliveryAttempt]:
         return (
             self.session.query(WebhookDeliveryAttempt).filter_by(id=object_id).first()
@@ -1,13 +1,21 @@
-from typing import Optional
+import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import update
 
 from project.domain.events.webhook_delivery_created import WebhookDeliveryCreated
 from project.domain.models.aggregates.webhook_delivery_aggregate import (
     WebhookDeliveryAggregate,
 )
+from project.domain.models.value_objects.webhook_circuit_value_object import (
+    WebhookCircuitValueObject,
+)
 from project.domain.repositories.abstract_webhook_delivery_repository import (
     AbstractWebhookDeliveryRepository,
 )
+from project.models.webhook import Webhook
 from project.models.webhook_delivery import WebhookDelivery
+from project.models.webhook_event import WebhookEvent
 
 
 class SqlAlchemyWebhookDeliveryRepository(AbstractWebhookDeliveryRepository):
@@ -30,3 +38,53 @@ class SqlAlchemyWebhookDeliveryRepository(AbstractWebhookDeliveryRepository):
     def _get(self, object_id: int) -> Optional[WebhookDeliveryAggregate]:
         model = self._get_model(object_id)
         return WebhookDelivery.to_aggregate(model)
+
+    def _get_debounced(
+        self, app_installation_id: int, event_type: str, object_id: int
+    ) -> Optional[WebhookDeliveryAggregate]:
+        # Webhook times are stored as naive UTC
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+
+        # Delayed deliveries that have not been picked up by a sender yet. The
+        # row is locked, so that concurrent updates are merged one by one.
+        model = (
+            self.session.query(WebhookDelivery)
+            .join(WebhookDelivery.webhook_event)
+            .filter(
+                WebhookDelivery.app_installation_id == app_installation_id,
+                WebhookDelivery.next_attempt_at > now,
+                ~WebhookDelivery.attempts.any(),
+                WebhookEvent.event_type == event_type,
+                WebhookEvent.payload["id"].as_integer() == object_id,
+            )
+            .order_by(WebhookDelivery.id.desc())
+            .with_for_update(of=WebhookDelivery)
+            .first()
+        )
+        return WebhookDelivery.to_aggregate(model)
+
+    def _schedule_next_attempts(
+        self, next_attempt_at_by_id: Dict[int, Optional[datetime.datetime]]
+    ):
+        self.session.execute(
+            update(WebhookDelivery),
+            [
+                {"id": delivery_id, "next_attempt_at": next_attempt_at}
+                for delivery_id, next_attempt_at in next_attempt_at_by_id.items()
+            ],
+        )
+
+    def _update_webhook_circuits(self, circuits: List[WebhookCircuitValueObject]):
+        self.session.execute(
+            update(Webhook),
+            [
+                {
+                    "id": circuit.webhook_id,
+                    "consecutive_failures": circuit.consecutive_failures,
+                    "failing_since": circuit.failing_since,
+                    "circuit_open_until": circuit.circuit_open_until,
+                    "disabled": circuit.disabled,
+                }
+                for circuit in circuits
+            ],
+        )
@@ -21,6 +21,11 @@ class SqlAlchemyWebhookEventRepository(AbstractWebhookEventRepository):
 
         event.id = model.id
 
+    def _update(self, event: WebhookEventAggregate):
+        model = self._get_model(event.id)
+        model.fill_from_aggregate(event)
+        self.session.flush()
+
     def _get(self, object_id: int) -> WebhookEventAggregate:
         model = self._get_model(object_id)
         return WebhookEvent.to_aggregate(model)
@@ -0,0 +1,13 @@
+from flask import current_app
+
+from project.application.services.abstract_webhook_delivery_dispatcher import (
+    AbstractWebhookDeliveryDispatcher,
+)
+
+
+class CeleryWebhookDeliveryDispatcher(AbstractWebhookDeliveryDispatcher):
+    def dispatch_pending(self):
+        from project.base_tasks import send_pending_webhook_deliveries_task
+
+        queue = current_app.config["WEBHOOK_DELIVERY_QUEUE"] or None
+        send_pending_webhook_deliveries_task.apply_async(queue=queue)
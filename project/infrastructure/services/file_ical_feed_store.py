@@ -0,0 +1,196 @@
+import functools
+import hashlib
+import os
+import tempfile
+import time
+
+from flask import current_app
+from flask_babel import force_locale
+from sqlalchemy import select
+
+from project.application.services.abstract_ical_feed_store import AbstractIcalFeedStore
+from project.dateutils import stream_icalendar
+from project.models.admin_unit import AdminUnit
+from project.models.event import Event
+from project.models.event_generated import EventPublicStatus
+from project.utils import make_dir
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Locks of crashed renderings are taken over after this many seconds
+LOCK_TIMEOUT = 10 * 60
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_file_hash(file_path: str, inode: int, mtime_ns: int, size: int) -> str:
+    # Keyed by the file identity, so every rendered file is hashed only once
+    digest = hashlib.sha1()
+
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class FileIcalFeedStore(AbstractIcalFeedStore):
+    def __init__(self, session, path):
+        super().__init__()
+        self.session = session
+        self.path = path
+
+    def get_admin_unit_feed_path(self, admin_unit_id: int) -> str:
+        return os.path.join(self.path, f"organization_{admin_unit_id}.ics")
+
+    def get_event_feed_path(self, event_id: int) -> str:
+        return os.path.join(self.path, f"event_{event_id}.ics")
+
+    def get_admin_unit_feed(self, admin_unit_id: int) -> str | None:
+        return self._get_feed(
+            self.get_admin_unit_feed_path(admin_unit_id),
+            lambda file_path: self._render_admin_unit_feed(admin_unit_id, file_path),
+        )
+
+    def get_event_feed(self, event_id: int) -> str | None:
+        return self._get_feed(
+            self.get_event_feed_path(event_id),
+            lambda file_path: self._render_event_feed(event_id, file_path),
+        )
+
+    def get_etag(self, file_path: str) -> str:
+        # Rendered files are replaced, never modified, so their content hash
+        # is a strong validator.
+        stat = os.stat(file_path)
+        return _get_file_hash(file_path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def invalidate_admin_unit_feed(self, admin_unit_id: int):
+        # Backdating keeps the file, so that it is still served while it is
+        # rendered again on the next request.
+        try:
+            os.utime(self.get_admin_unit_feed_path(admin_unit_id), (0, 0))
+        except FileNotFoundError:
+            pass
+
+    def render_event_feed(self, event_id: int):
+        # Feeds are rendered on their first request, so only feeds that
+        # calendar clients subscribed to are kept up to date.
+        file_path = self.get_event_feed_path(event_id)
+
+        if os.path.exists(file_path):
+            self._render_event_feed(event_id, file_path)
+
+    def remove_event_feed(self, event_id: int):
+        self._remove_file(self.get_event_feed_path(event_id))
+
+    def remove_event_feeds_of_organizer(self, organizer_id: int):
+        self._remove_event_feeds_where(Event.organizer_id == organizer_id)
+
+    def remove_event_feeds_of_event_place(self, event_place_id: int):
+        self._remove_event_feeds_where(Event.event_place_id == event_place_id)
+
+    def remove_admin_unit_feeds(self, admin_unit_id: int):
+        self._remove_file(self.get_admin_unit_feed_path(admin_unit_id))
+        self._remove_event_feeds_where(Event.admin_unit_id == admin_unit_id)
+
+    def _get_feed(self, file_path: str, render) -> str | None:
+        if self._is_fresh(file_path):
+            return file_path
+
+        make_dir(self.path)
+        lock_path = file_path + ".lock"
+
+        # Another worker renders this feed right now, the stale one is good enough
+        if not self._acquire_lock(lock_path):
+            return file_path if os.path.exists(file_path) else None
+
+        try:
+            render(file_path)
+        finally:
+            self._release_lock(lock_path)
+
+        return file_path if os.path.exists(file_path) else None
+
+    def _is_fresh(self, file_path: str) -> bool:
+        max_age = current_app.config["ICAL_FEED_MAX_AGE"]
+
+        try:
+            return os.path.getmtime(file_path) > time.time() - max_age
+        except FileNotFoundError:
+            return False
+
+    def _render_admin_unit_feed(self, admin_unit_id: int, file_path: str):
+        from project.services.admin_unit import create_ical_events_for_admin_unit
+
+        admin_unit = self.session.get(AdminUnit, admin_unit_id)
+
+        if not admin_unit:
+            self._remove_file(file_path)
+            return
+
+        ical_events = create_ical_events_for_admin_unit(admin_unit, from_request=False)
+        self._write(file_path, ical_events, admin_unit.name)
+
+    def _render_event_feed(self, event_id: int, file_path: str):
+        from project.services.event import create_ical_events_for_event
+
+        event = self.session.get(Event, event_id)
+
+        # Only feeds of public events are the same for everyone
+        if (
+            not event
+            or event.public_status != EventPublicStatus.published
+            or not event.admin_unit.is_verified
+        ):
+            self._remove_file(file_path)
+            return
+
+        self._write(file_path, create_ical_events_for_event(event))
+
+    def _write(self, file_path: str, ical_events, calendar_name: str | None = None):
+        make_dir(self.path)
+
+        # Write into a temp file and rename it, so that readers never see
+        # partially written feeds.
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".tmp-", suffix=".ics")
+
+        try:
+            with force_locale(current_app.config["BABEL_DEFAULT_LOCALE"]):
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in stream_icalendar(ical_events, calendar_name):
+                        f.write(chunk)
+
+            os.replace(tmp_path, file_path)
+        finally:
+            self._remove_file(tmp_path)
+
+    def _remove_event_feeds_where(self, event_filter):
+        event_ids = self.session.execute(select(Event.id).where(event_filter))
+
+        for event_id in event_ids.scalars():
+            self.remove_event_feed(event_id)
+
+    def _acquire_lock(self, lock_path: str) -> bool:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            return True
+        except FileExistsError:
+            pass
+
+        try:
+            if os.path.getmtime(lock_path) < time.time() - LOCK_TIMEOUT:
+                os.utime(lock_path)
+                return True
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+        return False
+
+    def _release_lock(self, lock_path: str):
+        self._remove_file(lock_path)
+
+    def _remove_file(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
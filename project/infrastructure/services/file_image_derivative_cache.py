@@ -0,0 +1,236 @@
+import glob
+import os
+import tempfile
+import time
+
+import PIL
+from flask import current_app
+
+from project.application.services.abstract_image_derivative_cache import (
+    AbstractImageDerivativeCache,
+)
+from project.imageutils import get_image_from_bytes
+from project.models.image import Image
+from project.utils import make_dir
+
+# Requested sizes are rounded up to the next allowed size, so the number of
+# derivatives per image is bounded.
+IMAGE_DERIVATIVE_SIZES = (100, 200, 300, 500, 700, 1000)
+IMAGE_DERIVATIVE_DEFAULT_SIZE = 500
+
+# Formats that are negotiated by the Accept header, in order of preference.
+# AVIF requires Pillow 11.2+ or pillow-avif-plugin.
+IMAGE_DERIVATIVE_FORMATS = ("avif", "webp")
+IMAGE_DERIVATIVE_SAVE_OPTIONS = {
+    "avif": {"quality": 60},
+    "webp": {"quality": 80, "method": 4},
+}
+
+# Seconds to wait for another worker that is rendering the same derivative
+LOCK_TIMEOUT = 10
+LOCK_POLL_INTERVAL = 0.1
+
+# Hit files are touched at most once per interval to keep the LRU order
+TOUCH_INTERVAL = 60 * 60
+
+
+def is_format_supported(format: str) -> bool:
+    PIL.Image.init()
+    return format.upper() in PIL.Image.SAVE
+
+
+class FileImageDerivativeCache(AbstractImageDerivativeCache):
+    def __init__(self, session, path):
+        super().__init__()
+        self.session = session
+        self.path = path
+
+    def get_size(self, requested_size: int | None) -> int:
+        if not requested_size:
+            return IMAGE_DERIVATIVE_DEFAULT_SIZE
+
+        return next(
+            (size for size in IMAGE_DERIVATIVE_SIZES if size >= requested_size),
+            IMAGE_DERIVATIVE_SIZES[-1],
+        )
+
+    def get_format(self, accept_mimetypes) -> str | None:
+        # Only explicitly listed types count, since browsers send */* as well
+        accepted = {value for value, quality in accept_mimetypes if quality > 0}
+
+        return next(
+            (
+                format
+                for format in IMAGE_DERIVATIVE_FORMATS
+                if f"image/{format}" in accepted and is_format_supported(format)
+            ),
+            None,
+        )
+
+    def get_file_path(self, image: Image, size: int, format: str | None = None) -> str:
+        extension = format or image.get_file_extension()
+        return os.path.join(
+            self.path, f"{image.id}-{image.get_hash()}-{size}-{size}.{extension}"
+        )
+
+    def get_file(self, image: Image, size: int, format: str | None = None) -> str:
+        file_path = self.get_file_path(image, size, format)
+
+        if os.path.exists(file_path):
+            self._touch(file_path)
+            return file_path
+
+        make_dir(self.path)
+        lock_path = file_path + ".lock"
+
+        locked = self._acquire_lock(lock_path)
+
+        # Another worker renders this derivative right now
+        if not locked and self._wait_for_file(file_path):
+            return file_path
+
+        try:
+            self._render(
+                get_image_from_bytes(image.get_data()), file_path, size, format
+            )
+        finally:
+            if locked:
+                self._release_lock(lock_path)
+
+        return file_path
+
+    def render_derivatives(self, image_id: int):
+        image = self.session.get(Image, image_id)
+
+        if not image or image.is_empty():
+            return
+
+        make_dir(self.path)
+        self._remove_files(image.id, keep_hash=image.get_hash())
+        img = get_image_from_bytes(image.get_data())
+
+        # AVIF encoding is expensive, so only WebP is rendered in advance
+        formats = [None] + (["webp"] if is_format_supported("webp") else [])
+
+        for size in IMAGE_DERIVATIVE_SIZES:
+            for format in formats:
+                file_path = self.get_file_path(image, size, format)
+                lock_path = file_path + ".lock"
+
+                if os.path.exists(file_path) or not self._acquire_lock(lock_path):
+                    continue
+
+                try:
+                    self._render(img, file_path, size, format)
+                finally:
+                    self._release_lock(lock_path)
+
+    def remove_derivatives(self, image_id: int):
+        self._remove_files(image_id)
+
+    def evict(self):
+        if not os.path.exists(self.path):
+            return
+
+        max_bytes = current_app.config["IMAGE_CACHE_MAX_SIZE_MB"] * 1024 * 1024
+        stale_time = time.time() - LOCK_TIMEOUT * 6
+        files = list()
+        total_bytes = 0
+
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if not entry.is_file():  # pragma: no cover
+                    continue
+
+                stat = entry.stat()
+
+                if entry.name.startswith(".tmp-") or entry.name.endswith(".lock"):
+                    if stat.st_mtime < stale_time:
+                        self._remove_file(entry.path)
+                    continue
+
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+
+        # Evict down to 90% to not run again on the next occasion
+        target_bytes = max_bytes * 0.9
+        removed_count = 0
+
+        if total_bytes > max_bytes:
+            for _, size, path in sorted(files):
+                if total_bytes <= target_bytes:
+                    break
+
+                self._remove_file(path)
+                total_bytes -= size
+                removed_count += 1
+
+        current_app.logger.info(
+            f"{removed_count} image(s) evicted, {total_bytes} bytes cached."
+        )
+
+    def _render(self, img, file_path: str, size: int, format: str | None = None):
+        # Render into a temp file and rename it, so that readers never see
+        # partially written files.
+        _, extension = os.path.splitext(file_path)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".tmp-", suffix=extension)
+        os.close(fd)
+
+        try:
+            thumbnail = img.copy()
+            thumbnail.thumbnail((size, size), PIL.Image.Resampling.LANCZOS)
+
+            if format:
+                thumbnail.save(
+                    tmp_path, format=format, **IMAGE_DERIVATIVE_SAVE_OPTIONS[format]
+                )
+            else:
+                thumbnail.save(tmp_path, format=img.format)
+
+            os.replace(tmp_path, file_path)
+        finally:
+            self._remove_file(tmp_path)
+
+    def _acquire_lock(self, lock_path: str) -> bool:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            return True
+        except FileExistsError:
+            return False
+
+    def _release_lock(self, lock_path: str):
+        self._remove_file(lock_path)
+
+    def _wait_for_file(self, file_path: str) -> bool:
+        deadline = time.monotonic() + LOCK_TIMEOUT
+
+        while time.monotonic() < deadline:
+            if os.path.exists(file_path):
+                return True
+
+            time.sleep(LOCK_POLL_INTERVAL)
+
+        return os.path.exists(file_path)  # pragma: no cover
+
+    def _touch(self, file_path: str):
+        try:
+            if os.path.getmtime(file_path) < time.time() - TOUCH_INTERVAL:
+                os.utime(file_path)
+        except OSError:  # pragma: no cover
+            pass
+
+    def _remove_files(self, image_id: int, keep_hash: int | None = None):
+        prefix = f"{image_id}-{keep_hash}-" if keep_hash is not None else None
+
+        for path in glob.glob(os.path.join(self.path, f"{image_id}-*")):
+            if prefix and os.path.basename(path).startswith(prefix):
+                continue
+
+            self._remove_file(path)
+
+    def _remove_file(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,72 @@
+import hashlib
+import os
+import tempfile
+import time
+from typing import Iterator
+
+from project.application.services.abstract_image_storage import AbstractImageStorage
+from project.utils import make_dir
+
+
+# Content-addressed: files are named by the SHA-256 of their content and
+# fanned out into two directory levels.
+class FileImageStorage(AbstractImageStorage):
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def get_key(self, data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def write(self, data: bytes) -> str:
+        key = self.get_key(data)
+        file_path = self._get_file_path(key)
+
+        # Same content, same file
+        if os.path.exists(file_path):
+            return key
+
+        dir_path = os.path.dirname(file_path)
+        make_dir(dir_path)
+        fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix=".tmp-")
+
+        try:
+            with os.fdopen(fd, "wb") as outfile:
+                outfile.write(data)
+                outfile.flush()
+                os.fsync(outfile.fileno())
+
+            os.replace(tmp_path, file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return key
+
+    def read(self, key: str) -> bytes | None:
+        try:
+            with open(self._get_file_path(key), "rb") as infile:
+                return infile.read()
+        except FileNotFoundError:
+            return None
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._get_file_path(key))
+        except FileNotFoundError:
+            pass
+
+    def iter_keys(self, min_age: int = 0) -> Iterator[str]:
+        max_mtime = time.time() - min_age
+
+        for dir_path, _, file_names in os.walk(self.path):
+            for file_name in file_names:
+                if file_name.startswith(".tmp-"):
+                    continue
+
+                file_path = os.path.join(dir_path, file_name)
+                if os.path.getmtime(file_path) <= max_mtime:
+                    yield file_name
+
+    def _get_file_path(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key[2:4], key)
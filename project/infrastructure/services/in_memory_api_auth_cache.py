@@ -0,0 +1,50 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from project.application.services.abstract_api_auth_cache import AbstractApiAuthCache
+
+
+# Per process fallback for setups without Redis, e.g. tests and development
+class InMemoryApiAuthCache(AbstractApiAuthCache):
+    def __init__(self, max_entries: int = 10000):
+        super().__init__()
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+
+        # Entries are stored serialized, so callers can't change them
+        return json.loads(value)
+
+    def set(self, key: str, value: dict):
+        value = json.dumps(value)
+
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + self.timeout)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key: str):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def invalidate_all(self):
+        with self.lock:
+            self.entries.clear()
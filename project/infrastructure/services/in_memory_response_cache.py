@@ -0,0 +1,46 @@
+import threading
+import time
+from collections import OrderedDict
+
+from project.application.services.abstract_response_cache import AbstractResponseCache
+
+
+# Per process fallback for setups without Redis, e.g. tests and development
+class InMemoryResponseCache(AbstractResponseCache):
+    def __init__(self, max_entries: int = 1000):
+        super().__init__()
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.generations = dict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, timeout: int):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + timeout)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_generation(self, scope: str) -> int:
+        with self.lock:
+            return self.generations.get(scope, 0)
+
+    def invalidate(self, scope: str):
+        with self.lock:
+            self.generations[scope] = self.generations.get(scope, 0) + 1
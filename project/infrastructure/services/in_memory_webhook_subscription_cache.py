@@ -0,0 +1,43 @@
+import threading
+import time
+
+from project.application.services.abstract_webhook_subscription_cache import (
+    AbstractWebhookSubscriptionCache,
+)
+
+
+# Per process fallback for setups without Redis, e.g. tests and development
+class InMemoryWebhookSubscriptionCache(AbstractWebhookSubscriptionCache):
+    def __init__(self):
+        super().__init__()
+        self.entries = dict()
+        self.lock = threading.Lock()
+
+    def get_event_types(self, admin_unit_id: int) -> set[str] | None:
+        with self.lock:
+            entry = self.entries.get(admin_unit_id)
+
+            if entry is None:
+                return None
+
+            event_types, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.entries[admin_unit_id]
+                return None
+
+            return set(event_types)
+
+    def set_event_types(self, admin_unit_id: int, event_types: set[str]):
+        with self.lock:
+            self.entries[admin_unit_id] = (
+                frozenset(event_types),
+                time.monotonic() + self.timeout,
+            )
+
+    def invalidate(self, admin_unit_id: int):
+        with self.lock:
+            self.entries.pop(admin_unit_id, None)
+
+    def invalidate_all(self):
+        with self.lock:
+            self.entries.clear()
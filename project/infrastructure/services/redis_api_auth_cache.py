@@ -0,0 +1,34 @@
+import json
+
+import redis
+
+from project.application.services.abstract_api_auth_cache import AbstractApiAuthCache
+
+
+class RedisApiAuthCache(AbstractApiAuthCache):
+    key_prefix = "api-auth-cache"
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.redis = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> dict | None:
+        value = self.redis.get(self._get_key(key))
+
+        if value is None:
+            return None
+
+        return json.loads(value)
+
+    def set(self, key: str, value: dict):
+        self.redis.set(self._get_key(key), json.dumps(value), ex=self.timeout)
+
+    def invalidate(self, key: str):
+        self.redis.delete(self._get_key(key))
+
+    def invalidate_all(self):
+        self.redis.incr(f"{self.key_prefix}:generation")
+
+    def _get_key(self, key: str) -> str:
+        generation = int(self.redis.get(f"{self.key_prefix}:generation") or 0)
+        return f"{self.key_prefix}:{generation}:{key}"
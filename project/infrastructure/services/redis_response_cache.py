@@ -0,0 +1,23 @@
+import redis
+
+from project.application.services.abstract_response_cache import AbstractResponseCache
+
+
+class RedisResponseCache(AbstractResponseCache):
+    key_prefix = "response-cache"
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.redis = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> bytes | None:
+        return self.redis.get(f"{self.key_prefix}:entry:{key}")
+
+    def set(self, key: str, value: bytes, timeout: int):
+        self.redis.set(f"{self.key_prefix}:entry:{key}", value, ex=timeout)
+
+    def get_generation(self, scope: str) -> int:
+        return int(self.redis.get(f"{self.key_prefix}:generation:{scope}") or 0)
+
+    def invalidate(self, scope: str):
+        self.redis.incr(f"{self.key_prefix}:generation:{scope}")
@@ -0,0 +1,40 @@
+import json
+
+import redis
+
+from project.application.services.abstract_webhook_subscription_cache import (
+    AbstractWebhookSubscriptionCache,
+)
+
+
+class RedisWebhookSubscriptionCache(AbstractWebhookSubscriptionCache):
+    key_prefix = "webhook-subscription-cache"
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.redis = redis.Redis.from_url(url)
+
+    def get_event_types(self, admin_unit_id: int) -> set[str] | None:
+        value = self.redis.get(self._get_key(admin_unit_id))
+
+        if value is None:
+            return None
+
+        return set(json.loads(value))
+
+    def set_event_types(self, admin_unit_id: int, event_types: set[str]):
+        self.redis.set(
+            self._get_key(admin_unit_id),
+            json.dumps(sorted(event_types)),
+            ex=self.timeout,
+        )
+
+    def invalidate(self, admin_unit_id: int):
+        self.redis.delete(self._get_key(admin_unit_id))
+
+    def invalidate_all(self):
+        self.redis.incr(f"{self.key_prefix}:generation")
+
+    def _get_key(self, admin_unit_id: int) -> str:
+        generation = int(self.redis.get(f"{self.key_prefix}:generation") or 0)
+        return f"{self.key_prefix}:{generation}:admin_unit:{admin_unit_id}"
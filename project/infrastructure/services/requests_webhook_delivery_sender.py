@@ -1,19 +1,41 @@
+import datetime
 import hashlib
 import hmac
 import json
 import logging
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Optional
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from project.application.read_models.webhook_delivery_read_model import (
+    WebhookDeliveryReadModel,
+)
 from project.application.services.abstract_webhook_delivery_sender import (
     AbstractWebhookDeliverySender,
+    WebhookDeliveryResult,
 )
 
+TIMEOUT = 10
+
+# Deliveries of a batch are sent concurrently by a bounded number of threads
+MAX_WORKERS = 10
+
+# Keep-alive sessions are pooled per destination host
+MAX_SESSIONS = 100
+
 
 class RequestsWebhookDeliverySender(AbstractWebhookDeliverySender):
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, max_workers: int = MAX_WORKERS):
         self.logger = logger
+        self.max_workers = max_workers
+        self.sessions = dict()
+        self.session_users = dict()
+        self.sessions_lock = threading.Lock()
 
     def send(
         self,
@@ -45,9 +67,14 @@ class RequestsWebhookDeliverySender(AbstractWebhookDeliverySender):
         status_code = None
 
         try:
-            response = requests.post(
-                url, data=data_str.encode("utf-8"), headers=headers, timeout=10
-            )
+            with self._use_session(url) as session:
+                response = session.post(
+                    url,
+                    data=data_str.encode("utf-8"),
+                    headers=headers,
+                    timeout=TIMEOUT,
+                )
+
             status_code = str(response.status_code) if response.status_code else None
             response.raise_for_status()
             status = "OK"
@@ -67,3 +94,80 @@ class RequestsWebhookDeliverySender(AbstractWebhookDeliverySender):
                 status = type(exc).__name__
 
         return status, status_code
+
+    def send_many(
+        self, webhook_deliveries: List[WebhookDeliveryReadModel]
+    ) -> List[WebhookDeliveryResult]:
+        if not webhook_deliveries:
+            return list()
+
+        max_workers = min(self.max_workers, len(webhook_deliveries))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._send_delivery, webhook_deliveries))
+
+    def _send_delivery(
+        self, webhook_delivery: WebhookDeliveryReadModel
+    ) -> WebhookDeliveryResult:
+        start_at = datetime.datetime.now(datetime.timezone.utc)
+
+        try:
+            status, status_code = self.send(
+                url=webhook_delivery.webhook.url,
+                secret=webhook_delivery.webhook.secret,
+                payload=webhook_delivery.webhook_event.payload,
+                event_type=webhook_delivery.webhook_event.event_type,
+                webhook_delivery_id=webhook_delivery.id,
+                app_installation_id=webhook_delivery.app_installation_id,
+            )
+        except Exception as exc:  # pragma: no cover
+            # A single broken delivery must not fail the whole batch
+            self.logger.exception(f"Sending webhook delivery {webhook_delivery.id}")
+            status, status_code = type(exc).__name__, None
+
+        end_at = datetime.datetime.now(datetime.timezone.utc)
+
+        return WebhookDeliveryResult(
+            status=status,
+            status_code=status_code,
+            start_at=start_at,
+            end_at=end_at,
+        )
+
+    @contextmanager
+    def _use_session(self, url: str):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+
+        with self.sessions_lock:
+            session = self.sessions.pop(key, None)
+
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._evict_sessions()
+
+            # Most recently used sessions are kept at the end
+            self.sessions[key] = session
+            self.session_users[key] = self.session_users.get(key, 0) + 1
+
+        try:
+            yield session
+        finally:
+            with self.sessions_lock:
+                self.session_users[key] -= 1
+
+                if not self.session_users[key]:
+                    del self.session_users[key]
+
+    def _evict_sessions(self):
+        # Sessions that other threads are still sending with are not closed.
+        # If all of them are in use, the pool grows until they are released.
+        for key in list(self.sessions):
+            if len(self.sessions) < MAX_SESSIONS:
+                break
+
+            if key not in self.session_users:
+                self.sessions.pop(key).close()
@@ -0,0 +1,122 @@
+from typing import Iterable
+
+from sqlalchemy import cast, delete, func, insert, literal_column, select, true
+
+from project.application.services.abstract_event_date_search_indexer import (
+    AbstractEventDateSearchIndexer,
+)
+from project.models.admin_unit import AdminUnit
+from project.models.event import Event
+from project.models.event_category import EventEventCategories
+from project.models.event_date import EventDate
+from project.models.event_date_search_index import EventDateSearchIndex
+from project.models.event_organizer import EventOrganizer
+from project.models.event_place import EventPlace
+from project.models.location import Location
+
+
+class SqlAlchemyEventDateSearchIndexer(AbstractEventDateSearchIndexer):
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+
+    def index_events(self, event_ids: Iterable[int]):
+        event_ids = list(event_ids)
+
+        if not event_ids:
+            return
+
+        self.remove_events(event_ids)
+        self._insert_rows(Event.id.in_(event_ids))
+
+    def index_events_of_event_place(self, event_place_id: int):
+        self._reindex_events_where(Event.event_place_id == event_place_id)
+
+    def index_events_of_organizer(self, organizer_id: int):
+        self._reindex_events_where(Event.organizer_id == organizer_id)
+
+    def remove_events(self, event_ids: Iterable[int]):
+        event_ids = list(event_ids)
+
+        if not event_ids:
+            return
+
+        self.session.execute(
+            delete(EventDateSearchIndex).where(
+                EventDateSearchIndex.event_id.in_(event_ids)
+            )
+        )
+
+    def rebuild(self):
+        self.session.execute(delete(EventDateSearchIndex))
+        self._insert_rows(true())
+
+    def _reindex_events_where(self, event_filter):
+        event_ids = select(Event.id).where(event_filter).scalar_subquery()
+        self.session.execute(
+            delete(EventDateSearchIndex).where(
+                EventDateSearchIndex.event_id.in_(event_ids)
+            )
+        )
+        self._insert_rows(event_filter)
+
+    def _insert_rows(self, event_filter):
+        category_ids = (
+            select(func.array_agg(EventEventCategories.category_id))
+            .where(EventEventCategories.event_id == Event.id)
+            .scalar_subquery()
+        )
+        empty_array = literal_column("'{}'")
+        search_text = func.lower(
+            func.concat_ws(
+                " ", Event.name, EventPlace.name, Location.city, EventOrganizer.name
+            )
+        )
+
+        columns = {
+            "event_date_id": EventDate.id,
+            "event_id": Event.id,
+            "admin_unit_id": Event.admin_unit_id,
+            "start": EventDate.start,
+            "end": EventDate.end,
+            "allday": EventDate.allday,
+            "public_status": Event.public_status,
+            "status": Event.status,
+            "admin_unit_is_verified": AdminUnit.is_verified,
+            "organizer_id": Event.organizer_id,
+            "event_place_id": Event.event_place_id,
+            "rating": Event.rating,
+            "expected_participants": Event.expected_participants,
+            "is_recurring": Event.is_recurring,
+            "city": Location.city,
+            "postal_code": Location.postalCode,
+            "coordinate": cast(
+                func.ST_SetSRID(Location.coordinate, 4326),
+                EventDateSearchIndex.coordinate.type,
+            ),
+            "category_ids": func.coalesce(
+                category_ids,
+                cast(empty_array, EventDateSearchIndex.category_ids.type),
+            ),
+            "tags": func.coalesce(
+                func.string_to_array(Event.tags, ","),
+                cast(empty_array, EventDateSearchIndex.tags.type),
+            ),
+            "search_text": search_text,
+            "ts_vector": Event.ts_vector,
+        }
+
+        rows = (
+            select(*columns.values())
+            .select_from(EventDate)
+            .join(Event, EventDate.event_id == Event.id)
+            .join(AdminUnit, Event.admin_unit_id == AdminUnit.id)
+            .join(EventPlace, Event.event_place_id == EventPlace.id, isouter=True)
+            .join(Location, EventPlace.location_id == Location.id, isouter=True)
+            .join(EventOrganizer, Event.organizer_id == EventOrganizer.id, isouter=True)
+            .where(event_filter)
+        )
+
+        self.session.execute(
+            insert(EventDateSearchIndex).from_select(list(columns.keys()), rows)
+        )
@@ -66,6 +66,7 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
             SqlAlchemyOrganizationAppInstallationRepository(self.session)
         )
         self.organization_members = SqlAlchemyOrganizationMemberRepository(self.session)
+        self.nested_transaction = None
 
     def _commit(self):
         try:
@@ -77,6 +78,28 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
     def rollback(self):
         self.session.rollback()
 
+    def _begin_nested(self):
+        try:
+            self.nested_transaction = self.session.begin_nested()
+        except SQLAlchemyError as e:
+            self._reraiseSqlErrorMessage(e)
+
+    def _release_nested(self):
+        try:
+            self.nested_transaction.commit()
+        except SQLAlchemyError as e:
+            self._reraiseSqlErrorMessage(e)
+
+        self.nested_transaction = None
+
+    def _rollback_nested(self):
+        nested_transaction = self.nested_transaction
+        self.nested_transaction = None
+
+        # Also needed after a failed release to reactivate the session
+        if nested_transaction:
+            nested_transaction.rollback()
+
     def _reraiseSqlErrorMessage(self, e: SQLAlchemyError):
         if hasattr(e, "orig") and hasattr(e.orig, "pgcode"):
             if e.orig.pgcode == UNIQUE_VIOLATION:
@@ -14,6 +14,7 @@ from project.models.admin_unit_verification_request_generated import (
 from project.models.api_key import ApiKey
 from project.models.app import AppInstallation, AppKey
 from project.models.custom_widget import CustomWidget
+from project.models.dump_tombstone import DumpTombstone
 from project.models.event import Event
 from project.models.event_category import (
     CustomEventCategory,
@@ -21,6 +22,7 @@ from project.models.event_category import (
     EventCategory,
 )
 from project.models.event_date import EventDate, EventDateDefinition
+from project.models.event_date_search_index import EventDateSearchIndex
 from project.models.event_generated import (
     EventAttendanceMode,
     EventPublicStatus,
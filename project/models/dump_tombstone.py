@@ -0,0 +1,74 @@
+import datetime
+
+from sqlalchemy import insert, literal, not_, select
+from sqlalchemy.event import listens_for
+
+from project.extensions import db
+from project.models.admin_unit import AdminUnit, AdminUnitRelation
+from project.models.dump_tombstone_generated import DumpTombstoneGeneratedMixin
+from project.models.event import Event
+from project.models.event_generated import EventPublicStatus
+from project.models.event_organizer import EventOrganizer
+from project.models.event_place import EventPlace
+from project.models.event_reference import EventReference
+
+
+class DumpTombstone(db.Model, DumpTombstoneGeneratedMixin):
+    pass
+
+
+# Entity types as named in the dump files
+dump_tombstone_entity_types = {
+    Event: "events",
+    EventPlace: "places",
+    EventOrganizer: "organizers",
+    AdminUnit: "organizations",
+    EventReference: "event_references",
+}
+
+
+def add_dump_tombstone(connection, entity_type, entity_id):
+    connection.execute(
+        insert(DumpTombstone.__table__).values(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            deleted_at=datetime.datetime.utcnow(),
+        )
+    )
+
+
+@listens_for(Event, "after_delete")
+@listens_for(EventPlace, "after_delete")
+@listens_for(EventOrganizer, "after_delete")
+@listens_for(AdminUnit, "after_delete")
+@listens_for(EventReference, "after_delete")
+def after_deleting_dumped_entity(mapper, connection, target):
+    add_dump_tombstone(
+        connection, dump_tombstone_entity_types[mapper.class_], target.id
+    )
+
+
+@listens_for(AdminUnitRelation, "after_delete")
+def after_deleting_admin_unit_relation(mapper, connection, target):
+    # Published events of an organization that lost its verification are no
+    # longer dumped. Since the relation is gone, there is no row that a delta
+    # dump could select them by.
+    if not target.verify:
+        return
+
+    connection.execute(
+        insert(DumpTombstone.__table__).from_select(
+            ["entity_type", "entity_id", "deleted_at"],
+            select(
+                literal(dump_tombstone_entity_types[Event]),
+                Event.id,
+                literal(datetime.datetime.utcnow()),
+            )
+            .join(Event.admin_unit)
+            .where(
+                Event.admin_unit_id == target.target_admin_unit_id,
+                Event.public_status == EventPublicStatus.published,
+                not_(AdminUnit.is_verified),
+            ),
+        )
+    )
@@ -0,0 +1,53 @@
+from enum import IntEnum
+from flask_security import AsaList
+from geoalchemy2 import Geometry
+from project.extensions import db
+from sqlalchemy import (
+    Index,
+    Boolean,
+    DateTime,
+    Column,
+    Integer,
+    LargeBinary,
+    Numeric,
+    String,
+    Unicode,
+    UniqueConstraint,
+    ForeignKey,
+    UnicodeText,
+    CheckConstraint,
+    cast,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.orm import backref, deferred, relationship, remote
+from sqlalchemy_utils import ColorType
+import datetime
+from project.dbtypes import IntegerEnum
+from sqlalchemy.ext.declarative import declared_attr
+
+
+class DumpTombstoneGeneratedMixin:
+    __tablename__ = "dump_tombstone"
+
+    __model_name__ = "dump_tombstone"
+    __model_name_plural__ = "dump_tombstones"
+    __display_name__ = "Dump tombstone"
+    __display_name_plural__ = "Dump tombstones"
+
+    @declared_attr
+    def id(cls):
+        return Column(Integer(), primary_key=True)
+
+    @declared_attr
+    def entity_type(cls):
+        return Column(Unicode(255), nullable=False)
+
+    @declared_attr
+    def entity_id(cls):
+        return Column(Integer(), nullable=False)
+
+    @declared_attr
+    def deleted_at(cls):
+        return Column(DateTime(), nullable=False, index=True)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from flask_security import current_user
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.event import listens_for
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import declared_attr, validates
+from sqlalchemy.orm import validates
+from sqlalchemy.orm.attributes import get_history
 
 from project.application.read_models.event_read_model import (
     AdminUnitReadModel,
@@ -20,16 +21,12 @@ from project.models.event_generated import EventGeneratedMixin
 from project.models.event_organizer import EventOrganizer
 from project.models.event_reference import EventReference
 from project.models.event_reference_request import EventReferenceRequest
-from project.models.functions import create_tsvector
+from project.models.functions import create_tsvector, sanitize_allday_instance
 from project.models.image import Image
 from project.utils import make_check_violation
 
 
 class Event(db.Model, EventGeneratedMixin):
-    @declared_attr
-    def __ts_vector__(cls):
-        return create_tsvector((cls.name, "A"), (cls.tags, "B"), (cls.description, "C"))
-
     @classmethod
     def from_aggregate(cls, aggregate: EventAggregate) -> Event:
         model = cls()
@@ -103,6 +100,8 @@ class Event(db.Model, EventGeneratedMixin):
                 self.dates.append(date)
             date.fill_from_entity(entity)
 
+        self.update_date_summary()
+
         # Photo
         if aggregate.photo:
             if not self.photo:
@@ -200,54 +199,6 @@ class Event(db.Model, EventGeneratedMixin):
         else:
             return None
 
-    @hybrid_property
-    def min_start(self):
-        if self.date_definitions:
-            return min(d.start for d in self.date_definitions)
-        else:
-            return None
-
-    @min_start.expression
-    def min_start(cls):
-        return (
-            select(EventDateDefinition.start)
-            .where(EventDateDefinition.event_id == cls.id)
-            .order_by(EventDateDefinition.start)
-            .limit(1)
-            .scalar_subquery()
-        )
-
-    @hybrid_property
-    def is_recurring(self):
-        if self.date_definitions:
-            return any(d.recurrence_rule for d in self.date_definitions)
-        else:
-            return False
-
-    @is_recurring.expression
-    def is_recurring(cls):
-        return (
-            select(func.count())
-            .select_from(EventDateDefinition.__table__)
-            .where(
-                and_(
-                    EventDateDefinition.event_id == cls.id,
-                    func.coalesce(EventDateDefinition.recurrence_rule, "") != "",
-                )
-            )
-            .scalar_subquery()
-        ) > 0
-
-    @hybrid_property
-    def number_of_dates(self):  # pragma: no cover
-        return len(self.dates)
-
-    @number_of_dates.expression
-    def number_of_dates(cls):
-        return (
-            select(func.count()).where(EventDate.event_id == cls.id).scalar_subquery()
-        )
-
     @hybrid_property
     def min_date_start(self):  # pragma: no cover
         if self.dates:
@@ -265,35 +216,6 @@ class Event(db.Model, EventGeneratedMixin):
             .scalar_subquery()
         )
 
-    @hybrid_property
-    def max_date_end(self):  # pragma: no cover
-        if self.dates:
-            return max(d.end_or_start for d in self.dates)
-        else:
-            return None
-
-    @max_date_end.expression
-    def max_date_end(cls):
-        return (
-            select(EventDate.start)
-            .where(EventDate.event_id == cls.id)
-            .order_by(EventDate.end_or_start.desc())
-            .limit(1)
-            .scalar_subquery()
-        )
-
-    @hybrid_property
-    def number_of_references(self):  # pragma: no cover
-        return len(self.references)
-
-    @number_of_references.expression
-    def number_of_references(cls):
-        return (
-            select(func.count())
-            .where(EventReference.event_id == cls.id)
-            .scalar_subquery()
-        )
-
     @hybrid_property
     def number_of_reference_requests(self):  # pragma: no cover
         return len(self.reference_requests)
@@ -349,6 +271,23 @@ class Event(db.Model, EventGeneratedMixin):
             else []
         )
 
+    def update_date_summary(self):
+        # Stored, so that events can be sorted and filtered by index.
+        # All day dates are sanitized on flush, so they are sanitized first.
+        for date in (*self.date_definitions, *self.dates):
+            sanitize_allday_instance(date)
+
+        self.min_start = (
+            min(d.start for d in self.date_definitions)
+            if self.date_definitions
+            else None
+        )
+        self.is_recurring = any(d.recurrence_rule for d in self.date_definitions)
+        self.max_date_end = (
+            max(d.end_or_start for d in self.dates) if self.dates else None
+        )
+        self.number_of_dates = len(self.dates)
+
     def has_multiple_dates(self) -> bool:
         return self.is_recurring or len(self.date_definitions) > 1
 
@@ -389,8 +328,86 @@ class Event(db.Model, EventGeneratedMixin):
     def validate_internal_tags(self, key, value):
         return value.replace(" ", "") if value else None
 
+    def update_ts_vector(self):
+        self.ts_vector = create_tsvector(
+            (self.name, "A"), (self.tags, "B"), (self.description, "C")
+        )
+
 
 @listens_for(Event, "before_insert")
 @listens_for(Event, "before_update")
 def before_saving_event(mapper, connect, self):
     self.validate()
+
+
+@listens_for(Event, "before_insert")
+def before_inserting_event(mapper, connect, self):
+    self.update_ts_vector()
+
+
+@listens_for(Event, "before_update")
+def before_updating_event(mapper, connect, self):
+    if any(
+        get_history(self, key).has_changes() for key in ("name", "tags", "description")
+    ):
+        self.update_ts_vector()
+
+
+def get_date_summary_values() -> dict:
+    event_table = Event.__table__
+    date_definitions = EventDateDefinition.__table__
+    dates = EventDate.__table__
+    recurring_count = (
+        select(func.count())
+        .select_from(date_definitions)
+        .where(
+            date_definitions.c.event_id == event_table.c.id,
+            func.coalesce(date_definitions.c.recurrence_rule, "") != "",
+        )
+        .scalar_subquery()
+    )
+
+    return {
+        "min_start": select(func.min(date_definitions.c.start))
+        .where(date_definitions.c.event_id == event_table.c.id)
+        .scalar_subquery(),
+        "is_recurring": recurring_count > 0,
+        "max_date_end": select(func.max(func.coalesce(dates.c.end, dates.c.start)))
+        .where(dates.c.event_id == event_table.c.id)
+        .scalar_subquery(),
+        "number_of_dates": select(func.count())
+        .select_from(dates)
+        .where(dates.c.event_id == event_table.c.id)
+        .scalar_subquery(),
+    }
+
+
+def get_unchanged_trackable_values(table) -> dict:
+    # Keeps the onupdate defaults from marking the event as modified
+    return {
+        "updated_at": table.c.updated_at,
+        "updated_by_id": table.c.updated_by_id,
+        "updated_by_app_installation_id": table.c.updated_by_app_installation_id,
+    }
+
+
+def change_number_of_references(connection, event_id: int, delta: int):
+    table = Event.__table__
+    connection.execute(
+        update(table)
+        .where(table.c.id == event_id)
+        .values(
+            number_of_references=table.c.number_of_references + delta,
+            **get_unchanged_trackable_values(table),
+        )
+    )
+
+
+@listens_for(EventReference, "after_insert")
+def after_inserting_event_reference(mapper, connection, target):
+    change_number_of_references(connection, target.event_id, 1)
+
+
+@listens_for(EventReference, "after_delete")
+def after_deleting_event_reference(mapper, connection, target):
+    change_number_of_references(connection, target.event_id, -1)
@@ -0,0 +1,53 @@
+from sqlalchemy import select, update
+from sqlalchemy.event import listens_for
+from sqlalchemy.orm.attributes import get_history
+
+from project.extensions import db
+from project.models.admin_unit import AdminUnit, AdminUnitRelation
+from project.models.event_date_search_index_generated import (
+    EventDateSearchIndexGeneratedMixin,
+)
+
+
+class EventDateSearchIndex(db.Model, EventDateSearchIndexGeneratedMixin):
+    pass
+
+
+def refresh_admin_unit_is_verified(connection, admin_unit_ids):
+    # Verification is changed through relations and the can_verify_other flag,
+    # neither of them raise domain events, so the index rows are patched here.
+    admin_unit_is_verified = (
+        select(AdminUnit.is_verified)
+        .where(AdminUnit.id == EventDateSearchIndex.admin_unit_id)
+        .scalar_subquery()
+    )
+    connection.execute(
+        update(EventDateSearchIndex.__table__)
+        .where(EventDateSearchIndex.admin_unit_id.in_(admin_unit_ids))
+        .values(admin_unit_is_verified=admin_unit_is_verified)
+    )
+
+
+@listens_for(AdminUnitRelation, "after_insert")
+@listens_for(AdminUnitRelation, "after_update")
+@listens_for(AdminUnitRelation, "after_delete")
+def after_saving_admin_unit_relation(mapper, connection, relation):
+    admin_unit_ids = set()
+
+    for value in get_history(relation, "target_admin_unit_id").sum():
+        if value:
+            admin_unit_ids.add(value)
+
+    if admin_unit_ids:
+        refresh_admin_unit_is_verified(connection, admin_unit_ids)
+
+
+@listens_for(AdminUnit, "after_update")
+def after_updating_admin_unit(mapper, connection, admin_unit):
+    if not get_history(admin_unit, "can_verify_other").has_changes():
+        return
+
+    target_admin_unit_ids = select(AdminUnitRelation.target_admin_unit_id).where(
+        AdminUnitRelation.source_admin_unit_id == admin_unit.id
+    )
+    refresh_admin_unit_is_verified(connection, target_admin_unit_ids)
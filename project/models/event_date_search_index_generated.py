@@ -0,0 +1,187 @@
+from enum import IntEnum
+from flask_security import AsaList
+from geoalchemy2 import Geometry
+from project.extensions import db
+from sqlalchemy import (
+    Index,
+    Boolean,
+    DateTime,
+    Column,
+    Integer,
+    LargeBinary,
+    Numeric,
+    String,
+    Unicode,
+    UniqueConstraint,
+    ForeignKey,
+    UnicodeText,
+    CheckConstraint,
+    cast,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.orm import backref, deferred, relationship, remote
+from sqlalchemy_utils import ColorType
+import datetime
+from project.dbtypes import IntegerEnum
+from sqlalchemy.ext.declarative import declared_attr
+from geoalchemy2 import Geography
+
+
+class EventDateSearchIndexGeneratedMixin:
+    __tablename__ = "event_date_search_index"
+    __table_args__ = (
+        Index("idx_event_date_search_index_admin_unit_id", "admin_unit_id"),
+        Index("idx_event_date_search_index_event_id", "event_id"),
+        Index(
+            "idx_event_date_search_index_category_ids",
+            "category_ids",
+            postgresql_using="gin",
+        ),
+        Index("idx_event_date_search_index_tags", "tags", postgresql_using="gin"),
+        Index(
+            "idx_event_date_search_index_ts_vector", "ts_vector", postgresql_using="gin"
+        ),
+        Index(
+            "idx_event_date_search_index_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        UniqueConstraint("event_date_id"),
+    )
+
+    __model_name__ = "event_date_search_index"
+    __model_name_plural__ = "event_date_search_indexes"
+    __display_name__ = "Event date search index"
+    __display_name_plural__ = "Event date search indexes"
+
+    @declared_attr
+    def id(cls):
+        return Column(Integer(), primary_key=True)
+
+    @declared_attr
+    def start(cls):
+        return Column(DateTime(timezone=True), nullable=False, index=True)
+
+    @declared_attr
+    def end(cls):
+        return Column(DateTime(timezone=True), nullable=True)
+
+    @declared_attr
+    def allday(cls):
+        return Column(Boolean(), nullable=False, default=False, server_default="0")
+
+    @declared_attr
+    def public_status(cls):
+        return Column(Integer(), nullable=False)
+
+    @declared_attr
+    def status(cls):
+        return Column(Integer(), nullable=True)
+
+    @declared_attr
+    def admin_unit_is_verified(cls):
+        return Column(Boolean(), nullable=False, default=False, server_default="0")
+
+    @declared_attr
+    def organizer_id(cls):
+        return Column(Integer(), nullable=False, index=True)
+
+    @declared_attr
+    def event_place_id(cls):
+        return Column(Integer(), nullable=False, index=True)
+
+    @declared_attr
+    def rating(cls):
+        return Column(Integer(), nullable=True)
+
+    @declared_attr
+    def expected_participants(cls):
+        return Column(Integer(), nullable=True)
+
+    @declared_attr
+    def is_recurring(cls):
+        return Column(Boolean(), nullable=False, default=False, server_default="0")
+
+    @declared_attr
+    def city(cls):
+        return Column(Unicode(255), nullable=True)
+
+    @declared_attr
+    def postal_code(cls):
+        return Column(Unicode(255), nullable=True)
+
+    @declared_attr
+    def coordinate(cls):
+        return Column(Geography(geometry_type="POINT", srid=4326), nullable=True)
+
+    @declared_attr
+    def category_ids(cls):
+        return Column(
+            postgresql.ARRAY(Integer()),
+            nullable=False,
+            default=cast(
+                postgresql.array([], type_=Integer()), postgresql.ARRAY(Integer())
+            ),
+            server_default="{}",
+        )
+
+    @declared_attr
+    def tags(cls):
+        return Column(
+            postgresql.ARRAY(Unicode(255)),
+            nullable=False,
+            default=cast(
+                postgresql.array([], type_=Unicode(255)), postgresql.ARRAY(Unicode(255))
+            ),
+            server_default="{}",
+        )
+
+    @declared_attr
+    def search_text(cls):
+        return Column(UnicodeText(), nullable=True)
+
+    @declared_attr
+    def ts_vector(cls):
+        return Column(postgresql.TSVECTOR(), nullable=True)
+
+    @declared_attr
+    def event_date_id(cls):
+        return Column(
+            Integer(), ForeignKey("eventdate.id", ondelete="CASCADE"), nullable=False
+        )
+
+    @declared_attr
+    def event_id(cls):
+        return Column(
+            Integer(), ForeignKey("event.id", ondelete="CASCADE"), nullable=False
+        )
+
+    @declared_attr
+    def admin_unit_id(cls):
+        return Column(
+            Integer(), ForeignKey("adminunit.id", ondelete="CASCADE"), nullable=False
+        )
+
+    @declared_attr
+    def event_date(cls):
+        return relationship(
+            "EventDate",
+            foreign_keys=[cls.event_date_id],
+        )
+
+    @declared_attr
+    def event(cls):
+        return relationship(
+            "Event",
+            foreign_keys=[cls.event_id],
+        )
+
+    @declared_attr
+    def admin_unit(cls):
+        return relationship(
+            "AdminUnit",
+            foreign_keys=[cls.admin_unit_id],
+        )
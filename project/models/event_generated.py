@@ -57,6 +57,15 @@ class EventStatus(IntEnum):
 
 class EventGeneratedMixin(TrackableMixin):
     __tablename__ = "event"
+    __table_args__ = (
+        Index("idx_event_ts_vector", "ts_vector", postgresql_using="gin"),
+        Index(
+            "idx_event_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     __model_name__ = "event"
     __model_name_plural__ = "events"
@@ -152,6 +161,32 @@ class EventGeneratedMixin(TrackableMixin):
     def rating(cls):
         return Column(Integer(), default=50, nullable=True)
 
+    @declared_attr
+    def ts_vector(cls):
+        return deferred(Column(postgresql.TSVECTOR(), nullable=True))
+
+    @declared_attr
+    def min_start(cls):
+        return Column(DateTime(timezone=True), index=True, nullable=True)
+
+    @declared_attr
+    def max_date_end(cls):
+        return Column(DateTime(timezone=True), index=True, nullable=True)
+
+    @declared_attr
+    def is_recurring(cls):
+        return Column(
+            Boolean(), nullable=False, default=False, server_default="0", index=True
+        )
+
+    @declared_attr
+    def number_of_dates(cls):
+        return Column(Integer(), nullable=False, default=0, server_default="0")
+
+    @declared_attr
+    def number_of_references(cls):
+        return Column(Integer(), nullable=False, default=0, server_default="0")
+
     @declared_attr
     def admin_unit_id(cls):
         return Column(
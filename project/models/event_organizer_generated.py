@@ -31,7 +31,15 @@ from project.models.mixins.trackable_mixin import TrackableMixin
 
 class EventOrganizerGeneratedMixin(TrackableMixin):
     __tablename__ = "eventorganizer"
-    __table_args__ = (UniqueConstraint("name", "admin_unit_id"),)
+    __table_args__ = (
+        Index(
+            "idx_eventorganizer_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        UniqueConstraint("name", "admin_unit_id"),
+    )
 
     __model_name__ = "event_organizer"
     __model_name_plural__ = "event_organizers"
@@ -31,7 +31,15 @@ from project.models.mixins.trackable_mixin import TrackableMixin
 
 class EventPlaceGeneratedMixin(TrackableMixin):
     __tablename__ = "eventplace"
-    __table_args__ = (UniqueConstraint("name", "admin_unit_id"),)
+    __table_args__ = (
+        Index(
+            "idx_eventplace_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        UniqueConstraint("name", "admin_unit_id"),
+    )
 
     __model_name__ = "event_place"
     __model_name_plural__ = "event_places"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from flask import current_app
+from sqlalchemy import inspect
 from sqlalchemy.event import listens_for
 
 from project.domain.models.entities.image_entity import ImageEntity
@@ -11,7 +13,10 @@ from project.utils import make_check_violation
 
 class Image(db.Model, ImageGeneratedMixin, IOwned):
     def fill_from_entity(self, value: ImageEntity):
-        self.data = value.data
+        # Assigning unchanged data would move it out of the storage again
+        if not self.has_data(value.data):
+            self.data = value.data
+
         self.encoding_format = value.encoding_format
         self.copyright_text = value.copyright_text
         self.license_id = value.license_id
@@ -20,14 +25,44 @@ class Image(db.Model, ImageGeneratedMixin, IOwned):
         return ImageEntity(
             id=self.id,
             hash=self.get_hash(),
-            data=self.data,
+            data=self.get_data(),
             encoding_format=self.encoding_format,
             copyright_text=self.copyright_text,
             license_id=self.license_id,
         )
 
     def is_empty(self):
-        return not self.data
+        return not self.storage_key and not self.data
+
+    def has_data(self, data: bytes | None) -> bool:
+        if self.storage_key:
+            return (
+                data is not None
+                and get_image_storage().get_key(data) == self.storage_key
+            )
+
+        return self.data == data
+
+    def get_data(self) -> bytes | None:
+        # Images that were not moved to the file store yet are read from the db
+        if self.storage_key:
+            data = get_image_storage().read(self.storage_key)
+
+            if data is not None:
+                return data
+
+        return self.data
+
+    def store_data(self):
+        # Without emitting SQL, so that unchanged data is not loaded
+        added = inspect(self).attrs.data.history.added
+
+        if not added or not added[0]:
+            return
+
+        data = added[0]
+        self.data = None
+        self.storage_key = get_image_storage().write(data)
 
     def get_file_extension(self):
         return self.encoding_format.split("/")[-1] if self.encoding_format else "png"
@@ -56,7 +91,19 @@ class Image(db.Model, ImageGeneratedMixin, IOwned):
             raise make_check_violation("Copyright text is required.")
 
 
+def get_image_storage():
+    return current_app.container.infrastructure.image_storage()
+
+
+@listens_for(Image.data, "set")
+def set_image_data(target, value, oldvalue, initiator):
+    target.storage_key = None
+
+
 @listens_for(Image, "before_insert")
 @listens_for(Image, "before_update")
 def before_saving_image(mapper, connect, self):
     self.validate()
+
+    if current_app.config["IMAGE_STORAGE_ENABLED"]:
+        self.store_data()
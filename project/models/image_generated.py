@@ -53,6 +53,10 @@ class ImageGeneratedMixin(TrackableMixin):
     def copyright_text(cls):
         return Column(Unicode(255), nullable=True)
 
+    @declared_attr
+    def storage_key(cls):
+        return Column(Unicode(64), index=True, nullable=True)
+
     @declared_attr
     def license_id(cls):
         return Column(
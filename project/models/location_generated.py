@@ -31,6 +31,14 @@ from project.models.mixins.trackable_mixin import TrackableMixin
 
 class LocationGeneratedMixin(TrackableMixin):
     __tablename__ = "location"
+    __table_args__ = (
+        Index(
+            "idx_location_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+    )
 
     __model_name__ = "location"
     __model_name_plural__ = "locations"
@@ -8,10 +8,17 @@ from project.models.webhook_generated import WebhookGeneratedMixin
 
 class Webhook(db.Model, WebhookGeneratedMixin, IOwned):
     def fill_from_value_object(self, value: WebhookValueObject):
+        # Re-enabling a webhook closes its circuit
+        if self.disabled and not value.disabled:
+            self.consecutive_failures = 0
+            self.failing_since = None
+            self.circuit_open_until = None
+
         self.url = value.url
         self.secret = value.secret
         self.disabled = value.disabled
         self.event_types = value.event_types
+        self.debounce_seconds = value.debounce_seconds
 
     def to_value_object(self) -> WebhookValueObject:
         return WebhookValueObject(
@@ -19,6 +26,7 @@ class Webhook(db.Model, WebhookGeneratedMixin, IOwned):
             secret=self.secret,
             disabled=self.disabled,
             event_types=self.event_types,
+            debounce_seconds=self.debounce_seconds,
         )
 
     def is_enabled_for_event_type(self, event_type: str) -> bool:
@@ -48,7 +48,9 @@ class WebhookDelivery(db.Model, WebhookDeliveryGeneratedMixin):
         return aggregate
 
     @classmethod
-    def to_read_model(cls, model: WebhookDelivery) -> WebhookDeliveryReadModel:
+    def to_read_model(
+        cls, model: WebhookDelivery, attempt_count: int = 0
+    ) -> WebhookDeliveryReadModel:
         if model is None:  # pragma: no cover
             return None
 
@@ -59,7 +61,12 @@ class WebhookDelivery(db.Model, WebhookDeliveryGeneratedMixin):
                 payload=model.webhook_event.payload,
             ),
             webhook=WebhookReadModel(
-                url=model.webhook.url, secret=model.webhook.secret
+                id=model.webhook.id,
+                url=model.webhook.url,
+                secret=model.webhook.secret,
+                consecutive_failures=model.webhook.consecutive_failures or 0,
+                failing_since=model.webhook.failing_since,
             ),
             app_installation_id=model.app_installation_id,
+            attempt_count=attempt_count,
         )
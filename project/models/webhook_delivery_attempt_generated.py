@@ -30,6 +30,11 @@ from sqlalchemy.ext.declarative import declared_attr
 
 class WebhookDeliveryAttemptGeneratedMixin:
     __tablename__ = "webhook_delivery_attempt"
+    __table_args__ = (
+        Index(
+            "idx_webhook_delivery_attempt_webhook_delivery_id", "webhook_delivery_id"
+        ),
+    )
 
     __model_name__ = "webhook_delivery_attempt"
     __model_name_plural__ = "webhook_delivery_attempts"
@@ -40,6 +40,10 @@ class WebhookDeliveryGeneratedMixin:
     def id(cls):
         return Column(Integer(), primary_key=True)
 
+    @declared_attr
+    def next_attempt_at(cls):
+        return Column(DateTime(), index=True, nullable=True)
+
     @declared_attr
     def webhook_event_id(cls):
         return Column(
@@ -42,7 +42,7 @@ class WebhookEventGeneratedMixin:
 
     @declared_attr
     def timestamp(cls):
-        return Column(DateTime(), nullable=False)
+        return Column(DateTime(), nullable=False, index=True)
 
     @declared_attr
     def event_type(cls):
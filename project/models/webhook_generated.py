@@ -55,6 +55,22 @@ class WebhookGeneratedMixin:
     def disabled(cls):
         return Column(Boolean(), nullable=False, default=False, server_default="0")
 
+    @declared_attr
+    def consecutive_failures(cls):
+        return Column(Integer(), nullable=False, default=0, server_default="0")
+
+    @declared_attr
+    def failing_since(cls):
+        return Column(DateTime(), nullable=True)
+
+    @declared_attr
+    def circuit_open_until(cls):
+        return Column(DateTime(), nullable=True)
+
+    @declared_attr
+    def debounce_seconds(cls):
+        return Column(Integer(), nullable=True)
+
     @declared_attr
     def event_types(cls):
         return Column(
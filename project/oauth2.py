@@ -15,6 +15,7 @@ from flask import current_app
 from flask import request as flask_req
 from flask import url_for
 
+from project.api_auth_cache import query_token
 from project.extensions import db
 from project.models import (
     AppInstallation,
@@ -244,6 +245,14 @@ class JWTBearerGrant(_JWTBearerGrant):
         return False  # pragma: no cover
 
 
+def create_cached_bearer_token_validator(session, token_model):
+    class _BearerTokenValidator(create_bearer_token_validator(session, token_model)):
+        def authenticate_token(self, token_string):
+            return query_token(token_string)
+
+    return _BearerTokenValidator
+
+
 def config_oauth(app):
     """Initialize OAuth2 authorization with the Flask app."""
     import project.oauth2_extensions as oauth2_ext
@@ -275,5 +284,5 @@ def config_oauth(app):
     oauth2_ext.authorization.register_endpoint(MyIntrospectionEndpoint)
 
     # protect resource
-    bearer_cls = create_bearer_token_validator(db.session, OAuth2Token)
+    bearer_cls = create_cached_bearer_token_validator(db.session, OAuth2Token)
     require_oauth.register_token_validator(bearer_cls())
@@ -0,0 +1,131 @@
+import base64
+import datetime
+import json
+import math
+
+from flask import request
+from sqlalchemy import and_, tuple_
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 50
+
+
+def encode_cursor(values: tuple) -> str:
+    data = [
+        {"dt": value.isoformat()} if isinstance(value, datetime.datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = tuple(
+            (
+                datetime.datetime.fromisoformat(value["dt"])
+                if isinstance(value, dict)
+                else value
+            )
+            for value in json.loads(raw)
+        )
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    # Cursors only hold date times and ids
+    if not values or not all(
+        isinstance(value, (datetime.datetime, int)) and not isinstance(value, bool)
+        for value in values
+    ):
+        raise ValueError("Invalid cursor")
+
+    return values
+
+
+class Keyset:
+    def __init__(self, *columns, get_key):
+        # The query has to be ordered by exactly these columns
+        self.columns = columns
+        self.get_key = get_key
+
+    def get_cursor(self, item) -> str:
+        return encode_cursor(self.get_key(item))
+
+    def filter_after(self, query, values: tuple):
+        if len(values) != len(self.columns):
+            raise ValueError("Invalid cursor")
+
+        # The redundant range on the leading column lets the database use a
+        # single column index for the row comparison.
+        return query.filter(
+            and_(
+                self.columns[0] >= values[0],
+                tuple_(*self.columns) > tuple_(*values),
+            )
+        )
+
+
+class KeysetPagination:
+    """Continues after the key of the last item instead of skipping rows with an offset."""
+
+    page = None
+    prev_num = None
+    next_num = None
+
+    def __init__(
+        self,
+        query,
+        keyset: Keyset,
+        cursor: tuple | None,
+        per_page: int,
+        include_total: bool = True,
+    ):
+        self.per_page = per_page
+        self.has_prev = cursor is not None
+        self.total = query.order_by(None).count() if include_total else None
+
+        if cursor is not None:
+            query = keyset.filter_after(query, cursor)
+
+        # One extra row tells whether a next page exists without counting
+        items = query.limit(per_page + 1).all()
+        self.has_next = len(items) > per_page
+        self.items = items[:per_page]
+
+        # Only set if there is a next page, like in page mode
+        if self.has_next and self.items:
+            self.next_cursor = keyset.get_cursor(self.items[-1])
+
+    @property
+    def pages(self) -> int | None:
+        if self.total is None:
+            return None
+
+        return math.ceil(self.total / self.per_page) if self.total else 0
+
+
+def get_per_page() -> int:
+    per_page = request.args.get("per_page", DEFAULT_PER_PAGE, type=int)
+    return max(1, min(per_page, MAX_PER_PAGE))
+
+
+def paginate(
+    query,
+    keyset: Keyset | None = None,
+    cursor: tuple | None = None,
+    include_total: bool = True,
+):
+    if keyset and cursor is not None:
+        return KeysetPagination(query, keyset, cursor, get_per_page(), include_total)
+
+    if keyset and not include_total:
+        return KeysetPagination(query, keyset, None, get_per_page(), False)
+
+    pagination = query.paginate()
+
+    # Lets clients switch to keyset pagination after any page
+    if keyset and pagination.has_next and pagination.items:
+        pagination.next_cursor = keyset.get_cursor(pagination.items[-1])
+
+    return pagination
@@ -0,0 +1,100 @@
+import datetime
+import hashlib
+import json
+
+from authlib.integrations.flask_oauth2 import current_token
+from flask import Response, current_app, request
+from flask_babel import get_locale
+from flask_security import current_user
+
+from project.application.services.abstract_response_cache import AbstractResponseCache
+
+
+def get_response_cache() -> AbstractResponseCache:
+    return current_app.container.infrastructure.response_cache()
+
+
+def is_response_cacheable() -> bool:
+    # Responses of authenticated requests may contain non-public data
+    return (
+        current_app.config["RESPONSE_CACHE_TIMEOUT"] > 0
+        and request.method == "GET"
+        and not current_user.is_authenticated
+        and not current_token
+        and "Authorization" not in request.headers
+    )
+
+
+def get_response_cache_scope(admin_unit_id: int | None) -> str:
+    if admin_unit_id:
+        return AbstractResponseCache.get_admin_unit_scope(admin_unit_id)
+
+    return AbstractResponseCache.global_scope
+
+
+def get_response_cache_key(
+    response_cache: AbstractResponseCache, namespace: str, scope: str, key_data
+) -> str:
+    data = json.dumps(
+        {"key": key_data, "locale": str(get_locale())},
+        default=str,
+        sort_keys=True,
+    )
+    digest = hashlib.sha1(data.encode("utf-8")).hexdigest()
+    generation = response_cache.get_generation(scope)
+    return f"{namespace}:{scope}:{generation}:{digest}"
+
+
+def cached_response(
+    namespace: str, admin_unit_id: int | None, key_data, build_response
+) -> Response:
+    if not is_response_cacheable():
+        return build_response()
+
+    timeout = current_app.config["RESPONSE_CACHE_TIMEOUT"]
+    response_cache = get_response_cache()
+    scope = get_response_cache_scope(admin_unit_id)
+    key = get_response_cache_key(response_cache, namespace, scope, key_data)
+
+    cached = response_cache.get(key)
+
+    if cached:
+        entry = json.loads(cached)
+        response = Response(
+            entry["body"],
+            status=200,
+            mimetype=entry["mimetype"],
+            headers=entry["headers"],
+        )
+        created_at = datetime.datetime.fromtimestamp(
+            entry["created_at"], tz=datetime.timezone.utc
+        )
+    else:
+        response = build_response()
+
+        if response.status_code != 200:
+            return response
+
+        created_at = datetime.datetime.now(tz=datetime.timezone.utc).replace(
+            microsecond=0
+        )
+        entry = {
+            "body": response.get_data(as_text=True),
+            "mimetype": response.mimetype,
+            "headers": [
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() == "content-disposition"
+            ],
+            "created_at": created_at.timestamp(),
+        }
+        response_cache.set(key, json.dumps(entry).encode("utf-8"), timeout)
+
+    response.cache_control.public = True
+    response.cache_control.max_age = timeout
+    response.last_modified = created_at
+    response.set_etag(
+        hashlib.sha1(f"{key}:{entry['created_at']}".encode("utf-8")).hexdigest()
+    )
+    response.vary.update(("Cookie", "Authorization", "Accept-Language"))
+    return response.make_conditional(request)
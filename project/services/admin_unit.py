@@ -1,5 +1,8 @@
 import datetime
+from typing import Iterator
 
+import icalendar
+from flask import current_app
 from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import joinedload, load_only
 
@@ -51,7 +54,7 @@ def insert_admin_unit_for_user(admin_unit, user, invitation=None):
     if admin_unit.logo:
         organizer.logo = upsert_image_with_data(
             organizer.logo,
-            admin_unit.logo.data,
+            admin_unit.logo.get_data(),
             admin_unit.logo.encoding_format,
         )
     db.session.add(organizer)
@@ -165,6 +168,17 @@ def get_member_for_admin_unit_by_user_id(admin_unit_id, user_id):
     ).first()
 
 
+def get_members_for_user_id(user_id):
+    return (
+        AdminUnitMember.query.options(
+            joinedload(AdminUnitMember.roles),
+            joinedload(AdminUnitMember.admin_unit),
+        )
+        .filter(AdminUnitMember.user_id == user_id)
+        .all()
+    )
+
+
 def get_admin_unit_member(id):
     return AdminUnitMember.query.filter_by(id=id).first()
 
@@ -392,8 +406,8 @@ def get_admin_unit_organization_invitations(email):
 
 
 def create_ical_events_for_admin_unit(
-    admin_unit: AdminUnit,
-) -> list:  # list[icalendar.Event]
+    admin_unit: AdminUnit, from_request: bool = True
+) -> Iterator[icalendar.Event]:
     from dateutil.relativedelta import relativedelta
 
     from project.dateutils import get_today
@@ -402,7 +416,10 @@ def create_ical_events_for_admin_unit(
 
     params = EventSearchParams()
     params.include_admin_unit_references = True
-    params.load_from_request()
+
+    if from_request:
+        params.load_from_request()
+
     params.date_from = get_today() - relativedelta(months=1)
     params.admin_unit_id = admin_unit.id
     params.can_read_private_events = False
@@ -416,6 +433,9 @@ def get_admin_units_with_due_delete_request():
 
 
 def delete_admin_unit(admin_unit: AdminUnit):
+    current_app.container.infrastructure.ical_feed_store().remove_admin_unit_feeds(
+        admin_unit.id
+    )
     db.session.delete(admin_unit)
     db.session.commit()
 
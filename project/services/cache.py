@@ -8,3 +8,9 @@ def clear_images():
     current_app.logger.info("Clearing images..")
     clear_files_in_dir(img_path)
     current_app.logger.info("Done.")
+
+
+def evict_images():
+    current_app.logger.info("Evicting images..")
+    current_app.container.infrastructure.image_derivative_cache().evict()
+    current_app.logger.info("Done.")
@@ -1,10 +1,12 @@
+import datetime
+import io
 import json
 import os
-import shutil
+import zipfile
 
 from flask import current_app
-from sqlalchemy import and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, delete, not_, or_, select
+from sqlalchemy.orm import aliased, selectinload
 
 from project import dump_org_path, dump_path
 from project.api.event.schemas import EventDumpSchema
@@ -14,52 +16,75 @@ from project.api.organization.schemas import OrganizationDumpSchema
 from project.api.organizer.schemas import OrganizerDumpSchema
 from project.api.place.schemas import PlaceDumpSchema
 from project.extensions import db
-from project.imageutils import get_image_from_bytes
 from project.models import (
     AdminUnit,
+    AdminUnitRelation,
+    DumpTombstone,
     Event,
     EventCategory,
     EventOrganizer,
     EventPlace,
     EventPublicStatus,
     EventReference,
+    Image,
 )
+from project.models.dump_tombstone import dump_tombstone_entity_types
 from project.utils import clear_files_in_dir, make_dir
 
+DUMP_BATCH_SIZE = 500
+DUMP_MANIFEST_FILE_NAME = "manifest.json"
+
+# Rows are selected by their modification timestamp, which is taken before
+# the commit. The overlap catches rows of transactions that were still running
+# while the previous delta was written.
+DUMP_DELTA_OVERLAP = datetime.timedelta(minutes=10)
+
 
 class Dumper(object):
     def __init__(self, dump_base_path, file_base_name):
         self.dump_base_path = dump_base_path
         self.file_base_name = file_base_name
-        self.tmp_path = None
+        self.zip_file = None
 
     def dump(self):
-        self.setup_tmp_dir()
-        self.dump_data()
-        self.zip_tmp_dir()
-        self.clean_up_tmp_dir()
+        make_dir(self.dump_base_path)
+        zip_path = os.path.join(self.dump_base_path, self.file_base_name + ".zip")
+        tmp_zip_path = zip_path + ".tmp"
+
+        try:
+            with zipfile.ZipFile(tmp_zip_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                self.zip_file = zip_file
+                self.dump_data()
+
+            os.replace(tmp_zip_path, zip_path)
+        finally:
+            self.zip_file = None
+
+            if os.path.exists(tmp_zip_path):
+                os.remove(tmp_zip_path)
+
+        current_app.logger.info(
+            f"Zipped all up to {zip_path} ({os.path.getsize(zip_path)} bytes)."
+        )
 
     def dump_data(self):
         # Events
         events = (
-            Event.query.join(Event.admin_unit)
-            .options(joinedload(Event.categories))
-            .filter(
-                and_(
-                    Event.public_status == EventPublicStatus.published,
-                    AdminUnit.is_verified,
-                )
-            )
-            .all()
+            self.filter_changed(Event.query.join(Event.admin_unit), Event)
+            .options(*get_event_dump_options())
+            .filter(get_event_dump_filter())
+            .order_by(Event.id)
         )
         self.dump_items(events, EventDumpSchema(many=True), "events")
 
         # Places
-        places = EventPlace.query.all()
+        places = self.filter_changed(EventPlace.query, EventPlace).order_by(
+            EventPlace.id
+        )
         self.dump_items(places, PlaceDumpSchema(many=True), "places")
 
         # Event categories
-        event_categories = EventCategory.query.all()
+        event_categories = EventCategory.query.order_by(EventCategory.id)
         self.dump_items(
             event_categories,
             EventCategoryDumpSchema(many=True),
@@ -67,60 +92,198 @@ class Dumper(object):
         )
 
         # Organizers
-        organizers = EventOrganizer.query.all()
+        organizers = self.filter_changed(EventOrganizer.query, EventOrganizer).order_by(
+            EventOrganizer.id
+        )
         self.dump_items(organizers, OrganizerDumpSchema(many=True), "organizers")
 
         # Organizations
-        organizations = AdminUnit.query.all()
+        organizations = self.filter_changed(AdminUnit.query, AdminUnit).order_by(
+            AdminUnit.id
+        )
         self.dump_items(
             organizations, OrganizationDumpSchema(many=True), "organizations"
         )
 
         # Event references
-        event_references = EventReference.query.all()
+        event_references = self.filter_changed(
+            EventReference.query, EventReference
+        ).order_by(EventReference.id)
         self.dump_items(
             event_references,
             EventReferenceDumpSchema(many=True),
             "event_references",
         )
 
-    def dump_items(self, items, schema, file_base_name):
-        result = schema.dump(items)
-        path = os.path.join(self.tmp_path, file_base_name + ".json")
+    def filter_changed(self, query, model):
+        return query
+
+    def dump_items(self, query, schema, file_base_name, get_image=None):
+        file_name = file_base_name + ".json"
+        count = 0
+        image_ids = list()
+
+        with self.open_text_entry(file_name) as outfile:
+            outfile.write("[")
+
+            for batch in self.iter_batches(query):
+                if count:
+                    outfile.write(",")
+
+                outfile.write(
+                    ",".join(
+                        json.dumps(item, ensure_ascii=False)
+                        for item in schema.dump(batch)
+                    )
+                )
+                count += len(batch)
+
+                if get_image:
+                    images = (get_image(item) for item in batch)
+                    image_ids.extend(image.id for image in images if image)
+
+                current_app.logger.debug(f"{count} item(s) written to {file_name}..")
+
+            outfile.write("]")
+
+        current_app.logger.info(
+            f"{count} item(s) dumped to {file_name}"
+            f" ({self.get_entry_size(file_name)} bytes)."
+        )
+
+        # A zip file can't be written to while an entry is open
+        self.dump_images(image_ids)
 
-        with open(path, "w") as outfile:
-            json.dump(result, outfile, ensure_ascii=False, indent=4)
+    def dump_item(self, item, schema, file_base_name):
+        file_name = file_base_name + ".json"
 
-        current_app.logger.info(f"{len(items)} item(s) dumped to {path}.")
+        with self.open_text_entry(file_name) as outfile:
+            json.dump(schema.dump(item), outfile, ensure_ascii=False)
 
-    def dump_item(self, items, schema, file_base_name):
-        result = schema.dump(items)
-        path = os.path.join(self.tmp_path, file_base_name + ".json")
+        current_app.logger.info(
+            f"Item dumped to {file_name} ({self.get_entry_size(file_name)} bytes)."
+        )
+
+    def iter_batches(self, query):
+        batch = list()
+
+        for item in query.yield_per(DUMP_BATCH_SIZE):
+            batch.append(item)
 
-        with open(path, "w") as outfile:
-            json.dump(result, outfile, ensure_ascii=False, indent=4)
+            if len(batch) >= DUMP_BATCH_SIZE:
+                yield batch
+                batch = list()
 
-        current_app.logger.info(f"Item dumped to {path}.")
+        if batch:
+            yield batch
 
-    def setup_tmp_dir(self):
-        self.tmp_path = os.path.join(self.dump_base_path, f"tmp-{self.file_base_name}")
-        make_dir(self.tmp_path)
+    def open_text_entry(self, file_name):
+        return io.TextIOWrapper(
+            self.zip_file.open(file_name, "w", force_zip64=True), encoding="utf-8"
+        )
+
+    def get_entry_size(self, file_name):
+        return self.zip_file.getinfo(file_name).file_size
 
-    def clean_up_tmp_dir(self):
-        shutil.rmtree(self.tmp_path, ignore_errors=True)
+    def dump_images(self, image_ids):
+        for start in range(0, len(image_ids), DUMP_BATCH_SIZE):
+            images = Image.query.filter(
+                Image.id.in_(image_ids[start : start + DUMP_BATCH_SIZE])
+            ).order_by(Image.id)
 
-    def zip_tmp_dir(self):
-        zip_base_name = os.path.join(self.dump_base_path, self.file_base_name)
-        zip_path = shutil.make_archive(zip_base_name, "zip", self.tmp_path)
-        current_app.logger.info(f"Zipped all up to {zip_path}.")
+            for image in images:
+                self.dump_image(image)
 
     def dump_image(self, image):
         if not image:
             return
 
         extension = image.get_file_extension()
-        file_path = os.path.join(self.tmp_path, f"{image.id}.{extension}")
-        get_image_from_bytes(image.data).save(file_path)
+        self.zip_file.writestr(f"{image.id}.{extension}", image.get_data())
+
+
+class DeltaDumper(Dumper):
+    def __init__(self, dump_base_path, file_base_name, since):
+        super().__init__(dump_base_path, file_base_name)
+        self.since = since
+
+    def dump_data(self):
+        super().dump_data()
+        self.dump_deleted()
+
+    def filter_changed(self, query, model):
+        return query.filter(self.get_changed_filter(model))
+
+    def get_changed_filter(self, model):
+        changed = model.last_modified_at >= self.since
+
+        # A changed verification affects the organization and whether its
+        # events are dumped, without touching their rows
+        if model is Event:
+            return or_(
+                changed,
+                Event.admin_unit_id.in_(self.select_verification_changed_ids()),
+            )
+
+        if model is AdminUnit:
+            return or_(
+                changed,
+                AdminUnit.id.in_(self.select_verification_changed_ids()),
+            )
+
+        return changed
+
+    def select_verification_changed_ids(self):
+        # Deleted relations are covered by the tombstones of the events
+        source_admin_unit = aliased(AdminUnit)
+        return (
+            select(AdminUnitRelation.target_admin_unit_id)
+            .join(
+                source_admin_unit,
+                AdminUnitRelation.source_admin_unit_id == source_admin_unit.id,
+            )
+            .where(
+                or_(
+                    AdminUnitRelation.last_modified_at >= self.since,
+                    and_(
+                        AdminUnitRelation.verify,
+                        source_admin_unit.last_modified_at >= self.since,
+                    ),
+                )
+            )
+        )
+
+    def dump_deleted(self):
+        deleted = {
+            entity_type: list() for entity_type in dump_tombstone_entity_types.values()
+        }
+
+        tombstones = db.session.execute(
+            select(DumpTombstone.entity_type, DumpTombstone.entity_id)
+            .where(DumpTombstone.deleted_at >= self.since)
+            .order_by(DumpTombstone.id)
+        )
+        for entity_type, entity_id in tombstones:
+            deleted[entity_type].append(entity_id)
+
+        # Events that are no longer public are removed for the consumers, too
+        hidden_event_ids = db.session.scalars(
+            select(Event.id)
+            .join(Event.admin_unit)
+            .where(
+                self.get_changed_filter(Event),
+                not_(get_event_dump_filter()),
+            )
+            .order_by(Event.id)
+        )
+        deleted["events"].extend(hidden_event_ids)
+
+        with self.open_text_entry("deleted.json") as outfile:
+            json.dump(deleted, outfile)
+
+        current_app.logger.info(
+            f"{sum(len(ids) for ids in deleted.values())} deleted item(s) dumped."
+        )
 
 
 class AdminUnitDumper(Dumper):
@@ -131,25 +294,32 @@ class AdminUnitDumper(Dumper):
     def dump_data(self):
         # Events
         events = (
-            Event.query.join(Event.admin_unit)
-            .options(joinedload(Event.categories))
+            Event.query.options(*get_event_dump_options())
             .filter(Event.admin_unit_id == self.admin_unit_id)
-            .all()
+            .order_by(Event.id)
+        )
+        self.dump_items(
+            events,
+            EventDumpSchema(many=True),
+            "events",
+            lambda event: event.photo,
         )
-        self.dump_items(events, EventDumpSchema(many=True), "events")
-        for event in events:
-            self.dump_image(event.photo)
 
         # Places
-        places = EventPlace.query.filter(
-            EventPlace.admin_unit_id == self.admin_unit_id
-        ).all()
-        self.dump_items(places, PlaceDumpSchema(many=True), "places")
-        for place in places:
-            self.dump_image(place.photo)
+        places = (
+            EventPlace.query.options(selectinload(EventPlace.photo))
+            .filter(EventPlace.admin_unit_id == self.admin_unit_id)
+            .order_by(EventPlace.id)
+        )
+        self.dump_items(
+            places,
+            PlaceDumpSchema(many=True),
+            "places",
+            lambda place: place.photo,
+        )
 
         # Event categories
-        event_categories = EventCategory.query.all()
+        event_categories = EventCategory.query.order_by(EventCategory.id)
         self.dump_items(
             event_categories,
             EventCategoryDumpSchema(many=True),
@@ -157,12 +327,17 @@ class AdminUnitDumper(Dumper):
         )
 
         # Organizers
-        organizers = EventOrganizer.query.filter(
-            EventOrganizer.admin_unit_id == self.admin_unit_id
-        ).all()
-        self.dump_items(organizers, OrganizerDumpSchema(many=True), "organizers")
-        for organizer in organizers:
-            self.dump_image(organizer.logo)
+        organizers = (
+            EventOrganizer.query.options(selectinload(EventOrganizer.logo))
+            .filter(EventOrganizer.admin_unit_id == self.admin_unit_id)
+            .order_by(EventOrganizer.id)
+        )
+        self.dump_items(
+            organizers,
+            OrganizerDumpSchema(many=True),
+            "organizers",
+            lambda organizer: organizer.logo,
+        )
 
         # Organizations
         organization = db.session.get(AdminUnit, self.admin_unit_id)
@@ -170,10 +345,141 @@ class AdminUnitDumper(Dumper):
         self.dump_image(organization.logo)
 
 
+def get_event_dump_filter():
+    return and_(
+        Event.public_status == EventPublicStatus.published,
+        AdminUnit.is_verified,
+    )
+
+
+def get_event_dump_options():
+    # selectinload instead of joinedload, since joined collections can't be
+    # combined with yield_per
+    return (
+        selectinload(Event.photo),
+        selectinload(Event.categories),
+        selectinload(Event.custom_categories),
+        selectinload(Event.co_organizers),
+        selectinload(Event.date_definitions),
+    )
+
+
 def dump_all():
+    until = datetime.datetime.utcnow()
     dumper = Dumper(dump_path, "all")
     dumper.dump()
 
+    manifest = read_dump_manifest()
+    manifest["full"] = {
+        "file": "all.zip",
+        "until": format_dump_timestamp(until),
+    }
+    write_dump_manifest(manifest)
+
+
+def dump_delta():
+    manifest = read_dump_manifest()
+
+    if manifest["deltas"]:
+        since = parse_dump_timestamp(manifest["deltas"][-1]["until"])
+    elif manifest["full"]:
+        since = parse_dump_timestamp(manifest["full"]["until"])
+    else:
+        current_app.logger.info("No previous dump, creating full dump instead.")
+        dump_all()
+        return
+
+    until = datetime.datetime.utcnow()
+    file_base_name = f"delta-{until:%Y%m%dT%H%M%S}"
+    dumper = DeltaDumper(dump_path, file_base_name, since - DUMP_DELTA_OVERLAP)
+    dumper.dump()
+
+    manifest["deltas"].append(
+        {
+            "file": file_base_name + ".zip",
+            "since": format_dump_timestamp(since),
+            "until": format_dump_timestamp(until),
+        }
+    )
+    prune_dump_deltas(manifest, until)
+    write_dump_manifest(manifest)
+
+    # Deletions before the start of this delta are contained in the delta files
+    db.session.execute(
+        delete(DumpTombstone).where(
+            DumpTombstone.deleted_at < since - DUMP_DELTA_OVERLAP
+        )
+    )
+    db.session.commit()
+
+
+def dump_scheduled():
+    manifest = read_dump_manifest()
+    full_interval = datetime.timedelta(
+        days=current_app.config["DUMP_FULL_INTERVAL_DAYS"]
+    )
+
+    if (
+        manifest["full"]
+        and os.path.exists(os.path.join(dump_path, manifest["full"]["file"]))
+        and parse_dump_timestamp(manifest["full"]["until"]) + full_interval
+        > datetime.datetime.utcnow()
+    ):
+        dump_delta()
+    else:
+        dump_all()
+
+
+def prune_dump_deltas(manifest, now):
+    retention = datetime.timedelta(days=current_app.config["DUMP_DELTA_RETENTION_DAYS"])
+    deltas = list()
+
+    for delta in manifest["deltas"]:
+        if parse_dump_timestamp(delta["until"]) + retention > now:
+            deltas.append(delta)
+            continue
+
+        path = os.path.join(dump_path, delta["file"])
+        if os.path.exists(path):
+            os.remove(path)
+
+        current_app.logger.info(f"Removed delta dump {path}.")
+
+    manifest["deltas"] = deltas
+
+
+def read_dump_manifest():
+    path = os.path.join(dump_path, DUMP_MANIFEST_FILE_NAME)
+
+    if not os.path.exists(path):
+        return {"full": None, "deltas": list()}
+
+    with open(path) as infile:
+        return json.load(infile)
+
+
+def write_dump_manifest(manifest):
+    make_dir(dump_path)
+    path = os.path.join(dump_path, DUMP_MANIFEST_FILE_NAME)
+    tmp_path = path + ".tmp"
+
+    with open(tmp_path, "w") as outfile:
+        json.dump(manifest, outfile, indent=4)
+
+    os.replace(tmp_path, path)
+
+
+def format_dump_timestamp(value: datetime.datetime) -> str:
+    return value.replace(tzinfo=datetime.timezone.utc).isoformat()
+
+
+def parse_dump_timestamp(value: str) -> datetime.datetime:
+    return (
+        datetime.datetime.fromisoformat(value)
+        .astimezone(datetime.timezone.utc)
+        .replace(tzinfo=None)
+    )
+
 
 def dump_admin_unit(admin_unit_id):
     dumper = AdminUnitDumper(dump_org_path, admin_unit_id)
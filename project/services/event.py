@@ -1,18 +1,35 @@
 import datetime
 import os
+from typing import Iterator
 
 import icalendar
 from dateutil.relativedelta import relativedelta
 from flask import current_app, url_for
 from flask_babel import format_date, format_time, gettext
 from icalendar.prop import vDDDLists
-from sqlalchemy import and_, case, func, or_
+from sqlalchemy import (
+    Integer,
+    and_,
+    any_,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.orm import (
     aliased,
     contains_eager,
     defaultload,
     joinedload,
     lazyload,
+    load_only,
+    selectinload,
     undefer_group,
 )
 from sqlalchemy.sql import extract
@@ -29,11 +46,14 @@ from project.extensions import db
 from project.jinja_filters import url_for_image
 from project.models import (
     AdminUnit,
+    DumpTombstone,
     Event,
     EventAttendanceMode,
     EventCategory,
     EventDate,
     EventDateDefinition,
+    EventDateSearchIndex,
+    EventEventLists,
     EventList,
     EventOrganizer,
     EventPlace,
@@ -45,7 +65,16 @@ from project.models import (
     UserFavoriteEvents,
     sanitize_allday_instance,
 )
-from project.models.event_category import CustomEventCategory
+from project.models.dump_tombstone import dump_tombstone_entity_types
+from project.models.event import get_date_summary_values, get_unchanged_trackable_values
+from project.models.event_category import (
+    CustomEventCategory,
+    CustomEventCategorySet,
+    EventCustomEventCategories,
+    EventEventCategories,
+)
+from project.models.event_organizer import EventCoOrganizers
+from project.pagination import Keyset
 from project.services.reference import get_event_reference, upsert_event_reference
 from project.services.search_params import EventSearchParams
 from project.utils import get_place_str
@@ -56,18 +85,7 @@ def fill_event_filter(event_filter, params: EventSearchParams):
     event_filter = params.fill_trackable_filter(event_filter, Event)
 
     if params.keyword:
-        tq = func.websearch_to_tsquery("german", params.keyword)
-        like_keyword = "%" + params.keyword + "%"
-        event_filter = and_(
-            event_filter,
-            or_(
-                Event.__ts_vector__.op("@@")(tq),
-                Event.name.ilike(like_keyword),
-                EventPlace.name.ilike(like_keyword),
-                Location.city.ilike(like_keyword),
-                EventOrganizer.name.ilike(like_keyword),
-            ),
-        )
+        event_filter = and_(event_filter, get_event_keyword_filter(params.keyword))
 
     if params.category_id:
         if type(params.category_id) is list:
@@ -97,32 +115,7 @@ def fill_event_filter(event_filter, params: EventSearchParams):
             stati = [params.status]
         event_filter = and_(event_filter, Event.status.in_(stati))
 
-    if params.public_status:
-        if type(params.public_status) is list:
-            public_stati = params.public_status
-        else:  # pragma: no cover
-            public_stati = [params.public_status]
-    elif params.can_read_private_events:
-        public_stati = [
-            EventPublicStatus.published,
-            EventPublicStatus.planned,
-            EventPublicStatus.draft,
-        ]
-    else:
-        public_stati = [
-            EventPublicStatus.published,
-            EventPublicStatus.draft,
-        ]
-
-    if not params.can_read_private_events and EventPublicStatus.draft in public_stati:
-        public_stati.remove(EventPublicStatus.draft)
-
-    if (
-        not params.can_read_private_events
-        and not params.can_read_planned_events
-        and EventPublicStatus.planned in public_stati
-    ):
-        public_stati.remove(EventPublicStatus.planned)
+    public_stati = get_event_public_stati(params)
 
     if not params.can_read_private_events or not params.admin_unit_id:
         event_filter = and_(
@@ -218,6 +211,64 @@ def fill_event_filter(event_filter, params: EventSearchParams):
     return event_filter
 
 
+def get_event_keyword_filter(keyword: str):
+    # Each branch only touches a single table, so it can be answered by the
+    # GIN indexes (tsvector resp. pg_trgm) instead of filtering the joined rows.
+    tq = func.websearch_to_tsquery("german", keyword)
+    like_keyword = "%" + keyword + "%"
+
+    place = aliased(EventPlace)
+    location = aliased(Location)
+    organizer = aliased(EventOrganizer)
+
+    place_ids_by_name = select(place.id).where(place.name.ilike(like_keyword))
+    place_ids_by_city = (
+        select(place.id)
+        .join(location, place.location_id == location.id)
+        .where(location.city.ilike(like_keyword))
+    )
+    organizer_ids = select(organizer.id).where(organizer.name.ilike(like_keyword))
+
+    return or_(
+        Event.ts_vector.op("@@")(tq),
+        Event.name.ilike(like_keyword),
+        Event.event_place_id.in_(place_ids_by_name),
+        Event.event_place_id.in_(place_ids_by_city),
+        Event.organizer_id.in_(organizer_ids),
+    )
+
+
+def get_event_public_stati(params: EventSearchParams) -> list:
+    if params.public_status:
+        if type(params.public_status) is list:
+            public_stati = list(params.public_status)
+        else:  # pragma: no cover
+            public_stati = [params.public_status]
+    elif params.can_read_private_events:
+        public_stati = [
+            EventPublicStatus.published,
+            EventPublicStatus.planned,
+            EventPublicStatus.draft,
+        ]
+    else:
+        public_stati = [
+            EventPublicStatus.published,
+            EventPublicStatus.draft,
+        ]
+
+    if not params.can_read_private_events and EventPublicStatus.draft in public_stati:
+        public_stati.remove(EventPublicStatus.draft)
+
+    if (
+        not params.can_read_private_events
+        and not params.can_read_planned_events
+        and EventPublicStatus.planned in public_stati
+    ):
+        public_stati.remove(EventPublicStatus.planned)
+
+    return public_stati
+
+
 def add_tag_filter(event_filter, column, tag):
     if tag:
         tags = tag if type(tag) is list else [tag]
@@ -258,31 +309,256 @@ def fill_event_admin_unit_filter(event_filter, params: EventSearchParams):
     return admin_unit_reference, event_filter
 
 
-def get_event_date_range_filter(params: EventSearchParams):
-    date_filter = EventDate.start >= datetime.datetime.min
+def get_event_date_range_filter(params: EventSearchParams, klass=EventDate):
+    date_filter = klass.start >= datetime.datetime.min
 
     if params.date_from:
         date_filter = or_(
-            EventDate.start >= params.date_from,
-            and_(EventDate.end.isnot(None), EventDate.end >= params.date_from),
+            klass.start >= params.date_from,
+            and_(klass.end.isnot(None), klass.end >= params.date_from),
         )
 
     if params.date_to:
         date_to_filter = or_(
-            EventDate.start < params.date_to,
-            and_(EventDate.end.isnot(None), EventDate.end < params.date_to),
+            klass.start < params.date_to,
+            and_(klass.end.isnot(None), klass.end < params.date_to),
         )
         date_filter = and_(date_filter, date_to_filter)
 
     # PostgreSQL specific https://stackoverflow.com/a/25597632
     if params.weekday and type(params.weekday) is list:
         weekdays = params.weekday
-        date_filter = and_(date_filter, extract("dow", EventDate.start).in_(weekdays))
+        date_filter = and_(date_filter, extract("dow", klass.start).in_(weekdays))
 
     return date_filter
 
 
+# Keyset pagination continues after the last (start, id) of the previous page
+event_date_keyset = Keyset(
+    EventDate.start,
+    EventDate.id,
+    get_key=lambda event_date: (event_date.start, event_date.id),
+)
+event_date_search_index_keyset = Keyset(
+    EventDateSearchIndex.start,
+    EventDateSearchIndex.event_date_id,
+    get_key=lambda event_date: (event_date.start, event_date.id),
+)
+event_keyset = Keyset(
+    Event.min_start,
+    Event.id,
+    get_key=lambda event: (event.min_start, event.id),
+)
+
+
+def get_events_keyset(params: EventSearchParams) -> Keyset | None:
+    if not params.is_sorted_by_start():
+        return None
+
+    return event_keyset
+
+
+def can_use_event_date_search_index(params: EventSearchParams) -> bool:
+    if not current_app.config.get("EVENT_DATE_SEARCH_INDEX_ENABLED"):
+        return False
+
+    # The index only holds columns that are kept current by domain events.
+    # Everything else is answered by the regular query.
+    if params.has_trackable_filter():
+        return False
+
+    if params.sort not in (None, "start", "-rating"):
+        return False
+
+    if params.sort == "-rating" and (
+        params.include_admin_unit_references or params.admin_unit_references_only
+    ):
+        return False
+
+    return not (
+        params.custom_category_set_id
+        or params.favored_by_user_id
+        or params.not_referenced_by_organization_id
+        or params.internal_tag
+    )
+
+
+def fill_event_date_search_index_filter(index_filter, params: EventSearchParams):
+    if params.keyword:
+        tq = func.websearch_to_tsquery("german", params.keyword)
+        like_keyword = "%" + params.keyword.lower() + "%"
+        index_filter = and_(
+            index_filter,
+            or_(
+                EventDateSearchIndex.ts_vector.op("@@")(tq),
+                EventDateSearchIndex.search_text.like(like_keyword),
+            ),
+        )
+
+    if params.category_id:
+        if type(params.category_id) is list:
+            category_ids = params.category_id
+        else:
+            category_ids = [params.category_id]
+        index_filter = and_(
+            index_filter,
+            EventDateSearchIndex.category_ids.overlap(category_ids),
+        )
+
+    if params.status:
+        if type(params.status) is list:
+            stati = params.status
+        else:  # pragma: no cover
+            stati = [params.status]
+        index_filter = and_(index_filter, EventDateSearchIndex.status.in_(stati))
+
+    if not params.can_read_private_events or not params.admin_unit_id:
+        index_filter = and_(index_filter, EventDateSearchIndex.admin_unit_is_verified)
+
+    index_filter = and_(
+        index_filter,
+        EventDateSearchIndex.public_status.in_(get_event_public_stati(params)),
+    )
+
+    if params.event_list_id:
+        if type(params.event_list_id) is list:
+            event_list_ids = params.event_list_id
+        else:
+            event_list_ids = [params.event_list_id]
+        index_filter = and_(
+            index_filter,
+            EventEventLists.query.filter(
+                EventEventLists.event_id == EventDateSearchIndex.event_id,
+                EventEventLists.list_id.in_(event_list_ids),
+            ).exists(),
+        )
+
+    if params.organizer_id:
+        index_filter = and_(
+            index_filter, EventDateSearchIndex.organizer_id == params.organizer_id
+        )
+
+    if params.event_place_id:
+        index_filter = and_(
+            index_filter, EventDateSearchIndex.event_place_id == params.event_place_id
+        )
+
+    if params.latitude and params.longitude and params.distance:
+        point = func.ST_GeogFromText(
+            "SRID=4326;POINT({} {})".format(params.longitude, params.latitude)
+        )
+        index_filter = and_(
+            index_filter,
+            func.ST_DWithin(
+                EventDateSearchIndex.coordinate, point, params.distance, False
+            ),
+        )
+
+    if params.postal_code:
+        if type(params.postal_code) is list:
+            postalCodes = params.postal_code
+        else:  # pragma: no cover
+            postalCodes = [params.postal_code]
+
+        index_filter = and_(
+            index_filter,
+            or_(
+                *[
+                    EventDateSearchIndex.postal_code.ilike(postalCode + "%")
+                    for postalCode in postalCodes
+                ]
+            ),
+        )
+
+    if params.tag:
+        tags = params.tag if type(params.tag) is list else [params.tag]
+        index_filter = and_(index_filter, EventDateSearchIndex.tags.contains(tags))
+
+    if params.exclude_recurring:
+        index_filter = and_(index_filter, ~EventDateSearchIndex.is_recurring)
+
+    if params.expected_participants_min:
+        index_filter = and_(
+            index_filter,
+            EventDateSearchIndex.expected_participants
+            >= params.expected_participants_min,
+        )
+
+    if params.admin_unit_id:
+        # References are maintained outside of the domain events,
+        # so they are resolved against the live table.
+        reference_exists = EventReference.query.filter(
+            EventReference.event_id == EventDateSearchIndex.event_id,
+            EventReference.admin_unit_id == params.admin_unit_id,
+        ).exists()
+
+        if params.admin_unit_references_only:
+            index_filter = and_(index_filter, reference_exists)
+        elif params.include_admin_unit_references:
+            index_filter = and_(
+                index_filter,
+                or_(
+                    EventDateSearchIndex.admin_unit_id == params.admin_unit_id,
+                    reference_exists,
+                ),
+            )
+        else:
+            index_filter = and_(
+                index_filter, EventDateSearchIndex.admin_unit_id == params.admin_unit_id
+            )
+
+    return index_filter
+
+
+def get_event_dates_query_from_search_index(params: EventSearchParams):
+    index_filter = fill_event_date_search_index_filter(1 == 1, params)
+    date_filter = get_event_date_range_filter(params, EventDateSearchIndex)
+
+    result = (
+        EventDate.query.join(
+            EventDateSearchIndex, EventDateSearchIndex.event_date_id == EventDate.id
+        )
+        .options(
+            joinedload(EventDate.event)
+            .joinedload(Event.event_place)
+            .joinedload(EventPlace.location),
+            joinedload(EventDate.event)
+            .joinedload(Event.categories)
+            .load_only(EventCategory.id, EventCategory.name),
+            joinedload(EventDate.event)
+            .joinedload(Event.organizer)
+            .load_only(EventOrganizer.id, EventOrganizer.name),
+            joinedload(EventDate.event).joinedload(Event.photo).load_only(Image.id),
+            joinedload(EventDate.event)
+            .joinedload(Event.admin_unit)
+            .load_only(AdminUnit.id, AdminUnit.name),
+        )
+        .filter(date_filter)
+        .filter(index_filter)
+    )
+
+    if params.sort == "-rating":
+        result = result.order_by(EventDateSearchIndex.rating.desc())
+
+    result = result.order_by(*event_date_search_index_keyset.columns)
+
+    return result
+
+
+def get_event_dates_keyset(params: EventSearchParams) -> Keyset | None:
+    if not params.is_sorted_by_start():
+        return None
+
+    if can_use_event_date_search_index(params):
+        return event_date_search_index_keyset
+
+    return event_date_keyset
+
+
 def get_event_dates_query(params: EventSearchParams):
+    if can_use_event_date_search_index(params):
+        return get_event_dates_query_from_search_index(params)
+
     event_filter = 1 == 1
 
     event_filter = fill_event_filter(event_filter, params)
@@ -328,7 +604,7 @@ def get_event_dates_query(params: EventSearchParams):
     )
 
     result = fill_event_query_order(result, admin_unit_reference, params)
-    result = result.order_by(EventDate.start)
+    result = result.order_by(*event_date_keyset.columns)
 
     return result
 
@@ -410,7 +686,121 @@ def get_event_with_details_or_404(event_id):
     )
 
 
+def _get_sorted_values_subquery(column, where):
+    return (
+        select(func.array_agg(aggregate_order_by(column, column)))
+        .where(where)
+        .scalar_subquery()
+    )
+
+
+def get_event_version(event_id: int):
+    # Cheap stand-in for the detailed event to answer conditional requests.
+    # Changes of the collections don't touch the event row, so their values
+    # are part of the version, too.
+    co_organizer = aliased(EventOrganizer)
+
+    return db.session.execute(
+        select(
+            Event.public_status,
+            AdminUnit.is_verified,
+            Event.last_modified_at,
+            AdminUnit.last_modified_at,
+            EventOrganizer.last_modified_at,
+            EventPlace.last_modified_at,
+            Image.last_modified_at,
+            _get_sorted_values_subquery(
+                func.concat_ws(
+                    "|",
+                    EventDateDefinition.start,
+                    EventDateDefinition.end,
+                    EventDateDefinition.allday,
+                    EventDateDefinition.recurrence_rule,
+                ),
+                EventDateDefinition.event_id == Event.id,
+            ),
+            _get_sorted_values_subquery(
+                EventEventCategories.category_id,
+                EventEventCategories.event_id == Event.id,
+            ),
+            # Custom categories are embedded with their names and aren't
+            # trackable, so their values are part of the version.
+            _get_sorted_values_subquery(
+                func.concat_ws(
+                    "|",
+                    CustomEventCategory.id,
+                    CustomEventCategory.name,
+                    CustomEventCategory.label,
+                    CustomEventCategorySet.name,
+                    CustomEventCategorySet.label,
+                ),
+                and_(
+                    EventCustomEventCategories.event_id == Event.id,
+                    CustomEventCategory.id == EventCustomEventCategories.category_id,
+                    CustomEventCategorySet.id == CustomEventCategory.category_set_id,
+                ),
+            ),
+            # Co-organizers are embedded with their names
+            _get_sorted_values_subquery(
+                func.concat_ws("|", co_organizer.id, co_organizer.last_modified_at),
+                and_(
+                    EventCoOrganizers.event_id == Event.id,
+                    co_organizer.id == EventCoOrganizers.organizer_id,
+                ),
+            ),
+        )
+        .select_from(Event)
+        .join(Event.admin_unit)
+        .outerjoin(Event.organizer)
+        .outerjoin(Event.event_place)
+        .outerjoin(Event.photo)
+        .where(Event.id == event_id)
+    ).first()
+
+
+def get_admin_unit_events_version(admin_unit_id: int):
+    # Deleted events don't leave a newer timestamp, but change the count
+    return db.session.execute(
+        select(func.count(Event.id), func.max(Event.last_modified_at)).where(
+            Event.admin_unit_id == admin_unit_id
+        )
+    ).first()
+
+
 def get_events_query(params: EventSearchParams):
+    return _get_events_query(params).options(
+        contains_eager(Event.event_place).contains_eager(EventPlace.location),
+        joinedload(Event.categories),
+        joinedload(Event.organizer),
+        joinedload(Event.photo),
+        joinedload(Event.admin_unit),
+    )
+
+
+def get_events_ical_query(params: EventSearchParams):
+    # Loads only what the iCal builder needs and no joined collections, so that
+    # the result can be fetched in batches with yield_per.
+    return _get_events_query(params).options(
+        load_only(
+            Event.id,
+            Event.name,
+            Event.description,
+            Event.status,
+            Event.attendance_mode,
+            Event.created_at,
+            Event.updated_at,
+            Event.admin_unit_id,
+            Event.organizer_id,
+            Event.event_place_id,
+        ),
+        contains_eager(Event.event_place).contains_eager(EventPlace.location),
+        contains_eager(Event.organizer).load_only(EventOrganizer.name),
+        contains_eager(Event.admin_unit).load_only(AdminUnit.name),
+        selectinload(Event.date_definitions),
+    )
+
+
+def _get_events_query(params: EventSearchParams):
     event_filter = 1 == 1
 
     event_filter = fill_event_filter(event_filter, params)
@@ -434,16 +824,10 @@ def get_events_query(params: EventSearchParams):
             isouter=True,
         )
 
-    result = result.options(
-        contains_eager(Event.event_place).contains_eager(EventPlace.location),
-        joinedload(Event.categories),
-        joinedload(Event.organizer),
-        joinedload(Event.photo),
-        joinedload(Event.admin_unit),
-    ).filter(event_filter)
+    result = result.filter(event_filter)
 
     result = fill_event_query_order(result, admin_unit_reference, params)
-    result = result.order_by(Event.min_start)
+    result = result.order_by(*event_keyset.columns)
 
     return result
 
@@ -470,63 +854,216 @@ def fill_event_query_order(result, admin_unit_reference, params: EventSearchPara
     return result
 
 
+RECURRING_DATES_BATCH_SIZE = 500
+RECURRING_DATES_SHARD_SIZE = 5000
+
+
 def get_recurring_events():
     return Event.query.filter(Event.is_recurring).all()
 
 
-def update_event_dates_with_recurrence_rule(event):
-    dates_to_add = list()
-    dates_to_remove = list(event.dates)
+def get_recurring_event_id_batches(
+    batch_size: int = RECURRING_DATES_BATCH_SIZE,
+    min_event_id: int | None = None,
+    max_event_id: int | None = None,
+):
+    last_event_id = min_event_id - 1 if min_event_id is not None else 0
 
-    for date_definition in event.date_definitions:
-        sanitize_allday_instance(date_definition)
-        start = date_definition.start
-        end = date_definition.end
+    while True:
+        query = select(EventDateDefinition.event_id).where(
+            func.coalesce(EventDateDefinition.recurrence_rule, "") != "",
+            EventDateDefinition.event_id > last_event_id,
+        )
 
-        if end:
-            time_difference = relativedelta(end, start)
+        if max_event_id is not None:
+            query = query.where(EventDateDefinition.event_id <= max_event_id)
 
-        if date_definition.recurrence_rule:
-            rr_dates = dates_from_recurrence_rule(
-                start, date_definition.recurrence_rule
+        event_ids = (
+            db.session.execute(
+                query.group_by(EventDateDefinition.event_id)
+                .order_by(EventDateDefinition.event_id)
+                .limit(batch_size)
             )
+            .scalars()
+            .all()
+        )
+
+        if not event_ids:
+            return
+
+        yield event_ids
+        last_event_id = event_ids[-1]
+
+
+def get_recurring_event_id_ranges(
+    shard_size: int = RECURRING_DATES_SHARD_SIZE,
+) -> list:
+    return [
+        (event_ids[0], event_ids[-1])
+        for event_ids in get_recurring_event_id_batches(shard_size)
+    ]
+
+
+def get_date_definition_occurrences(date_definition) -> list:
+    sanitize_allday_instance(date_definition)
+    start = date_definition.start
+    end = date_definition.end
+
+    if end:
+        time_difference = relativedelta(end, start)
+
+    if date_definition.recurrence_rule:
+        rr_dates = dates_from_recurrence_rule(start, date_definition.recurrence_rule)
+    else:
+        rr_dates = [start]
+
+    result = list()
+
+    for rr_date in rr_dates:
+        rr_date_start = date_add_time(
+            rr_date, start.hour, start.minute, start.second, rr_date.tzinfo
+        )
+
+        if end:
+            rr_date_end = rr_date_start + time_difference
         else:
-            rr_dates = [start]
+            rr_date_end = None
 
-        for rr_date in rr_dates:
-            rr_date_start = date_add_time(
-                rr_date, start.hour, start.minute, start.second, rr_date.tzinfo
-            )
+        result.append((rr_date_start, rr_date_end, date_definition.allday))
 
-            if end:
-                rr_date_end = rr_date_start + time_difference
-            else:
-                rr_date_end = None
-
-            existing_date = next(
-                (
-                    date
-                    for date in event.dates
-                    if date.start == rr_date_start
-                    and date.end == rr_date_end
-                    and date.allday == date_definition.allday
-                ),
-                None,
+    return result
+
+
+def get_event_date_occurrences(date_definitions) -> dict:
+    # Keyed by (start, end, allday), insertion ordered
+    result = dict()
+
+    for date_definition in date_definitions:
+        for occurrence in get_date_definition_occurrences(date_definition):
+            result[occurrence] = None
+
+    return result
+
+
+def update_event_dates_with_recurrence_rule(event):
+    occurrences = get_event_date_occurrences(event.date_definitions)
+
+    existing_dates = dict()
+    for date in event.dates:
+        existing_dates.setdefault((date.start, date.end, date.allday), date)
+
+    dates_to_add = [
+        EventDate(event_id=event.id, start=start, end=end, allday=allday)
+        for start, end, allday in occurrences
+        if (start, end, allday) not in existing_dates
+    ]
+
+    event.dates = [
+        date for key, date in existing_dates.items() if key in occurrences
+    ] + dates_to_add
+    event.update_date_summary()
+
+
+def update_recurring_dates_for_events(event_ids: list) -> tuple:
+    date_definitions = EventDateDefinition.query.filter(
+        EventDateDefinition.event_id.in_(event_ids)
+    ).all()
+
+    occurrences_by_event = {event_id: dict() for event_id in event_ids}
+    for date_definition in date_definitions:
+        occurrences = occurrences_by_event[date_definition.event_id]
+        for occurrence in get_date_definition_occurrences(date_definition):
+            occurrences[occurrence] = None
+
+    existing_dates = db.session.execute(
+        select(
+            EventDate.id,
+            EventDate.event_id,
+            EventDate.start,
+            EventDate.end,
+            EventDate.allday,
+        ).where(EventDate.event_id.in_(event_ids))
+    ).all()
+
+    date_ids_to_remove = list()
+    existing_keys = set()
+    for date_id, event_id, start, end, allday in existing_dates:
+        key = (event_id, start, end, allday)
+
+        if (
+            key in existing_keys
+            or (start, end, allday) not in occurrences_by_event[event_id]
+        ):
+            date_ids_to_remove.append(date_id)
+        else:
+            existing_keys.add(key)
+
+    dates_to_add = [
+        {"event_id": event_id, "start": start, "end": end, "allday": allday}
+        for event_id, occurrences in occurrences_by_event.items()
+        for start, end, allday in occurrences
+        if (event_id, start, end, allday) not in existing_keys
+    ]
+
+    if date_ids_to_remove:
+        db.session.execute(
+            delete(EventDate).where(
+                EventDate.id
+                == any_(bindparam("date_ids", date_ids_to_remove, type_=ARRAY(Integer)))
+            ),
+            execution_options={"synchronize_session": False},
+        )
+
+    if dates_to_add:
+        db.session.execute(insert(EventDate), dates_to_add)
+
+    if date_ids_to_remove or dates_to_add:
+        update_event_summaries(Event.id.in_(event_ids))
+
+    return len(dates_to_add), len(date_ids_to_remove)
+
+
+def update_event_summaries(event_filter, include_references: bool = False) -> int:
+    table = Event.__table__
+    values = get_date_summary_values()
+
+    if include_references:
+        values["number_of_references"] = (
+            select(func.count())
+            .where(EventReference.event_id == table.c.id)
+            .scalar_subquery()
+        )
+
+    result = db.session.execute(
+        update(table)
+        .where(event_filter)
+        .values(**values, **get_unchanged_trackable_values(table))
+    )
+    return result.rowcount
+
+
+EVENT_SUMMARIES_BATCH_SIZE = 1000
+
+
+def backfill_event_summaries(batch_size: int = EVENT_SUMMARIES_BATCH_SIZE) -> int:
+    min_id, max_id = db.session.execute(
+        select(func.min(Event.id), func.max(Event.id))
+    ).one()
+    count = 0
+
+    if min_id is not None:
+        for start_id in range(min_id, max_id + 1, batch_size):
+            end_id = start_id + batch_size - 1
+            count += update_event_summaries(
+                Event.id.between(start_id, end_id), include_references=True
+            )
+            db.session.commit()
+            current_app.logger.info(
+                f"{count} event(s) updated up to id {end_id} of {max_id}.."
             )
-            if existing_date:
-                if existing_date in dates_to_remove:
-                    dates_to_remove.remove(existing_date)
-            else:
-                new_date = EventDate(
-                    event_id=event.id,
-                    start=rr_date_start,
-                    end=rr_date_end,
-                    allday=date_definition.allday,
-                )
-                dates_to_add.append(new_date)
 
-    event.dates = [date for date in event.dates if date not in dates_to_remove]
-    event.dates.extend(dates_to_add)
+    current_app.logger.info(f"{count} event(s) updated.")
+    return count
 
 
 def get_upcoming_event_dates(event_id):
@@ -709,32 +1246,73 @@ def create_ical_events_for_event(event: Event) -> list:  # list[icalendar.Event]
     return result
 
 
+ICAL_EVENTS_BATCH_SIZE = 200
+
+
 def create_ical_events_for_search(
     params: EventSearchParams,
-) -> list:  # list[icalendar.Event]
-    result = list()
-    events = get_events_query(params).all()
+) -> Iterator[icalendar.Event]:
+    events = get_events_ical_query(params).yield_per(ICAL_EVENTS_BATCH_SIZE)
 
     for event in events:
-        ical_events = create_ical_events_for_event(event)
-        result.extend(ical_events)
-
-    return result
+        yield from create_ical_events_for_event(event)
 
 
-def update_recurring_dates():
+def update_recurring_dates(
+    min_event_id: int | None = None, max_event_id: int | None = None
+) -> dict:
     from sqlalchemy import text
 
     # Setting the timezone is neccessary for cli command
     db.session.execute(text("SET timezone TO :val;"), {"val": berlin_tz.zone})
 
-    events = get_recurring_events()
+    event_date_search_indexer = (
+        current_app.container.infrastructure.event_date_search_indexer()
+    )
+    event_count = 0
+    added_count = 0
+    removed_count = 0
+
+    for event_ids in get_recurring_event_id_batches(
+        min_event_id=min_event_id, max_event_id=max_event_id
+    ):
+        added, removed = update_recurring_dates_for_events(event_ids)
+
+        if added or removed:
+            event_date_search_indexer.index_events(event_ids)
 
-    for event in events:
-        update_event_dates_with_recurrence_rule(event)
         db.session.commit()
 
-    current_app.logger.info(f"{len(events)} event(s) were updated.")
+        event_count += len(event_ids)
+        added_count += added
+        removed_count += removed
+
+    current_app.logger.info(
+        f"{event_count} event(s) were updated"
+        f" ({added_count} date(s) added, {removed_count} date(s) removed)."
+    )
+
+    return {
+        "events": event_count,
+        "added": added_count,
+        "removed": removed_count,
+    }
+
+
+def rebuild_event_date_search_index():
+    from sqlalchemy import text
+
+    # Setting the timezone is neccessary for cli command
+    db.session.execute(text("SET timezone TO :val;"), {"val": berlin_tz.zone})
+
+    event_date_search_indexer = (
+        current_app.container.infrastructure.event_date_search_indexer()
+    )
+    event_date_search_indexer.rebuild()
+    db.session.commit()
+
+    count = EventDateSearchIndex.query.count()
+    current_app.logger.info(f"{count} event date(s) were indexed.")
 
 
 def create_bulk_event_references(admin_unit_id: int, postalCodes: list):
@@ -760,12 +1338,110 @@ def create_bulk_event_references(admin_unit_id: int, postalCodes: list):
         current_app.logger.info(url)
 
 
-def get_old_events():
+def get_old_event_filter():
     reference_date = datetime.datetime.now(datetime.UTC) - datetime.timedelta(days=366)
-    return (
-        Event.query.filter(
-            or_(Event.max_date_end.is_(None), Event.max_date_end < reference_date)
+    return and_(
+        or_(Event.max_date_end.is_(None), Event.max_date_end < reference_date),
+        Event.last_modified_at < reference_date,
+    )
+
+
+def get_old_events():
+    return Event.query.filter(get_old_event_filter()).all()
+
+
+OLD_EVENTS_PURGE_BATCH_SIZE = 1000
+
+
+def purge_old_events(
+    batch_size: int = OLD_EVENTS_PURGE_BATCH_SIZE, dry_run: bool = False
+) -> int:
+    old_event_filter = get_old_event_filter()
+
+    if dry_run:
+        count = db.session.scalar(select(func.count(Event.id)).where(old_event_filter))
+        current_app.logger.info(f"{count} old event(s) would be deleted.")
+        return count
+
+    min_id, max_id = db.session.execute(
+        select(func.min(Event.id), func.max(Event.id))
+    ).one()
+    deleted_count = 0
+
+    if min_id is not None:
+        for start_id in range(min_id, max_id + 1, batch_size):
+            end_id = start_id + batch_size - 1
+            count = purge_old_events_in_range(start_id, end_id, old_event_filter)
+            db.session.commit()
+
+            if count:
+                deleted_count += count
+                current_app.logger.info(
+                    f"{deleted_count} old event(s) deleted up to id {end_id}"
+                    f" of {max_id}.."
+                )
+
+    current_app.logger.info(f"{deleted_count} old event(s) deleted.")
+    return deleted_count
+
+
+def purge_old_events_in_range(start_id: int, end_id: int, old_event_filter) -> int:
+    event_ids = (
+        db.session.execute(
+            select(Event.id)
+            .where(Event.id.between(start_id, end_id), old_event_filter)
+            .with_for_update(skip_locked=True)
+        )
+        .scalars()
+        .all()
+    )
+
+    if not event_ids:
+        return 0
+
+    # Dates, definitions, references and the search index are deleted by the
+    # ON DELETE CASCADE foreign keys. A set-based delete does not fire the
+    # mapper events, so tombstones and photos are handled here.
+    deleted_at = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+    db.session.execute(
+        insert(DumpTombstone).from_select(
+            ["entity_type", "entity_id", "deleted_at"],
+            select(
+                literal(dump_tombstone_entity_types[EventReference]),
+                EventReference.id,
+                literal(deleted_at),
+            ).where(EventReference.event_id.in_(event_ids)),
+        )
+    )
+    photo_ids = (
+        db.session.execute(
+            delete(Event)
+            .where(Event.id.in_(event_ids))
+            .returning(Event.photo_id)
+            .execution_options(synchronize_session=False)
         )
-        .filter(Event.last_modified_at < reference_date)
+        .scalars()
         .all()
     )
+    photo_ids = [photo_id for photo_id in photo_ids if photo_id]
+
+    if photo_ids:
+        db.session.execute(
+            delete(Image)
+            .where(Image.id.in_(photo_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+    db.session.execute(
+        insert(DumpTombstone),
+        [
+            {
+                "entity_type": dump_tombstone_entity_types[Event],
+                "entity_id": event_id,
+                "deleted_at": deleted_at,
+            }
+            for event_id in event_ids
+        ],
+    )
+
+    return len(event_ids)
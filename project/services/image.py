@@ -1,7 +1,16 @@
 import base64
 
+from flask import current_app
+from sqlalchemy import bindparam, select, update
+
+from project.extensions import db
 from project.models import Image
 
+IMAGE_STORAGE_BATCH_SIZE = 100
+IMAGE_STORAGE_CHUNK_SIZE = 1000
+# Files of uploads that are not committed yet must not be removed
+IMAGE_STORAGE_MIN_ORPHAN_AGE = 60 * 60
+
 
 def upsert_image_with_data(image, data, encoding_format="image/jpeg"):
     if image is None:
@@ -17,3 +26,84 @@ def upsert_image_with_data(image, data, encoding_format="image/jpeg"):
 def upsert_image_with_base64_str(image, base64_str, encoding_format):
     data = base64.b64decode(base64_str)
     return upsert_image_with_data(image, data, encoding_format)
+
+
+def migrate_images_to_storage(batch_size: int = IMAGE_STORAGE_BATCH_SIZE) -> int:
+    image_storage = current_app.container.infrastructure.image_storage()
+    table = Image.__table__
+    last_id = 0
+    count = 0
+
+    while True:
+        rows = db.session.execute(
+            select(table.c.id, table.c.data)
+            .where(
+                table.c.id > last_id,
+                table.c.storage_key.is_(None),
+                table.c.data.is_not(None),
+            )
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+
+        if not rows:
+            break
+
+        params = [
+            {"image_id": image_id, "image_storage_key": image_storage.write(data)}
+            for image_id, data in rows
+        ]
+
+        # Trackable columns are kept, so that image URLs and derivatives stay valid
+        db.session.execute(
+            update(table)
+            .where(table.c.id == bindparam("image_id"))
+            .values(
+                storage_key=bindparam("image_storage_key"),
+                data=None,
+                updated_at=table.c.updated_at,
+                updated_by_id=table.c.updated_by_id,
+                updated_by_app_installation_id=table.c.updated_by_app_installation_id,
+            ),
+            params,
+        )
+        db.session.commit()
+
+        last_id = rows[-1].id
+        count += len(rows)
+        current_app.logger.info(f"{count} image(s) moved to storage..")
+
+    current_app.logger.info(f"{count} image(s) moved to storage.")
+    return count
+
+
+def remove_orphaned_stored_images() -> int:
+    image_storage = current_app.container.infrastructure.image_storage()
+    count = 0
+
+    def remove_unreferenced(keys):
+        referenced_keys = set(
+            db.session.scalars(
+                select(Image.storage_key).where(Image.storage_key.in_(keys))
+            )
+        )
+        orphaned_keys = [key for key in keys if key not in referenced_keys]
+
+        for key in orphaned_keys:
+            image_storage.delete(key)
+
+        return len(orphaned_keys)
+
+    keys = list()
+    for key in image_storage.iter_keys(min_age=IMAGE_STORAGE_MIN_ORPHAN_AGE):
+        keys.append(key)
+
+        if len(keys) >= IMAGE_STORAGE_CHUNK_SIZE:
+            count += remove_unreferenced(keys)
+            keys = list()
+
+    if keys:
+        count += remove_unreferenced(keys)
+
+    current_app.logger.info(f"{count} orphaned image file(s) removed.")
+    return count
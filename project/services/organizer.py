@@ -1,3 +1,6 @@
+from typing import Iterator
+
+import icalendar
 from sqlalchemy import and_
 
 from project.extensions import db
@@ -22,7 +25,7 @@ def upsert_event_organizer(admin_unit_id, name):
 
 def create_ical_events_for_organizer(
     organizer: EventOrganizer,
-) -> list:  # list[icalendar.Event]
+) -> Iterator[icalendar.Event]:
     from dateutil.relativedelta import relativedelta
 
     from project.dateutils import get_today
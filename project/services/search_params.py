@@ -38,6 +38,13 @@ class BaseSearchParams(object):
     def load_bool_param(self, param: str):
         return str_to_bool(request.args[param])
 
+    def get_cache_key_data(self) -> dict:
+        # Equivalent searches share a key regardless of the order of list values
+        return {
+            key: sorted(value, key=str) if isinstance(value, list) else value
+            for key, value in sorted(vars(self).items())
+        }
+
 
 class TrackableSearchParams(BaseSearchParams):
     def __init__(self):
@@ -61,6 +68,18 @@ class TrackableSearchParams(BaseSearchParams):
         )
         self.last_modified_at_to = kwargs.get("last_modified_at_to", self.created_at_to)
 
+    def has_trackable_filter(self) -> bool:
+        return any(
+            (
+                self.created_at_from,
+                self.created_at_to,
+                self.updated_at_from,
+                self.updated_at_to,
+                self.last_modified_at_from,
+                self.last_modified_at_to,
+            )
+        )
+
     def get_trackable_query(self, query, klass: Type[TrackableMixin]):
         filter = self.fill_trackable_filter(1 == 1, klass)
         return query.filter(filter)
@@ -244,6 +263,9 @@ class EventSearchParams(TrackableSearchParams):
             self.latitude = None
             self.longitude = None
 
+    def is_sorted_by_start(self) -> bool:
+        return self.sort in (None, "start")
+
     def set_default_date_range(self):
         today = get_today()
         self.date_from = today
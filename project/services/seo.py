@@ -1,30 +1,88 @@
+import datetime
+import gzip
 import os
 import shutil
+import tempfile
 from io import StringIO
+from xml.sax.saxutils import escape
 
 import requests
 from flask import current_app, url_for
-from sqlalchemy import and_
-from sqlalchemy.orm import load_only
+from sqlalchemy import and_, select
 
-from project import cache_path, robots_txt_path, sitemap_path
+from project import cache_path, robots_txt_path, sitemap_dir, sitemap_path
 from project.dateutils import get_today
+from project.extensions import db
 from project.models import AdminUnit, Event, EventDate, EventPublicStatus
 from project.utils import make_dir
 
+# Limits of the sitemap protocol per sitemap file
+SITEMAP_MAX_URLS = 50000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
 
-def generate_sitemap(pinggoogle: bool):
-    current_app.logger.info("Generating sitemap..")
-    make_dir(cache_path)
+SITEMAP_YIELD_PER = 1000
 
-    buf = StringIO()
-    buf.write('<?xml version="1.0" encoding="UTF-8"?>')
-    buf.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+SITEMAP_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>'
+SITEMAP_URLSET_START = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+SITEMAP_URLSET_END = "</urlset>"
+
+
+class SitemapWriter:
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.file_names = list()
+        self.url_count = 0
+        self._file = None
+        self._file_url_count = 0
+        self._file_bytes = 0
+
+    def add(self, loc: str, lastmod=None):
+        lastmod_tag = (
+            f"<lastmod>{lastmod.strftime('%Y-%m-%d')}</lastmod>" if lastmod else ""
+        )
+        entry = f"<url><loc>{escape(loc)}</loc>{lastmod_tag}</url>".encode("utf-8")
+
+        if self._file and (
+            self._file_url_count >= SITEMAP_MAX_URLS
+            or self._file_bytes + len(entry) + len(SITEMAP_URLSET_END)
+            > SITEMAP_MAX_BYTES
+        ):
+            self._close_file()
+
+        if not self._file:
+            self._open_file()
+
+        self._write(entry)
+        self._file_url_count += 1
+        self.url_count += 1
 
+    def close(self):
+        if self._file:
+            self._close_file()
+
+    def _open_file(self):
+        file_name = f"{self.prefix}-{len(self.file_names) + 1}.xml.gz"
+        self.file_names.append(file_name)
+        self._file = gzip.open(os.path.join(sitemap_dir, file_name), "wb")
+        self._file_url_count = 0
+        self._file_bytes = 0
+        self._write(f"{SITEMAP_XML_HEADER}{SITEMAP_URLSET_START}".encode("utf-8"))
+
+    def _close_file(self):
+        self._write(SITEMAP_URLSET_END.encode("utf-8"))
+        self._file.close()
+        self._file = None
+
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self._file_bytes += len(data)
+
+
+def _get_sitemap_event_rows():
     today = get_today()
-    events = (
-        Event.query.join(Event.admin_unit)
-        .options(load_only(Event.id, Event.created_at, Event.updated_at))
+    return db.session.execute(
+        select(Event.id, Event.last_modified_at)
+        .join(Event.admin_unit)
         .filter(Event.dates.any(EventDate.start >= today))
         .filter(
             and_(
@@ -32,31 +90,113 @@ def generate_sitemap(pinggoogle: bool):
                 AdminUnit.is_verified,
             )
         )
-        .all()
+        .order_by(Event.id)
+        .execution_options(yield_per=SITEMAP_YIELD_PER)
     )
-    current_app.logger.info(f"Found {len(events)} events")
-
-    for event in events:
-        loc = url_for("main.event", event_id=event.id)
-        lastmod = (
-            event.last_modified_at.strftime("%Y-%m-%d")
-            if event.last_modified_at
-            else None
+
+
+def _get_sitemap_event_date_rows():
+    today = get_today()
+    return db.session.execute(
+        select(EventDate.id, Event.last_modified_at)
+        .join(EventDate.event)
+        .join(Event.admin_unit)
+        .filter(EventDate.start >= today)
+        .filter(
+            and_(
+                Event.public_status == EventPublicStatus.published,
+                AdminUnit.is_verified,
+            )
         )
-        lastmod_tag = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
-        buf.write(f"<url><loc>{loc}</loc>{lastmod_tag}</url>")
+        .order_by(EventDate.id)
+        .execution_options(yield_per=SITEMAP_YIELD_PER)
+    )
 
-    buf.write("</urlset>")
 
-    with open(sitemap_path, "w") as fd:
-        buf.seek(0)
-        shutil.copyfileobj(buf, fd)
+def _get_sitemap_organization_rows():
+    return db.session.execute(
+        select(AdminUnit.id, AdminUnit.last_modified_at)
+        .filter(AdminUnit.is_verified)
+        .order_by(AdminUnit.id)
+        .execution_options(yield_per=SITEMAP_YIELD_PER)
+    )
+
+
+def _write_sitemap_index(file_names: list, lastmod):
+    # Write into a temp file and rename it, so that crawlers never see
+    # partially written index files.
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path, prefix=".tmp-", suffix=".xml")
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(SITEMAP_XML_HEADER)
+            f.write(
+                '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            )
+
+            for file_name in file_names:
+                loc = url_for("main.sitemaps", filename=file_name)
+                f.write(
+                    f"<sitemap><loc>{escape(loc)}</loc>"
+                    f"<lastmod>{lastmod.strftime('%Y-%m-%d')}</lastmod></sitemap>"
+                )
 
-    size = os.path.getsize(sitemap_path)
-    current_app.logger.info(f"Generated sitemap at {sitemap_path} ({size} Bytes)")
+            f.write("</sitemapindex>")
 
-    if size > 52428800:  # pragma: no cover
-        current_app.logger.error(f"Size of sitemap ({size} Bytes) is larger than 50MB.")
+        os.replace(tmp_path, sitemap_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _remove_old_sitemap_files(keep_generations: set):
+    for file_name in os.listdir(sitemap_dir):
+        if file_name.split("-", 1)[0] not in keep_generations:
+            os.remove(os.path.join(sitemap_dir, file_name))
+
+
+def generate_sitemap(pinggoogle: bool):
+    current_app.logger.info("Generating sitemap..")
+    make_dir(sitemap_dir)
+
+    # Files of a run are prefixed with its generation, so that the index
+    # never refers to files of a run in progress.
+    now = datetime.datetime.now(datetime.UTC)
+    generation = now.strftime("%Y%m%d%H%M%S")
+    previous_generations = {
+        file_name.split("-", 1)[0] for file_name in os.listdir(sitemap_dir)
+    }
+
+    sources = [
+        ("events", _get_sitemap_event_rows, "main.event", "event_id"),
+        ("eventdates", _get_sitemap_event_date_rows, "main.event_date", "id"),
+        ("organizations", _get_sitemap_organization_rows, "main.organizations", "path"),
+    ]
+    file_names = list()
+
+    for name, get_rows, endpoint, id_arg in sources:
+        writer = SitemapWriter(f"{generation}-{name}")
+
+        try:
+            for id, lastmod in get_rows():
+                writer.add(url_for(endpoint, **{id_arg: id}), lastmod)
+        finally:
+            writer.close()
+
+        current_app.logger.info(
+            f"Found {writer.url_count} {name} ({len(writer.file_names)} file(s))"
+        )
+        file_names.extend(writer.file_names)
+
+    _write_sitemap_index(file_names, now)
+
+    # Crawlers may still read the index of the previous run
+    latest_previous = sorted(previous_generations - {generation})[-1:]
+    _remove_old_sitemap_files({generation, *latest_previous})
+
+    current_app.logger.info(
+        f"Generated sitemap index at {sitemap_path} ({len(file_names)} sitemap(s))"
+    )
 
     if pinggoogle:  # pragma: no cover
         sitemap_url = requests.utils.quote(url_for("main.sitemap_xml"))
@@ -82,6 +222,10 @@ def generate_robots_txt():
     buf.write(f"Allow: /eventdates{os.linesep}")
     buf.write(f"Allow: /eventdate/{os.linesep}")
     buf.write(f"Allow: /event/{os.linesep}")
+    buf.write(f"Allow: /organizations/{os.linesep}")
+    buf.write(f"Disallow: /organizations/*/ical{os.linesep}")
+    buf.write(f"Disallow: /organizations/*/widget/{os.linesep}")
+    buf.write(f"Allow: /sitemaps/{os.linesep}")
 
     if os.path.exists(sitemap_path):
         sitemap_url = url_for("main.sitemap_xml")
@@ -11,8 +11,10 @@ from project.access import (
     has_access,
 )
 from project.dateutils import create_icalendar
+from project.ical_feed import get_ical_feed_store, is_ical_feed_servable, send_ical_feed
 from project.jsonld import get_sd_for_event_date
 from project.models import Event, EventCategory
+from project.response_cache import cached_response
 from project.services.event import (
     create_ical_events_for_event,
     get_event_with_details_or_404,
@@ -148,17 +150,28 @@ def send_event_report_mails(event: Event, report: dict):
 
 @main_bp.route("/event/<int:id>/ical")
 def event_ical(id):
+    if is_ical_feed_servable():
+        file_path = get_ical_feed_store().get_event_feed(id)
+
+        if file_path:
+            return send_ical_feed(file_path, f"event_{id}.ics")
+
     event = get_event_with_details_or_404(id)
     can_read_event_or_401(event)
 
-    ical_events = create_ical_events_for_event(event)
+    def build_response():
+        ical_events = create_ical_events_for_event(event)
 
-    cal = create_icalendar()
-    for ical_event in ical_events:
-        cal.add_component(ical_event)
+        cal = create_icalendar()
+        for ical_event in ical_events:
+            cal.add_component(ical_event)
+
+        return Response(
+            cal.to_ical(),
+            mimetype="text/calendar",
+            headers={"Content-disposition": f"attachment; filename=event_{id}.ics"},
+        )
 
-    return Response(
-        cal.to_ical(),
-        mimetype="text/calendar",
-        headers={"Content-disposition": f"attachment; filename=event_{id}.ics"},
+    return cached_response(
+        "event_ical", event.admin_unit_id, {"id": id}, build_response
     )
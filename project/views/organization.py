@@ -1,6 +1,7 @@
-from flask import Response, render_template
+from flask import Response, render_template, stream_with_context
 
-from project.dateutils import create_icalendar
+from project.dateutils import stream_icalendar
+from project.ical_feed import get_ical_feed_store, is_ical_feed_servable, send_ical_feed
 from project.models import AdminUnit
 from project.services.admin_unit import create_ical_events_for_admin_unit
 from project.views.main_blueprint import main_bp
@@ -15,17 +16,19 @@ def organizations(path=None):
 
 @main_bp.route("/organizations/<int:id>/ical")
 def organization_ical(id):
+    if is_ical_feed_servable():
+        file_path = get_ical_feed_store().get_admin_unit_feed(id)
+
+        if file_path:
+            return send_ical_feed(file_path, f"organization_{id}.ics")
+
     admin_unit = AdminUnit.query.get_or_404(id)
 
-    cal = create_icalendar()
-    cal.add("x-wr-calname", admin_unit.name)
+    # Streamed without the response cache, which would buffer the whole feed
     ical_events = create_ical_events_for_admin_unit(admin_unit)
 
-    for ical_event in ical_events:
-        cal.add_component(ical_event)
-
     return Response(
-        cal.to_ical(),
+        stream_with_context(stream_icalendar(ical_events, admin_unit.name)),
         mimetype="text/calendar",
         headers={"Content-disposition": f"attachment; filename=organization_{id}.ics"},
     )
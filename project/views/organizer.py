@@ -1,6 +1,6 @@
-from flask import Response, render_template
+from flask import Response, render_template, stream_with_context
 
-from project.dateutils import create_icalendar
+from project.dateutils import stream_icalendar
 from project.models import EventOrganizer
 from project.services.organizer import create_ical_events_for_organizer
 from project.views.main_blueprint import main_bp
@@ -16,15 +16,10 @@ def organizers(path=None):
 def organizer_ical(id):
     organizer = EventOrganizer.query.get_or_404(id)
 
-    cal = create_icalendar()
-    cal.add("x-wr-calname", organizer.name)
     ical_events = create_ical_events_for_organizer(organizer)
 
-    for ical_event in ical_events:
-        cal.add_component(ical_event)
-
     return Response(
-        cal.to_ical(),
+        stream_with_context(stream_icalendar(ical_events, organizer.name)),
         mimetype="text/calendar",
         headers={"Content-disposition": f"attachment; filename=organizer_{id}.ics"},
     )
@@ -14,7 +14,7 @@ from flask_babel import gettext
 from markupsafe import Markup
 from sqlalchemy import text
 
-from project import cache_path, dump_path, robots_txt_file, sitemap_file
+from project import cache_path, dump_path, robots_txt_file, sitemap_dir, sitemap_file
 from project.extensions import db, limiter
 from project.services.admin import upsert_settings
 from project.views.main_blueprint import main_bp
@@ -138,3 +138,8 @@ def robots_txt():
 @main_bp.route("/sitemap.xml")
 def sitemap_xml():
     return send_from_directory(cache_path, sitemap_file)
+
+
+@main_bp.route("/sitemaps/<path:filename>")
+def sitemaps(filename):
+    return send_from_directory(sitemap_dir, filename, mimetype="application/gzip")
@@ -161,18 +161,33 @@ def get_pagination_urls(pagination, **kwargs):
         if pagination.has_prev:
             args = request.args.copy()
             args.update(kwargs)
-            args["page"] = pagination.prev_num
-            result["prev_url"] = url_for(request.endpoint, **args)
+            args.pop("cursor", None)
+
+            # Cursor paginations only go forward
+            if pagination.prev_num:
+                args["page"] = pagination.prev_num
+                result["prev_url"] = url_for(request.endpoint, **args)
+
             args["page"] = 1
             result["first_url"] = url_for(request.endpoint, **args)
 
         if pagination.has_next:
             args = request.args.copy()
             args.update(kwargs)
-            args["page"] = pagination.next_num
-            result["next_url"] = url_for(request.endpoint, **args)
-            args["page"] = pagination.pages
-            result["last_url"] = url_for(request.endpoint, **args)
+            next_cursor = getattr(pagination, "next_cursor", None)
+
+            if next_cursor and not pagination.next_num:
+                args.pop("page", None)
+                args["cursor"] = next_cursor
+                result["next_url"] = url_for(request.endpoint, **args)
+            else:
+                args["page"] = pagination.next_num
+                result["next_url"] = url_for(request.endpoint, **args)
+
+            if pagination.pages:
+                args.pop("cursor", None)
+                args["page"] = pagination.pages
+                result["last_url"] = url_for(request.endpoint, **args)
 
     return result
 
@@ -1,7 +1,8 @@
-from flask import render_template, request
+from flask import make_response, render_template, request
 
 from project.forms.event_date import FindEventDateWidgetForm
 from project.models import AdminUnit
+from project.response_cache import cached_response
 from project.services.event import get_event_dates_query
 from project.services.search_params import EventSearchParams
 from project.views.event import get_event_category_choices
@@ -27,16 +28,32 @@ def widget_event_dates(id):
         params.admin_unit_id = admin_unit.id
 
     params.include_admin_unit_references = True
-    dates = get_event_dates_query(params).paginate()
-
-    return render_template(
-        "widget/event_date/list.html",
-        form=form,
-        styles=get_styles(admin_unit),
-        admin_unit=admin_unit,
-        params=params,
-        dates=dates.items,
-        pagination=get_pagination_urls(dates, id=id),
+
+    def build_response():
+        dates = get_event_dates_query(params).paginate()
+
+        return render_template(
+            "widget/event_date/list.html",
+            form=form,
+            styles=get_styles(admin_unit),
+            admin_unit=admin_unit,
+            params=params,
+            dates=dates.items,
+            pagination=get_pagination_urls(dates, id=id),
+        )
+
+    # Searches in event lists span organizations and use the global scope
+    return cached_response(
+        "widget_event_dates",
+        params.admin_unit_id,
+        {
+            "admin_unit_id": admin_unit.id,
+            "params": params.get_cache_key_data(),
+            "styles": get_styles(admin_unit),
+            "page": request.args.get("page"),
+            "per_page": request.args.get("per_page"),
+        },
+        lambda: make_response(build_response()),
     )
 
 
@@ -24,6 +24,59 @@ def test_read(client, app, db, seeder: Seeder, utils: UtilActions):
     assert response.json["status"] == "scheduled"
 
 
+def test_read_etag_version(client, app, db, seeder: Seeder, utils: UtilActions, mocker):
+    from project.models import Event
+
+    user_id, admin_unit_id = seeder.setup_api_access(user_access=False)
+    event_id = seeder.create_event(admin_unit_id)
+
+    url = utils.get_url("api_v1_event", id=event_id)
+    response = utils.get_json_ok(url)
+    etag = response.headers["ETag"]
+
+    get_event_mock = mocker.patch(
+        "project.api.event.resources.get_event_with_details_or_404"
+    )
+    response = utils.get_json(url, headers={"If-None-Match": etag})
+    utils.assert_status_code(response, 304)
+    get_event_mock.assert_not_called()
+    mocker.stopall()
+
+    # Changes of the date definitions don't touch the event row
+    with app.app_context():
+        event = db.session.get(Event, event_id)
+        event.date_definitions[0].recurrence_rule = "RRULE:FREQ=DAILY;COUNT=7"
+        db.session.commit()
+
+    response = utils.get_json(url, headers={"If-None-Match": etag})
+    utils.assert_response_ok(response)
+    assert response.headers["ETag"] != etag
+    etag = response.headers["ETag"]
+
+    # Co-organizers are embedded with their names
+    organizer_id = seeder.upsert_event_organizer(admin_unit_id, "Co")
+
+    with app.app_context():
+        from project.models import EventOrganizer
+
+        event = db.session.get(Event, event_id)
+        event.co_organizers = [db.session.get(EventOrganizer, organizer_id)]
+        db.session.commit()
+
+    response = utils.get_json(url, headers={"If-None-Match": etag})
+    utils.assert_response_ok(response)
+    etag = response.headers["ETag"]
+
+    with app.app_context():
+        organizer = db.session.get(EventOrganizer, organizer_id)
+        organizer.name = "Co renamed"
+        db.session.commit()
+
+    response = utils.get_json(url, headers={"If-None-Match": etag})
+    utils.assert_response_ok(response)
+    assert response.json["co_organizers"][0]["name"] == "Co renamed"
+
+
 def test_read_anonym(client, app, db, seeder: Seeder, utils: UtilActions):
     app.config["API_READ_ANONYM"] = True
     user_id, admin_unit_id = seeder.setup_base(log_in=False)
@@ -111,6 +164,41 @@ def test_list(client, seeder: Seeder, utils: UtilActions):
     assert response.json["items"][0]["id"] == event_id
 
 
+def test_list_cursor(client, seeder: Seeder, utils: UtilActions):
+    from project.dateutils import create_berlin_date
+
+    user_id, admin_unit_id = seeder.setup_api_access(user_access=False)
+    event_id = seeder.create_event(
+        admin_unit_id, start=create_berlin_date(2020, 10, 4, 10)
+    )
+    event_id_2 = seeder.create_event(
+        admin_unit_id, start=create_berlin_date(2020, 10, 3, 10)
+    )
+
+    url = utils.get_url("api_v1_event_list", per_page=1, include_total="false")
+    response = utils.get_json_ok(url)
+    assert response.json["items"][0]["id"] == event_id_2
+    assert response.json["total"] is None
+
+    url = utils.get_url(
+        "api_v1_event_list", per_page=1, cursor=response.json["next_cursor"]
+    )
+    response = utils.get_json_ok(url)
+    assert response.json["items"][0]["id"] == event_id
+    assert not response.json["has_next"]
+
+    url = utils.get_url("api_v1_event_search", per_page=1, include_total="false")
+    response = utils.get_json_ok(url)
+    assert response.json["items"][0]["id"] == event_id_2
+
+    url = utils.get_url(
+        "api_v1_event_search", per_page=1, cursor=response.json["next_cursor"]
+    )
+    response = utils.get_json_ok(url)
+    assert response.json["items"][0]["id"] == event_id
+    assert response.json["total"] == 2
+
+
 def test_search(client, seeder: Seeder, utils: UtilActions):
     user_id, admin_unit_id = seeder.setup_api_access(user_access=False)
     event_id = seeder.create_event(admin_unit_id)
@@ -58,6 +58,59 @@ def test_list(client, seeder: Seeder, utils: UtilActions):
     assert response.json["items"][0]["id"] == 1
 
 
+def test_list_cursor(client, seeder: Seeder, utils: UtilActions):
+    from project.dateutils import create_berlin_date
+
+    user_id, admin_unit_id = seeder.setup_api_access(user_access=False)
+    start = create_berlin_date(2020, 10, 3, 10)
+    seeder.create_event(admin_unit_id, start=start)
+    seeder.create_event(admin_unit_id, start=start)
+    seeder.create_event(admin_unit_id, start=create_berlin_date(2020, 10, 4, 10))
+
+    url = utils.get_url("api_v1_event_date_list", per_page=2)
+    response = utils.get_json_ok(url)
+    assert [item["id"] for item in response.json["items"]] == [1, 2]
+    assert response.json["total"] == 3
+    next_cursor = response.json["next_cursor"]
+
+    url = utils.get_url("api_v1_event_date_list", per_page=2, cursor=next_cursor)
+    response = utils.get_json_ok(url)
+    assert [item["id"] for item in response.json["items"]] == [3]
+    assert response.json["has_prev"]
+    assert not response.json["has_next"]
+    assert response.json["total"] == 3
+    assert "next_cursor" not in response.json
+
+    url = utils.get_url("api_v1_event_date_list", per_page=1, include_total="false")
+    response = utils.get_json_ok(url)
+    assert [item["id"] for item in response.json["items"]] == [1]
+    assert response.json["total"] is None
+    assert response.json["has_next"]
+
+    url = utils.get_url(
+        "api_v1_event_date_list",
+        per_page=1,
+        include_total="false",
+        cursor=response.json["next_cursor"],
+    )
+    response = utils.get_json_ok(url)
+    assert [item["id"] for item in response.json["items"]] == [2]
+
+    url = utils.get_url("api_v1_event_date_list", sort="-created_at")
+    response = utils.get_json_ok(url)
+    assert "next_cursor" not in response.json
+
+    url = utils.get_url(
+        "api_v1_event_date_list", sort="-created_at", cursor=next_cursor
+    )
+    response = utils.get_json(url)
+    utils.assert_response_unprocessable_entity(response)
+
+    url = utils.get_url("api_v1_event_date_list", cursor="Quatsch")
+    response = utils.get_json(url)
+    utils.assert_response_unprocessable_entity(response)
+
+
 def test_search(client, seeder: Seeder, utils: UtilActions, app, db):
     from project.dateutils import create_berlin_date
 
@@ -298,3 +351,49 @@ def test_search_reference_id(client, seeder: Seeder, utils: UtilActions):
 
     url = utils.get_url("api_v1_event_date_search", not_referenced="y")
     response = utils.get_json_ok(url, headers={"X-OrganizationId": str(admin_unit_id)})
+
+
+def test_search_event_date_search_index(
+    client, seeder: Seeder, utils: UtilActions, app, db
+):
+    user_id, admin_unit_id = seeder.setup_api_access(user_access=False)
+    event_id = seeder.create_event(admin_unit_id, name="Spezialveranstaltung")
+    seeder.create_event(admin_unit_id, draft=True)
+    seeder.create_event_unverified()
+
+    with app.app_context():
+        app.test_event_dispatcher.handle_pending_events()
+
+    app.config["EVENT_DATE_SEARCH_INDEX_ENABLED"] = True
+
+    url = utils.get_url("api_v1_event_date_search")
+    response = utils.get_json_ok(url)
+    assert len(response.json["items"]) == 1
+    assert response.json["items"][0]["event"]["id"] == event_id
+
+    url = utils.get_url("api_v1_event_date_search", keyword="spezial")
+    response = utils.get_json_ok(url)
+    assert len(response.json["items"]) == 1
+
+    url = utils.get_url("api_v1_event_date_search", keyword="Quatsch")
+    response = utils.get_json_ok(url)
+    assert len(response.json["items"]) == 0
+
+    url = utils.get_url(
+        "api_v1_event_date_search", coordinate="51.9077888,10.4333312", distance=500
+    )
+    utils.get_json_ok(url)
+
+    with app.app_context():
+        from project.models import AdminUnitRelation
+
+        relations = AdminUnitRelation.query.filter(
+            AdminUnitRelation.target_admin_unit_id == admin_unit_id
+        ).all()
+        for relation in relations:
+            db.session.delete(relation)
+        db.session.commit()
+
+    url = utils.get_url("api_v1_event_date_search")
+    response = utils.get_json_ok(url)
+    assert len(response.json["items"]) == 0
@@ -217,6 +217,24 @@ def test_events(client, seeder: Seeder, utils: UtilActions, as_app_installation:
     assert len(response.json["items"]) == 2
 
 
+def test_events_etag_version(client, seeder: Seeder, utils: UtilActions):
+    user_id, admin_unit_id = seeder.setup_api_access(user_access=False)
+    seeder.create_event(admin_unit_id)
+
+    url = utils.get_url("api_v1_organization_event_list", id=admin_unit_id)
+    response = utils.get_json_ok(url)
+    etag = response.headers["ETag"]
+
+    response = utils.get_json(url, headers={"If-None-Match": etag})
+    utils.assert_status_code(response, 304)
+
+    seeder.create_event(admin_unit_id)
+
+    response = utils.get_json(url, headers={"If-None-Match": etag})
+    utils.assert_response_ok(response)
+    assert len(response.json["items"]) == 2
+
+
 @pytest.mark.parametrize("user_access", [True, False])
 def test_event_search_internal_tags(
     client, seeder: Seeder, utils: UtilActions, app, db, user_access
@@ -381,6 +399,63 @@ def test_events_post_photo_too_small(client, seeder: Seeder, utils: UtilActions,
     assert error["message"] == "Image is too small (1x1px). At least 320x320px."
 
 
+def test_events_batch(client, seeder: Seeder, utils: UtilActions, app, db):
+    url, data, admin_unit_id, place_id, organizer_id = prepare_events_post_data(
+        seeder, utils
+    )
+    event_id = seeder.create_event(admin_unit_id)
+    other_admin_unit_id = seeder.create_admin_unit(
+        seeder.create_user("other@test.de"), "Other Crew"
+    )
+    other_event_id = seeder.create_event(other_admin_unit_id)
+
+    url = utils.get_url("api_v1_organization_event_batch", id=admin_unit_id)
+    response = utils.post_json(
+        url,
+        {
+            "items": [
+                data,
+                {**data, "id": event_id, "name": "Fest geändert"},
+                {**data, "name": None},
+                {**data, "id": other_event_id},
+            ]
+        },
+    )
+    utils.assert_response_ok(response)
+
+    items = response.json["items"]
+    assert len(items) == 4
+    assert items[0]["status"] == 201
+    assert items[1] == {"status": 200, "id": event_id}
+    assert items[2]["status"] == 422
+    assert items[2]["errors"][0]["field"] == "name"
+    assert items[3]["status"] == 404
+    assert items[3]["id"] == other_event_id
+
+    with app.app_context():
+        from project.models import Event
+
+        event = db.session.get(Event, items[0]["id"])
+        assert event.admin_unit_id == admin_unit_id
+        assert event.name == "Fest"
+
+        event = db.session.get(Event, event_id)
+        assert event.name == "Fest geändert"
+
+        event = db.session.get(Event, other_event_id)
+        assert event.name == "Name"
+
+
+def test_events_batch_too_many_items(client, seeder: Seeder, utils: UtilActions):
+    url, data, admin_unit_id, place_id, organizer_id = prepare_events_post_data(
+        seeder, utils
+    )
+
+    url = utils.get_url("api_v1_organization_event_batch", id=admin_unit_id)
+    response = utils.post_json(url, {"items": [data] * 101})
+    utils.assert_response_unprocessable_entity(response)
+
+
 def test_event_lists(client, seeder: Seeder, utils: UtilActions):
     _, admin_unit_id = seeder.setup_api_access(user_access=False)
     event_list_id = seeder.create_event_list(admin_unit_id, name="Meine Liste")
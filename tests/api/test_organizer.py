@@ -65,6 +65,43 @@ def test_organizers_post(client, seeder: Seeder, utils: UtilActions, app):
         assert float(location.longitude) == float("10.4333312")
 
 
+def test_organizers_batch(client, seeder: Seeder, utils: UtilActions, app, db):
+    user_id, admin_unit_id = seeder.setup_api_access()
+    organizer_id = seeder.upsert_default_event_organizer(admin_unit_id)
+
+    url = utils.get_url("api_v1_organization_organizer_batch", id=admin_unit_id)
+    response = utils.post_json(
+        url,
+        {
+            "items": [
+                {"name": "Neuer Organisator"},
+                {"name": "Neuer Organisator"},
+                {"id": organizer_id, "name": "Geänderter Organisator"},
+                {"id": True, "name": "Organisator"},
+                {"id": organizer_id + 1000, "name": "Organisator"},
+            ]
+        },
+    )
+    utils.assert_response_ok(response)
+
+    items = response.json["items"]
+    assert items[0]["status"] == 201
+    assert items[1]["status"] == 400
+    assert items[2] == {"status": 200, "id": organizer_id}
+    assert items[3]["status"] == 422
+    assert items[3]["errors"][0]["field"] == "id"
+    assert items[4]["status"] == 404
+
+    with app.app_context():
+        from project.models import EventOrganizer
+
+        organizer = db.session.get(EventOrganizer, items[0]["id"])
+        assert organizer.name == "Neuer Organisator"
+
+        organizer = db.session.get(EventOrganizer, organizer_id)
+        assert organizer.name == "Geänderter Organisator"
+
+
 def test_read(client, seeder: Seeder, utils: UtilActions):
     user_id, admin_unit_id = seeder.setup_api_access(user_access=False)
     organizer_id = seeder.upsert_default_event_organizer(admin_unit_id)
@@ -59,6 +59,38 @@ def test_places_post(
     utils.assert_response_bad_request(response)
 
 
+def test_places_batch(client, seeder: Seeder, utils: UtilActions, app, db):
+    user_id, admin_unit_id = seeder.setup_api_access()
+    place_id = seeder.upsert_default_event_place(admin_unit_id)
+
+    url = utils.get_url("api_v1_organization_place_batch", id=admin_unit_id)
+    response = utils.post_json(
+        url,
+        {
+            "items": [
+                {"name": "Neuer Ort"},
+                {"name": "Neuer Ort"},
+                {"id": place_id, "name": "Geänderter Ort"},
+            ]
+        },
+    )
+    utils.assert_response_ok(response)
+
+    items = response.json["items"]
+    assert items[0]["status"] == 201
+    assert items[1]["status"] == 400
+    assert items[2] == {"status": 200, "id": place_id}
+
+    with app.app_context():
+        from project.models import EventPlace
+
+        place = db.session.get(EventPlace, items[0]["id"])
+        assert place.name == "Neuer Ort"
+
+        place = db.session.get(EventPlace, place_id)
+        assert place.name == "Geänderter Ort"
+
+
 def test_read(client, app, db, seeder: Seeder, utils: UtilActions):
     user_id, admin_unit_id = seeder.setup_api_access(user_access=False)
     place_id = seeder.upsert_default_event_place(admin_unit_id)
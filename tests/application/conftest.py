@@ -3,8 +3,14 @@
 All tests in tests/application/ run without a real database.
 """
 
+import datetime
+
 import pytest
 
+from project.application.abstract_event_dispatcher import AbstractEventDispatcher
+from project.application.webhooks.app_installation_webhooks import (
+    app_installation_webhook_infos,
+)
 from project.domain.abstract_unit_of_work import AbstractUnitOfWork
 from project.domain.models.entities.actor import Actor
 
@@ -31,6 +37,10 @@ class FakeRepo:
         self._store[obj.id] = obj
         self.seen.add(obj)
 
+    def add_many(self, objs):
+        for obj in objs:
+            self.add(obj)
+
     def get(self, object_id):
         obj = self._store.get(object_id)
         if obj:
@@ -62,6 +72,39 @@ class FakeWebhookEventRepo(FakeRepo):
         return self.delete_count
 
 
+class FakeWebhookDeliveryRepo(FakeRepo):
+    def __init__(self, webhook_events):
+        super().__init__()
+        self.webhook_events = webhook_events
+        self.next_attempt_at_by_id = {}
+        self.circuits = {}
+
+    def get_debounced(self, app_installation_id, event_type, object_id):
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+
+        for delivery in reversed(list(self._store.values())):
+            next_attempt_at = self.next_attempt_at_by_id.get(delivery.id)
+            webhook_event = self.webhook_events._store.get(delivery.webhook_event_id)
+
+            if (
+                delivery.app_installation_id == app_installation_id
+                and next_attempt_at
+                and next_attempt_at > now
+                and webhook_event.event_type == event_type
+                and webhook_event.payload.get("id") == object_id
+            ):
+                return delivery
+
+        return None
+
+    def schedule_next_attempts(self, next_attempt_at_by_id):
+        self.next_attempt_at_by_id.update(next_attempt_at_by_id)
+
+    def update_webhook_circuits(self, circuits):
+        for circuit in circuits:
+            self.circuits[circuit.webhook_id] = circuit
+
+
 class FakeOrganizationMemberRepo(FakeRepo):
     def __init__(self):
         super().__init__()
@@ -96,10 +139,20 @@ class FakeOrgAppInstallationRepo(FakeRepo):
     def __init__(self):
         super().__init__()
         self._webhook_installations = []
+        self._webhook_event_types = None
 
     def get_all_with_webhook(self, admin_unit_id, permissions, event_type):
         return list(self._webhook_installations)
 
+    def get_webhook_event_types(self, admin_unit_id):
+        if self._webhook_event_types is not None:
+            return set(self._webhook_event_types)
+
+        if not self._webhook_installations:
+            return set()
+
+        return {info.event_type for info in app_installation_webhook_infos}
+
 
 # ---------------------------------------------------------------------------
 # Fake Unit of Work
@@ -115,7 +168,7 @@ class FakeUnitOfWork(AbstractUnitOfWork):
         self.event_places = FakeRepo()
         self.organizations = FakeRepo()
         self.webhook_events = FakeWebhookEventRepo()
-        self.webhook_deliveries = FakeRepo()
+        self.webhook_deliveries = FakeWebhookDeliveryRepo(self.webhook_events)
         self.webhook_delivery_attempts = FakeRepo()
         self.apps = FakeRepo()
         self.organization_app_installations = FakeOrgAppInstallationRepo()
@@ -129,6 +182,15 @@ class FakeUnitOfWork(AbstractUnitOfWork):
     def rollback(self):
         pass
 
+    def _begin_nested(self):
+        pass
+
+    def _release_nested(self):
+        pass
+
+    def _rollback_nested(self):
+        pass
+
 
 # ---------------------------------------------------------------------------
 # Service stubs
@@ -143,7 +205,7 @@ class FakeEmailService:
         self.calls.append({"users": users, "template": template, "context": context})
 
 
-class FakeEventDispatcher:
+class FakeEventDispatcher(AbstractEventDispatcher):
     def __init__(self):
         self.dispatched = []
 
@@ -0,0 +1,45 @@
+"""Unit tests for ApiAuthCacheEventHandler."""
+
+from project.application.event_handlers.api_auth_cache_event_handler import (
+    ApiAuthCacheEventHandler,
+)
+from project.domain import events
+from project.domain.models.entities.actor import Actor
+from project.domain.types.changed_value import ChangedValue
+from project.infrastructure.services.in_memory_api_auth_cache import (
+    InMemoryApiAuthCache,
+)
+
+
+class TestApiAuthCacheEventHandler:
+    def _make_handler(self):
+        cache = InMemoryApiAuthCache()
+        cache.set("token:a", {"token": {"id": 1}})
+        cache.set("api_key:b", {"id": 2})
+        handler = ApiAuthCacheEventHandler(api_auth_cache=cache)
+        return handler, cache
+
+    def test_app_installation_permissions_updated_invalidates_all(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.AppInstallationPermissionsUpdated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            app_id=10,
+            permissions=ChangedValue(old={"events:write"}, new={"events:read"}),
+        )
+        handler.handle(ev, uow)
+
+        assert cache.get("token:a") is None
+        assert cache.get("api_key:b") is None
+
+    def test_app_installation_deleted_invalidates_all(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.AppInstallationDeleted(
+            actor=Actor(), id=1, admin_unit_id=2, app_id=10
+        )
+        handler.handle(ev, uow)
+
+        assert cache.get("token:a") is None
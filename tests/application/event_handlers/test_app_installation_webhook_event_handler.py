@@ -16,6 +16,9 @@ from project.domain.models.value_objects.event_date_definition_value_object impo
 )
 from project.domain.models.value_objects.webhook_value_object import WebhookValueObject
 from project.domain.types.changed_value import ChangedValue
+from project.infrastructure.services.in_memory_webhook_subscription_cache import (
+    InMemoryWebhookSubscriptionCache,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -28,7 +31,7 @@ class _FakeInstallation:
         self.app_id = app_id
 
 
-def _setup_app_with_webhook(uow, app_id=10):
+def _setup_app_with_webhook(uow, app_id=10, debounce_seconds=None):
     app = AppAggregate.create(
         actor=Actor(),
         admin_unit_id=1,
@@ -50,10 +53,21 @@ def _setup_app_with_webhook(uow, app_id=10):
             "event.updated",
             "event.deleted",
         ],
+        debounce_seconds=debounce_seconds,
     )
     return app
 
 
+def _event_updated(old_status, new_status, **kwargs):
+    return events.EventUpdated(
+        actor=Actor(),
+        id=1,
+        admin_unit_id=2,
+        status=ChangedValue(old=old_status, new=new_status),
+        **kwargs,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -61,7 +75,10 @@ def _setup_app_with_webhook(uow, app_id=10):
 
 class TestAppInstallationWebhookEventHandler:
     def _handler(self):
-        return AppInstallationWebhookEventHandler(mapper_context=MagicMock())
+        return AppInstallationWebhookEventHandler(
+            mapper_context=MagicMock(),
+            webhook_subscription_cache=InMemoryWebhookSubscriptionCache(),
+        )
 
     def _make_event(self, event_cls):
         actor = Actor()
@@ -236,3 +253,181 @@ class TestAppInstallationWebhookEventHandler:
         self._handler().handle(ev, uow)
 
         assert len(uow.webhook_events._store) == 1
+
+    def test_event_updated_without_debounce_is_not_delayed(self, uow):
+        _setup_app_with_webhook(uow, app_id=10)
+        uow.organization_app_installations._webhook_installations = [
+            _FakeInstallation()
+        ]
+
+        handler = self._handler()
+        handler.handle(
+            _event_updated(EventStatus.scheduled, EventStatus.postponed), uow
+        )
+        handler.handle(
+            _event_updated(EventStatus.postponed, EventStatus.cancelled), uow
+        )
+
+        assert len(uow.webhook_events._store) == 2
+        assert len(uow.webhook_deliveries._store) == 2
+        assert uow.webhook_deliveries.next_attempt_at_by_id == {}
+
+    def test_event_updated_debounced_delays_delivery(self, uow):
+        _setup_app_with_webhook(uow, app_id=10, debounce_seconds=60)
+        uow.organization_app_installations._webhook_installations = [
+            _FakeInstallation()
+        ]
+
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        self._handler().handle(
+            _event_updated(EventStatus.scheduled, EventStatus.postponed), uow
+        )
+
+        assert len(uow.webhook_deliveries._store) == 1
+        delivery = list(uow.webhook_deliveries._store.values())[0]
+        next_attempt_at = uow.webhook_deliveries.next_attempt_at_by_id[delivery.id]
+        assert next_attempt_at >= now + datetime.timedelta(seconds=60)
+
+    def test_event_updated_debounced_merges_changes(self, uow):
+        _setup_app_with_webhook(uow, app_id=10, debounce_seconds=60)
+        uow.organization_app_installations._webhook_installations = [
+            _FakeInstallation()
+        ]
+
+        handler = self._handler()
+        handler.handle(
+            _event_updated(
+                EventStatus.scheduled,
+                EventStatus.postponed,
+                name=ChangedValue(old="Old", new="New"),
+                rating=ChangedValue(old=10, new=20),
+            ),
+            uow,
+        )
+        handler.handle(
+            _event_updated(
+                EventStatus.postponed,
+                EventStatus.cancelled,
+                name=ChangedValue(old="New", new="Old"),
+            ),
+            uow,
+        )
+
+        assert len(uow.webhook_events._store) == 1
+        assert len(uow.webhook_deliveries._store) == 1
+
+        payload = list(uow.webhook_events._store.values())[0].payload
+        assert payload["status"] == {
+            "old": EventStatus.scheduled,
+            "new": EventStatus.cancelled,
+        }
+        assert payload["rating"] == {"old": 10, "new": 20}
+        assert "name" not in payload
+
+    def test_event_updated_debounce_window_elapsed_creates_new_delivery(self, uow):
+        _setup_app_with_webhook(uow, app_id=10, debounce_seconds=60)
+        uow.organization_app_installations._webhook_installations = [
+            _FakeInstallation()
+        ]
+
+        handler = self._handler()
+        handler.handle(
+            _event_updated(EventStatus.scheduled, EventStatus.postponed), uow
+        )
+
+        # The sender picks up deliveries once they are due
+        delivery_id = list(uow.webhook_deliveries._store.keys())[0]
+        uow.webhook_deliveries.next_attempt_at_by_id[delivery_id] = (
+            datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        )
+
+        handler.handle(
+            _event_updated(EventStatus.postponed, EventStatus.cancelled), uow
+        )
+
+        assert len(uow.webhook_events._store) == 2
+        assert len(uow.webhook_deliveries._store) == 2
+
+    def test_event_updated_debounced_installation_gets_own_webhook_event(self, uow):
+        _setup_app_with_webhook(uow, app_id=10, debounce_seconds=60)
+        _setup_app_with_webhook(uow, app_id=11)
+        uow.organization_app_installations._webhook_installations = [
+            _FakeInstallation(installation_id=1, app_id=10),
+            _FakeInstallation(installation_id=2, app_id=11),
+            _FakeInstallation(installation_id=3, app_id=11),
+        ]
+
+        self._handler().handle(
+            _event_updated(EventStatus.scheduled, EventStatus.postponed), uow
+        )
+
+        deliveries = list(uow.webhook_deliveries._store.values())
+        assert len(uow.webhook_events._store) == 2
+        assert len(deliveries) == 3
+        assert deliveries[1].webhook_event_id == deliveries[2].webhook_event_id
+        assert deliveries[0].webhook_event_id != deliveries[1].webhook_event_id
+        assert list(uow.webhook_deliveries.next_attempt_at_by_id.keys()) == [
+            deliveries[0].id
+        ]
+
+    def test_event_created_is_not_debounced(self, uow):
+        _setup_app_with_webhook(uow, app_id=10, debounce_seconds=60)
+        uow.organization_app_installations._webhook_installations = [
+            _FakeInstallation()
+        ]
+
+        ev = events.EventCreated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            name="Event",
+            organizer_id=3,
+            event_place_id=4,
+            date_definitions=[],
+            dates=[],
+        )
+        self._handler().handle(ev, uow)
+
+        assert len(uow.webhook_deliveries._store) == 1
+        assert uow.webhook_deliveries.next_attempt_at_by_id == {}
+
+    def test_no_subscribers_skips_installation_lookup(self, uow):
+        cache = InMemoryWebhookSubscriptionCache()
+        handler = AppInstallationWebhookEventHandler(
+            mapper_context=MagicMock(), webhook_subscription_cache=cache
+        )
+        uow.organization_app_installations = MagicMock()
+        uow.organization_app_installations.get_webhook_event_types.return_value = {
+            "event.deleted"
+        }
+
+        ev = events.EventOrganizerCreated(
+            actor=Actor(), id=1, admin_unit_id=2, name="Org"
+        )
+        handler.handle(ev, uow)
+        handler.handle(ev, uow)
+
+        installations = uow.organization_app_installations
+        installations.get_webhook_event_types.assert_called_once_with(2)
+        installations.get_all_with_webhook.assert_not_called()
+        assert cache.get_event_types(2) == {"event.deleted"}
+        assert len(uow.webhook_events._store) == 0
+
+    def test_subscribers_are_looked_up(self, uow):
+        cache = InMemoryWebhookSubscriptionCache()
+        cache.set_event_types(2, {"event_organizer.created"})
+        handler = AppInstallationWebhookEventHandler(
+            mapper_context=MagicMock(), webhook_subscription_cache=cache
+        )
+        _setup_app_with_webhook(uow, app_id=10)
+        uow.organization_app_installations._webhook_installations = [
+            _FakeInstallation()
+        ]
+        uow.organization_app_installations._webhook_event_types = set()
+
+        ev = events.EventOrganizerCreated(
+            actor=Actor(), id=1, admin_unit_id=2, name="Org"
+        )
+        handler.handle(ev, uow)
+
+        assert len(uow.webhook_events._store) == 1
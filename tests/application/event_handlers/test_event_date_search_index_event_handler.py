@@ -0,0 +1,84 @@
+"""Unit tests for EventDateSearchIndexEventHandler."""
+
+from unittest.mock import MagicMock
+
+from project.application.event_handlers.event_date_search_index_event_handler import (
+    EventDateSearchIndexEventHandler,
+)
+from project.domain import events
+from project.domain.models.entities.actor import Actor
+from project.domain.types.changed_value import ChangedValue
+
+
+class TestEventDateSearchIndexEventHandler:
+    def _make_handler(self):
+        indexer = MagicMock()
+        return (
+            EventDateSearchIndexEventHandler(event_date_search_indexer=indexer),
+            indexer,
+        )
+
+    def test_event_created_indexes_event(self, uow):
+        handler, indexer = self._make_handler()
+
+        ev = events.EventCreated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            name="Event",
+            organizer_id=3,
+            event_place_id=4,
+            date_definitions=[],
+            dates=[],
+        )
+        handler.handle(ev, uow)
+
+        indexer.index_events.assert_called_once_with([1])
+
+    def test_event_updated_indexes_event(self, uow):
+        handler, indexer = self._make_handler()
+
+        ev = events.EventUpdated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            name=ChangedValue(old="old", new="new"),
+        )
+        handler.handle(ev, uow)
+
+        indexer.index_events.assert_called_once_with([1])
+
+    def test_event_deleted_removes_event(self, uow):
+        handler, indexer = self._make_handler()
+
+        ev = events.EventDeleted(actor=Actor(), id=1, admin_unit_id=2)
+        handler.handle(ev, uow)
+
+        indexer.remove_events.assert_called_once_with([1])
+        indexer.index_events.assert_not_called()
+
+    def test_event_place_updated_indexes_events_of_place(self, uow):
+        handler, indexer = self._make_handler()
+
+        ev = events.EventPlaceUpdated(
+            actor=Actor(),
+            id=4,
+            admin_unit_id=2,
+            name=ChangedValue(old="old", new="new"),
+        )
+        handler.handle(ev, uow)
+
+        indexer.index_events_of_event_place.assert_called_once_with(4)
+
+    def test_event_organizer_updated_indexes_events_of_organizer(self, uow):
+        handler, indexer = self._make_handler()
+
+        ev = events.EventOrganizerUpdated(
+            actor=Actor(),
+            id=3,
+            admin_unit_id=2,
+            name=ChangedValue(old="old", new="new"),
+        )
+        handler.handle(ev, uow)
+
+        indexer.index_events_of_organizer.assert_called_once_with(3)
@@ -0,0 +1,61 @@
+"""Unit tests for IcalFeedEventHandler."""
+
+from unittest.mock import MagicMock, call
+
+from project.application.event_handlers.ical_feed_event_handler import (
+    IcalFeedEventHandler,
+)
+from project.domain import events
+from project.domain.models.entities.actor import Actor
+
+
+class TestIcalFeedEventHandler:
+    def _make_handler(self, referencing_admin_unit_ids=None):
+        store = MagicMock()
+        event_read_repo = MagicMock()
+        event_read_repo.get_referencing_admin_unit_ids.return_value = (
+            referencing_admin_unit_ids or []
+        )
+        handler = IcalFeedEventHandler(
+            ical_feed_store=store, event_read_repo=event_read_repo
+        )
+        return handler, store, event_read_repo
+
+    def test_event_updated_invalidates_referencing_admin_units(self, uow):
+        handler, store, event_read_repo = self._make_handler([3])
+
+        ev = events.EventUpdated(actor=Actor(), id=1, admin_unit_id=2)
+        handler.handle(ev, uow)
+
+        store.render_event_feed.assert_called_once_with(1)
+        event_read_repo.get_referencing_admin_unit_ids.assert_called_once_with(1)
+        assert store.invalidate_admin_unit_feed.call_args_list == [call(2), call(3)]
+
+    def test_event_deleted(self, uow):
+        handler, store, event_read_repo = self._make_handler()
+
+        ev = events.EventDeleted(actor=Actor(), id=1, admin_unit_id=2)
+        handler.handle(ev, uow)
+
+        store.remove_event_feed.assert_called_once_with(1)
+        store.render_event_feed.assert_not_called()
+        event_read_repo.get_referencing_admin_unit_ids.assert_not_called()
+        store.invalidate_admin_unit_feed.assert_called_once_with(2)
+
+    def test_organizer_updated(self, uow):
+        handler, store, _ = self._make_handler()
+
+        ev = events.EventOrganizerUpdated(actor=Actor(), id=4, admin_unit_id=2)
+        handler.handle(ev, uow)
+
+        store.remove_event_feeds_of_organizer.assert_called_once_with(4)
+        store.invalidate_admin_unit_feed.assert_called_once_with(2)
+
+    def test_event_place_updated(self, uow):
+        handler, store, _ = self._make_handler()
+
+        ev = events.EventPlaceUpdated(actor=Actor(), id=5, admin_unit_id=2)
+        handler.handle(ev, uow)
+
+        store.remove_event_feeds_of_event_place.assert_called_once_with(5)
+        store.invalidate_admin_unit_feed.assert_called_once_with(2)
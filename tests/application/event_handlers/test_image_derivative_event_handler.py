@@ -0,0 +1,112 @@
+"""Unit tests for ImageDerivativeEventHandler."""
+
+from unittest.mock import MagicMock, call
+
+from project.application.event_handlers.image_derivative_event_handler import (
+    ImageDerivativeEventHandler,
+)
+from project.domain import events
+from project.domain.events.nested.image_for_event import ImageForEvent
+from project.domain.models.entities.actor import Actor
+from project.domain.types.changed_value import ChangedValue
+
+
+def _image(id):
+    return ImageForEvent(id=id, hash=1, encoding_format="image/png")
+
+
+class TestImageDerivativeEventHandler:
+    def _make_handler(self):
+        cache = MagicMock()
+        return ImageDerivativeEventHandler(image_derivative_cache=cache), cache
+
+    def test_event_created_renders_photo(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.EventCreated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            name="Event",
+            organizer_id=3,
+            event_place_id=4,
+            date_definitions=[],
+            dates=[],
+            photo=_image(5),
+        )
+        handler.handle(ev, uow)
+
+        cache.render_derivatives.assert_called_once_with(5)
+
+    def test_event_created_without_photo(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.EventCreated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            name="Event",
+            organizer_id=3,
+            event_place_id=4,
+            date_definitions=[],
+            dates=[],
+        )
+        handler.handle(ev, uow)
+
+        cache.render_derivatives.assert_not_called()
+
+    def test_event_updated_replaces_photo(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.EventUpdated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            photo=ChangedValue(old=_image(5), new=_image(6)),
+        )
+        handler.handle(ev, uow)
+
+        cache.remove_derivatives.assert_called_once_with(5)
+        cache.render_derivatives.assert_called_once_with(6)
+
+    def test_event_updated_removes_photo(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.EventUpdated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            photo=ChangedValue(old=_image(5), new=None),
+        )
+        handler.handle(ev, uow)
+
+        cache.remove_derivatives.assert_called_once_with(5)
+        cache.render_derivatives.assert_not_called()
+
+    def test_event_updated_without_photo_change(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.EventUpdated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            name=ChangedValue(old="old", new="new"),
+        )
+        handler.handle(ev, uow)
+
+        cache.remove_derivatives.assert_not_called()
+        cache.render_derivatives.assert_not_called()
+
+    def test_event_organizer_updated_replaces_logo(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.EventOrganizerUpdated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            logo=ChangedValue(old=None, new=_image(6)),
+        )
+        handler.handle(ev, uow)
+
+        cache.remove_derivatives.assert_not_called()
+        assert cache.render_derivatives.call_args_list == [call(6)]
@@ -0,0 +1,47 @@
+"""Unit tests for ResponseCacheEventHandler."""
+
+from unittest.mock import MagicMock
+
+from project.application.event_handlers.response_cache_event_handler import (
+    ResponseCacheEventHandler,
+)
+from project.domain import events
+from project.domain.models.entities.actor import Actor
+from project.infrastructure.services.in_memory_response_cache import (
+    InMemoryResponseCache,
+)
+
+
+class TestResponseCacheEventHandler:
+    def _make_handler(self, referencing_admin_unit_ids=None):
+        cache = InMemoryResponseCache()
+        event_read_repo = MagicMock()
+        event_read_repo.get_referencing_admin_unit_ids.return_value = (
+            referencing_admin_unit_ids or []
+        )
+        handler = ResponseCacheEventHandler(
+            response_cache=cache, event_read_repo=event_read_repo
+        )
+        return handler, cache, event_read_repo
+
+    def test_event_updated_invalidates_referencing_admin_units(self, uow):
+        handler, cache, event_read_repo = self._make_handler([3])
+
+        ev = events.EventUpdated(actor=Actor(), id=1, admin_unit_id=2)
+        handler.handle(ev, uow)
+
+        event_read_repo.get_referencing_admin_unit_ids.assert_called_once_with(1)
+        assert cache.get_generation("admin_unit:2") == 1
+        assert cache.get_generation("admin_unit:3") == 1
+        assert cache.get_generation("admin_unit:4") == 0
+        assert cache.get_generation(cache.global_scope) == 1
+
+    def test_event_deleted(self, uow):
+        handler, cache, event_read_repo = self._make_handler()
+
+        ev = events.EventDeleted(actor=Actor(), id=1, admin_unit_id=2)
+        handler.handle(ev, uow)
+
+        event_read_repo.get_referencing_admin_unit_ids.assert_not_called()
+        assert cache.get_generation("admin_unit:2") == 1
+        assert cache.get_generation(cache.global_scope) == 1
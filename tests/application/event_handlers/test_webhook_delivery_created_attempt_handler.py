@@ -10,7 +10,7 @@ from project.domain.models.entities.actor import Actor
 
 
 class TestWebhookDeliveryCreatedAttemptEventHandler:
-    def test_calls_send_webhook_delivery_sync_with_event_id(self, uow):
+    def test_dispatches_pending_deliveries(self, uow):
         service = MagicMock()
         actor = Actor()
         ev = events.WebhookDeliveryCreated(actor=actor, id=77)
@@ -20,4 +20,5 @@ class TestWebhookDeliveryCreatedAttemptEventHandler:
 
         handler.handle(ev, uow)
 
-        service.send_webhook_delivery_sync.assert_called_once_with(uow, 77)
+        service.dispatch_pending_webhook_deliveries.assert_called_once_with()
+        service.send_webhook_delivery_sync.assert_not_called()
@@ -0,0 +1,66 @@
+"""Unit tests for WebhookSubscriptionCacheEventHandler."""
+
+from project.application.event_handlers.webhook_subscription_cache_event_handler import (
+    WebhookSubscriptionCacheEventHandler,
+)
+from project.domain import events
+from project.domain.models.entities.actor import Actor
+from project.domain.types.changed_value import ChangedValue
+from project.infrastructure.services.in_memory_webhook_subscription_cache import (
+    InMemoryWebhookSubscriptionCache,
+)
+
+
+class TestWebhookSubscriptionCacheEventHandler:
+    def _make_handler(self):
+        cache = InMemoryWebhookSubscriptionCache()
+        cache.set_event_types(2, {"event.created"})
+        cache.set_event_types(3, {"event.created"})
+        handler = WebhookSubscriptionCacheEventHandler(webhook_subscription_cache=cache)
+        return handler, cache
+
+    def test_app_installation_created_invalidates_admin_unit(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.AppInstallationCreated(
+            actor=Actor(), id=1, admin_unit_id=2, app_id=10, permissions=set()
+        )
+        handler.handle(ev, uow)
+
+        assert cache.get_event_types(2) is None
+        assert cache.get_event_types(3) == {"event.created"}
+
+    def test_app_installation_permissions_updated_invalidates_admin_unit(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.AppInstallationPermissionsUpdated(
+            actor=Actor(),
+            id=1,
+            admin_unit_id=2,
+            app_id=10,
+            permissions=ChangedValue(old=set(), new={"events:read"}),
+        )
+        handler.handle(ev, uow)
+
+        assert cache.get_event_types(2) is None
+        assert cache.get_event_types(3) == {"event.created"}
+
+    def test_app_installation_deleted_invalidates_admin_unit(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.AppInstallationDeleted(
+            actor=Actor(), id=1, admin_unit_id=3, app_id=10
+        )
+        handler.handle(ev, uow)
+
+        assert cache.get_event_types(2) == {"event.created"}
+        assert cache.get_event_types(3) is None
+
+    def test_app_updated_invalidates_all(self, uow):
+        handler, cache = self._make_handler()
+
+        ev = events.AppUpdated(actor=Actor(), id=10, admin_unit_id=1)
+        handler.handle(ev, uow)
+
+        assert cache.get_event_types(2) is None
+        assert cache.get_event_types(3) is None
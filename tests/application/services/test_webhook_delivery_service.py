@@ -1,15 +1,29 @@
 """Unit tests for WebhookDeliveryService orchestration."""
 
+import datetime
 import logging
 from unittest.mock import MagicMock
 
+from project.application.services.abstract_webhook_delivery_sender import (
+    WebhookDeliveryResult,
+)
 from project.application.services.webhook_delivery_service import WebhookDeliveryService
+from project.application.services.webhook_retry_policy import WebhookRetryPolicy
 
 
 class _FakeWebhook:
-    def __init__(self, url="http://example.com/hook", secret=None):
+    def __init__(
+        self,
+        url="http://example.com/hook",
+        secret=None,
+        webhook_id=1,
+        consecutive_failures=0,
+    ):
+        self.id = webhook_id
         self.url = url
         self.secret = secret
+        self.consecutive_failures = consecutive_failures
+        self.failing_since = None
 
 
 class _FakeWebhookEvent:
@@ -25,8 +39,10 @@ class _FakeWebhookDelivery:
         app_installation_id=456,
         webhook=None,
         webhook_event=None,
+        attempt_count=0,
     ):
         self.id = delivery_id
+        self.attempt_count = attempt_count
         self.app_installation_id = app_installation_id
         self.webhook = webhook or _FakeWebhook()
         self.webhook_event = webhook_event or _FakeWebhookEvent()
@@ -41,6 +57,8 @@ def _make_service(status="OK", status_code=None):
         logger=logging.getLogger("test"),
         webhook_delivery_sender=sender,
         webhook_delivery_read_repo=webhook_delivery_read_repo,
+        webhook_delivery_dispatcher=MagicMock(),
+        retry_policy=WebhookRetryPolicy(get_jitter=lambda: 0.5),
     )
     return service, sender, webhook_delivery_read_repo
 
@@ -93,3 +111,99 @@ class TestWebhookDeliveryService:
         assert attempt.start_at.tzinfo is not None
         assert attempt.end_at.tzinfo is not None
         assert attempt.end_at >= attempt.start_at
+
+    def test_dispatch_pending(self):
+        service, _, _ = _make_service()
+
+        service.dispatch_pending_webhook_deliveries()
+
+        service.webhook_delivery_dispatcher.dispatch_pending.assert_called_once_with()
+
+    def test_no_pending_deliveries(self, uow):
+        service, sender, webhook_delivery_read_repo = _make_service()
+        webhook_delivery_read_repo.get_pending.return_value = []
+
+        assert service.send_pending_webhook_deliveries(uow, 100) == 0
+
+        webhook_delivery_read_repo.get_pending.assert_called_once_with(100)
+        sender.send_many.assert_not_called()
+
+    def test_pending_deliveries_are_sent_and_attempts_are_recorded(self, uow):
+        service, sender, webhook_delivery_read_repo = _make_service()
+        deliveries = [
+            _FakeWebhookDelivery(
+                delivery_id=1,
+                webhook=_FakeWebhook(url="https://a.example.com", webhook_id=1),
+            ),
+            _FakeWebhookDelivery(
+                delivery_id=2,
+                webhook=_FakeWebhook(url="https://b.example.com", webhook_id=2),
+            ),
+        ]
+        webhook_delivery_read_repo.get_pending.return_value = deliveries
+        now = datetime.datetime.now(datetime.timezone.utc)
+        sender.send_many.return_value = [
+            WebhookDeliveryResult(
+                status="OK", status_code="200", start_at=now, end_at=now
+            ),
+            WebhookDeliveryResult(status="Timeout", start_at=now, end_at=now),
+        ]
+
+        assert service.send_pending_webhook_deliveries(uow, 100) == 2
+
+        sender.send_many.assert_called_once_with(deliveries)
+        attempts = list(uow.webhook_delivery_attempts._store.values())
+        assert [a.webhook_delivery_id for a in attempts] == [1, 2]
+        assert [a.url for a in attempts] == [
+            "https://a.example.com",
+            "https://b.example.com",
+        ]
+        assert [a.status for a in attempts] == ["OK", "Timeout"]
+        assert [a.status_code for a in attempts] == ["200", None]
+
+        # The timed out delivery is retried, the failing webhook is counted
+        next_attempt_at_by_id = uow.webhook_deliveries.next_attempt_at_by_id
+        assert next_attempt_at_by_id[1] is None
+        assert next_attempt_at_by_id[2] is not None
+        assert uow.webhook_deliveries.circuits[1].consecutive_failures == 0
+        assert uow.webhook_deliveries.circuits[2].consecutive_failures == 1
+        assert uow.webhook_deliveries.circuits[2].circuit_open_until is None
+
+    def test_client_errors_are_not_retried(self, uow):
+        service, sender, webhook_delivery_read_repo = _make_service()
+        webhook_delivery_read_repo.get_pending.return_value = [
+            _FakeWebhookDelivery(delivery_id=1)
+        ]
+        now = datetime.datetime.now(datetime.timezone.utc)
+        sender.send_many.return_value = [
+            WebhookDeliveryResult(
+                status="Not Found", status_code="404", start_at=now, end_at=now
+            ),
+        ]
+
+        service.send_pending_webhook_deliveries(uow, 100)
+
+        assert uow.webhook_deliveries.next_attempt_at_by_id == {1: None}
+        assert uow.webhook_deliveries.circuits[1].consecutive_failures == 1
+
+    def test_half_open_circuit_sends_single_probe(self, uow):
+        service, sender, webhook_delivery_read_repo = _make_service()
+        webhook = _FakeWebhook(webhook_id=1, consecutive_failures=5)
+        webhook_delivery_read_repo.get_pending.return_value = [
+            _FakeWebhookDelivery(delivery_id=1, webhook=webhook, attempt_count=1),
+            _FakeWebhookDelivery(delivery_id=2, webhook=webhook, attempt_count=1),
+        ]
+        now = datetime.datetime.now(datetime.timezone.utc)
+        sender.send_many.return_value = [
+            WebhookDeliveryResult(status="Timeout", start_at=now, end_at=now),
+        ]
+
+        assert service.send_pending_webhook_deliveries(uow, 100) == 2
+
+        sent = sender.send_many.call_args.args[0]
+        assert [d.id for d in sent] == [1]
+        assert list(uow.webhook_deliveries.next_attempt_at_by_id.keys()) == [1]
+        circuit = uow.webhook_deliveries.circuits[1]
+        assert circuit.consecutive_failures == 6
+        assert circuit.circuit_open_until is not None
+        assert not circuit.disabled
@@ -0,0 +1,85 @@
+"""Unit tests for WebhookRetryPolicy."""
+
+import datetime
+import random
+
+from project.application.read_models.webhook_delivery_read_model import WebhookReadModel
+from project.application.services.webhook_retry_policy import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    DISABLE_AFTER,
+    MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    WebhookRetryPolicy,
+)
+
+NOW = datetime.datetime(2024, 1, 1, 12)
+
+
+class TestWebhookRetryPolicy:
+    def test_is_retryable(self):
+        policy = WebhookRetryPolicy(get_jitter=random.random)
+
+        assert policy.is_retryable(None)
+        assert policy.is_retryable("500")
+        assert policy.is_retryable("503")
+        assert policy.is_retryable("429")
+        assert policy.is_retryable("408")
+        assert not policy.is_retryable("400")
+        assert not policy.is_retryable("404")
+
+    def test_next_attempt_at_backs_off_with_jitter(self):
+        policy = WebhookRetryPolicy(get_jitter=random.random)
+
+        first = policy.get_next_attempt_at(1, NOW) - NOW
+        assert datetime.timedelta(seconds=30) <= first <= datetime.timedelta(minutes=1)
+
+        third = policy.get_next_attempt_at(3, NOW) - NOW
+        assert datetime.timedelta(minutes=2) <= third <= datetime.timedelta(minutes=4)
+
+        last = policy.get_next_attempt_at(MAX_ATTEMPTS - 1, NOW) - NOW
+        assert last <= RETRY_MAX_DELAY
+
+        assert policy.get_next_attempt_at(MAX_ATTEMPTS, NOW) is None
+
+    def test_success_closes_circuit(self):
+        policy = WebhookRetryPolicy(get_jitter=random.random)
+        webhook = WebhookReadModel(
+            id=1, url="https://example.com", consecutive_failures=10, failing_since=NOW
+        )
+
+        circuit = policy.get_circuit(webhook, 1, 3, NOW)
+
+        assert circuit.webhook_id == 1
+        assert circuit.consecutive_failures == 0
+        assert circuit.failing_since is None
+        assert circuit.circuit_open_until is None
+        assert not circuit.disabled
+
+    def test_failures_open_circuit(self):
+        policy = WebhookRetryPolicy(get_jitter=random.random)
+        webhook = WebhookReadModel(id=1, url="https://example.com")
+
+        circuit = policy.get_circuit(webhook, 0, CIRCUIT_FAILURE_THRESHOLD - 1, NOW)
+        assert circuit.failing_since == NOW
+        assert circuit.circuit_open_until is None
+
+        circuit = policy.get_circuit(webhook, 0, CIRCUIT_FAILURE_THRESHOLD, NOW)
+        assert circuit.circuit_open_until == NOW + datetime.timedelta(minutes=1)
+        assert not circuit.disabled
+
+        circuit = policy.get_circuit(webhook, 0, CIRCUIT_FAILURE_THRESHOLD * 3, NOW)
+        assert circuit.circuit_open_until == NOW + datetime.timedelta(minutes=4)
+
+    def test_long_failing_webhook_is_disabled(self):
+        policy = WebhookRetryPolicy(get_jitter=random.random)
+        webhook = WebhookReadModel(
+            id=1,
+            url="https://example.com",
+            consecutive_failures=CIRCUIT_FAILURE_THRESHOLD,
+            failing_since=NOW - DISABLE_AFTER,
+        )
+
+        circuit = policy.get_circuit(webhook, 0, 1, NOW)
+
+        assert circuit.disabled
+        assert circuit.failing_since == NOW - DISABLE_AFTER
@@ -194,6 +194,33 @@ class TestHandleCommand:
 
         assert fake_event in dispatcher.dispatched
 
+    def test_dispatches_pending_events_in_one_batch(self):
+        dispatcher = MagicMock()
+        first_event = MagicMock(spec=events.Event)
+        second_event = MagicMock(spec=events.Event)
+
+        class _HandlerWithEvents:
+            def handle(self, cmd, uow):
+                uow.pending_events.extend([first_event, second_event])
+
+        handler = _HandlerWithEvents()
+        bus = _make_bus(command_handler=handler, event_dispatcher=dispatcher)
+
+        bus.handle(_make_fake_command())
+
+        dispatcher.dispatch_many.assert_called_once_with([first_event, second_event])
+        dispatcher.dispatch.assert_not_called()
+
+    def test_does_not_dispatch_without_pending_events(self):
+        dispatcher = MagicMock()
+        bus = _make_bus(
+            command_handler=_FakeCommandHandler(), event_dispatcher=dispatcher
+        )
+
+        bus.handle(_make_fake_command())
+
+        dispatcher.dispatch_many.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # Tests: handle — event routing
@@ -283,6 +310,81 @@ class TestHandleCommandMethod:
         assert ret is result
 
 
+# ---------------------------------------------------------------------------
+# Tests: handle_command_batch
+# ---------------------------------------------------------------------------
+
+
+class _FakeAggregate:
+    def __init__(self, domain_event):
+        self.id = None
+        self.domain_events = [domain_event]
+
+
+class TestHandleCommandBatch:
+    def test_returns_result_or_exception_per_command(self):
+        error = ValueError("boom")
+        results = [_FakeCommandResult(1), error, _FakeCommandResult(3)]
+
+        class _Handler:
+            def handle(self, cmd, uow):
+                result = results.pop(0)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+        uow = FakeUnitOfWork()
+        bus = _make_bus(uow=uow, command_handler=_Handler())
+
+        ret = bus.handle_command_batch([_make_fake_command() for _ in range(3)])
+
+        assert ret[0].value == 1
+        assert ret[1] is error
+        assert ret[2].value == 3
+        assert uow.committed is True
+
+    def test_dispatches_events_of_successful_commands_in_one_batch(self):
+        dispatcher = MagicMock()
+        created = MagicMock(spec=events.Event)
+        failed = MagicMock(spec=events.Event)
+
+        class _Handler:
+            def handle(self, cmd, uow):
+                if cmd.actor.user_id == 2:
+                    uow.events.add(_FakeAggregate(failed))
+                    raise ValueError("boom")
+                uow.events.add(_FakeAggregate(created))
+
+        bus = _make_bus(command_handler=_Handler(), event_dispatcher=dispatcher)
+
+        bus.handle_command_batch(
+            [
+                _make_fake_command(actor=Actor(user_id=1)),
+                _make_fake_command(actor=Actor(user_id=2)),
+                _make_fake_command(actor=Actor(user_id=1)),
+            ]
+        )
+
+        dispatcher.dispatch_many.assert_called_once_with([created, created])
+
+    def test_commit_exception_propagates(self):
+        class _FailingUnitOfWork(FakeUnitOfWork):
+            def _commit(self):
+                raise ValueError("commit failed")
+
+        dispatcher = MagicMock()
+        bus = _make_bus(
+            uow=_FailingUnitOfWork(),
+            command_handler=_FakeCommandHandler(),
+            event_dispatcher=dispatcher,
+        )
+
+        with pytest.raises(ValueError, match="commit failed"):
+            bus.handle_command_batch([_make_fake_command()])
+
+        dispatcher.dispatch_many.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Tests: dispatch_command
 # ---------------------------------------------------------------------------
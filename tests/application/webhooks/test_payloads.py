@@ -36,6 +36,9 @@ from project.application.webhooks.payloads.nested.payload_image import PayloadIm
 from project.application.webhooks.payloads.nested.payload_location import (
     PayloadLocation,
 )
+from project.application.webhooks.payloads.webhook_value_mapping import (
+    merge_changed_value_data,
+)
 from project.application.webhooks.webhook_mapper_context import WebhookMapperContext
 from project.domain import events
 from project.domain.events.nested.image_for_event import ImageForEvent
@@ -238,3 +241,41 @@ class TestAppInstallationPayloads:
         assert payload.organization_id == 4
         assert payload.permissions.old == set()
         assert payload.permissions.new == {"events:read"}
+
+
+class TestMergeChangedValueData:
+    def test_keeps_first_old_and_last_new_value(self):
+        data = {"id": 1, "status": {"old": 1, "new": 4}}
+        other = {
+            "id": 1,
+            "status": {"old": 4, "new": 2},
+            "name": {"old": "a", "new": "b"},
+        }
+
+        result = merge_changed_value_data(data, other)
+
+        assert result == {
+            "id": 1,
+            "status": {"old": 1, "new": 2},
+            "name": {"old": "a", "new": "b"},
+        }
+
+    def test_drops_reverted_changes(self):
+        data = {
+            "id": 1,
+            "name": {"old": "a", "new": "b"},
+            "rating": {"old": 1, "new": 2},
+        }
+        other = {"id": 1, "name": {"old": "b", "new": "a"}}
+
+        result = merge_changed_value_data(data, other)
+
+        assert result == {"id": 1, "rating": {"old": 1, "new": 2}}
+
+    def test_takes_plain_values_from_other(self):
+        data = {"id": 1, "actor": {"user_id": 1}}
+        other = {"id": 1, "actor": {"user_id": 2}}
+
+        result = merge_changed_value_data(data, other)
+
+        assert result["actor"] == {"user_id": 2}
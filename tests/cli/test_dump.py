@@ -31,3 +31,134 @@ def test_organization(client, seeder, app, utils):
         id=admin_unit_id,
         path=f"org-{admin_unit_id}.zip",
     )
+
+
+def test_delta(client, seeder, app, utils):
+    import json
+    import os
+    import zipfile
+
+    from project import dump_path
+
+    user_id, admin_unit_id = seeder.setup_base()
+    event_id = seeder.create_event(admin_unit_id)
+    deleted_event_id = seeder.create_event(admin_unit_id)
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["dump", "all"])
+    assert result.exit_code == 0
+
+    with app.app_context():
+        from project.extensions import db
+        from project.models import Event
+
+        event = db.session.get(Event, deleted_event_id)
+        db.session.delete(event)
+        db.session.commit()
+
+    result = runner.invoke(args=["dump", "delta"])
+    assert result.exit_code == 0
+
+    with open(os.path.join(dump_path, "manifest.json")) as infile:
+        manifest = json.load(infile)
+
+    assert manifest["full"]["file"] == "all.zip"
+    delta = manifest["deltas"][-1]
+    assert delta["since"] == manifest["full"]["until"]
+
+    utils.get_endpoint_ok("main.dump_files", path="manifest.json")
+    utils.get_endpoint_ok("main.dump_files", path=delta["file"])
+
+    with zipfile.ZipFile(os.path.join(dump_path, delta["file"])) as zip_file:
+        events = json.loads(zip_file.read("events.json"))
+        assert event_id in [event["id"] for event in events]
+
+        deleted = json.loads(zip_file.read("deleted.json"))
+        assert deleted["events"] == [deleted_event_id]
+
+
+def test_delta_verification(client, seeder, app, utils):
+    import datetime
+    import json
+    import os
+    import zipfile
+
+    from project import dump_path
+
+    user_id, admin_unit_id = seeder.setup_base()
+    event_id = seeder.create_event(admin_unit_id)
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["dump", "all"])
+    assert result.exit_code == 0
+
+    def dump_delta():
+        result = runner.invoke(args=["dump", "delta"])
+        assert result.exit_code == 0
+
+        with open(os.path.join(dump_path, "manifest.json")) as infile:
+            manifest = json.load(infile)
+
+        file_path = os.path.join(dump_path, manifest["deltas"][-1]["file"])
+
+        with zipfile.ZipFile(file_path) as zip_file:
+            events = json.loads(zip_file.read("events.json"))
+            organizations = json.loads(zip_file.read("organizations.json"))
+            deleted = json.loads(zip_file.read("deleted.json"))
+
+        return (
+            [event["id"] for event in events],
+            [organization["id"] for organization in organizations],
+            deleted["events"],
+        )
+
+    with app.app_context():
+        from sqlalchemy import update
+
+        from project.extensions import db
+        from project.models import AdminUnit, AdminUnitRelation, Event
+
+        # Rows older than the delta overlap are only selected by the verification
+        long_ago = datetime.datetime.utcnow() - datetime.timedelta(days=1)
+        db.session.execute(
+            update(Event.__table__)
+            .where(Event.id == event_id)
+            .values(created_at=long_ago, updated_at=None)
+        )
+        db.session.execute(
+            update(AdminUnit.__table__)
+            .where(AdminUnit.id == admin_unit_id)
+            .values(created_at=long_ago, updated_at=None)
+        )
+        relation = AdminUnitRelation.query.filter(
+            AdminUnitRelation.target_admin_unit_id == admin_unit_id
+        ).first()
+        relation.verify = False
+        db.session.commit()
+
+    event_ids, organization_ids, deleted_event_ids = dump_delta()
+    assert event_id not in event_ids
+    assert admin_unit_id in organization_ids
+    assert event_id in deleted_event_ids
+
+    with app.app_context():
+        relation = AdminUnitRelation.query.filter(
+            AdminUnitRelation.target_admin_unit_id == admin_unit_id
+        ).first()
+        relation.verify = True
+        db.session.commit()
+
+    event_ids, organization_ids, deleted_event_ids = dump_delta()
+    assert event_id in event_ids
+    assert event_id not in deleted_event_ids
+
+    with app.app_context():
+        relation = AdminUnitRelation.query.filter(
+            AdminUnitRelation.target_admin_unit_id == admin_unit_id
+        ).first()
+        db.session.delete(relation)
+        db.session.commit()
+
+    event_ids, organization_ids, deleted_event_ids = dump_delta()
+    assert event_id not in event_ids
+    assert event_id in deleted_event_ids
@@ -7,6 +7,20 @@ def test_update_recurring_dates(client, seeder, app):
     assert result.exit_code == 0
 
 
+def test_rebuild_event_date_search_index(client, seeder, app):
+    user_id, admin_unit_id = seeder.setup_base()
+    seeder.create_event(admin_unit_id, "RRULE:FREQ=DAILY;COUNT=7")
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["event", "rebuild-search-index"])
+    assert result.exit_code == 0
+
+    with app.app_context():
+        from project.models import EventDateSearchIndex
+
+        assert EventDateSearchIndex.query.count() == 7
+
+
 def _create_event(seeder, admin_unit_id, postalCode):
     from project.models import Location
 
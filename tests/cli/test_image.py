@@ -0,0 +1,72 @@
+def test_migrate_storage(client, seeder, app, db):
+    image_id = seeder.upsert_default_image()
+
+    with app.app_context():
+        from project.models import Image
+
+        image = db.session.get(Image, image_id)
+        data = image.data
+        hash = image.get_hash()
+        assert image.storage_key is None
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["image", "migrate-storage", "--batch-size", "1"])
+    assert result.exit_code == 0
+
+    with app.app_context():
+        image = db.session.get(Image, image_id)
+        assert image.storage_key is not None
+        assert image.data is None
+        assert image.get_data() == data
+        assert image.get_hash() == hash
+
+    result = runner.invoke(args=["image", "clean-storage"])
+    assert result.exit_code == 0
+
+    with app.app_context():
+        image = db.session.get(Image, image_id)
+        assert image.get_data() == data
+
+
+def test_store_on_save(client, seeder, app, db):
+    app.config["IMAGE_STORAGE_ENABLED"] = True
+
+    try:
+        image_id = seeder.upsert_default_image()
+
+        with app.app_context():
+            from project.models import Image
+
+            image = db.session.get(Image, image_id)
+            assert image.storage_key is not None
+            assert image.data is None
+            assert not image.is_empty()
+
+            data = image.get_data()
+            image.data = None
+            assert image.storage_key is None
+            assert image.is_empty()
+            db.session.rollback()
+
+            image = db.session.get(Image, image_id)
+            assert image.get_data() == data
+    finally:
+        app.config["IMAGE_STORAGE_ENABLED"] = False
+
+
+def test_fill_from_entity_unchanged(client, seeder, app, db):
+    image_id = seeder.upsert_default_image()
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["image", "migrate-storage"])
+    assert result.exit_code == 0
+
+    with app.app_context():
+        from project.models import Image
+
+        image = db.session.get(Image, image_id)
+        storage_key = image.storage_key
+        image.fill_from_entity(image.to_entity())
+
+        assert image.storage_key == storage_key
+        assert not db.session.is_modified(image)
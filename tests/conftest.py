@@ -42,6 +42,8 @@ def app():
             "API_READ_ANONYM": False,
             "SECURITY_EMAIL_VALIDATOR_ARGS": {"check_deliverability": False},
             "SECURITY_PASSWORD_HASH": "plaintext",
+            "RESPONSE_CACHE_TIMEOUT": 0,
+            "ICAL_FEED_MAX_AGE": 0,
             "SQLALCHEMY_ENGINE_OPTIONS": {
                 "pool_pre_ping": True,
                 "pool_size": 5,
@@ -64,6 +64,7 @@ class TestWebhookValueObject:
         assert vo.secret is None
         assert vo.disabled is False
         assert vo.event_types == set()
+        assert vo.debounce_seconds is None
 
     def test_with_secret_and_event_types(self):
         vo = WebhookValueObject(
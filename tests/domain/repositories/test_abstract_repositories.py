@@ -184,6 +184,9 @@ class _ConcreteOrgAppInstallationRepo(AbstractOrganizationAppInstallationReposit
     def _get_all_with_webhook(self, admin_unit_id, event_type):
         return self._all_with_webhook
 
+    def _get_webhook_event_types(self, admin_unit_id):
+        return {"event.created"}
+
 
 class _ConcreteOrgMemberRepo(AbstractOrganizationMemberRepository):
     def __init__(self, return_values=None):
@@ -198,6 +201,8 @@ class _ConcreteWebhookDeliveryRepo(AbstractWebhookDeliveryRepository):
     def __init__(self, return_value=None):
         super().__init__()
         self._return_value = return_value
+        self.scheduled = []
+        self.circuits = []
 
     def _add(self, e):
         pass
@@ -205,6 +210,15 @@ class _ConcreteWebhookDeliveryRepo(AbstractWebhookDeliveryRepository):
     def _get(self, oid):
         return self._return_value
 
+    def _get_debounced(self, app_installation_id, event_type, object_id):
+        return self._return_value
+
+    def _schedule_next_attempts(self, next_attempt_at_by_id):
+        self.scheduled.append(next_attempt_at_by_id)
+
+    def _update_webhook_circuits(self, circuits):
+        self.circuits.append(circuits)
+
 
 class _ConcreteWebhookDeliveryAttemptRepo(AbstractWebhookDeliveryAttemptRepository):
     def __init__(self, return_value=None):
@@ -214,6 +228,9 @@ class _ConcreteWebhookDeliveryAttemptRepo(AbstractWebhookDeliveryAttemptReposito
     def _add(self, e):
         pass
 
+    def _add_many(self, e):
+        pass
+
     def _get(self, oid):
         return self._return_value
 
@@ -227,6 +244,9 @@ class _ConcreteWebhookEventRepo(AbstractWebhookEventRepository):
     def _add(self, e):
         pass
 
+    def _update(self, e):
+        pass
+
     def _get(self, oid):
         return self._return_value
 
@@ -575,6 +595,10 @@ class TestAbstractOrganizationAppInstallationRepository:
         )
         assert inst in results
 
+    def test_get_webhook_event_types(self):
+        repo = _ConcreteOrgAppInstallationRepo()
+        assert repo.get_webhook_event_types(admin_unit_id=2) == {"event.created"}
+
 
 # ---------------------------------------------------------------------------
 # AbstractOrganizationMemberRepository
@@ -617,6 +641,27 @@ class TestAbstractWebhookDeliveryRepository:
         assert repo.get(1) is None
         assert len(repo.seen) == 0
 
+    def test_get_debounced_with_result_adds_to_seen(self):
+        agg = _delivery_agg()
+        repo = _ConcreteWebhookDeliveryRepo(return_value=agg)
+        assert repo.get_debounced(1, "event.updated", 2) is agg
+        assert agg in repo.seen
+
+    def test_get_debounced_none_does_not_add_to_seen(self):
+        repo = _ConcreteWebhookDeliveryRepo(return_value=None)
+        assert repo.get_debounced(1, "event.updated", 2) is None
+        assert len(repo.seen) == 0
+
+    def test_bulk_updates_skip_empty_input(self):
+        repo = _ConcreteWebhookDeliveryRepo()
+        repo.schedule_next_attempts({})
+        repo.update_webhook_circuits([])
+        assert repo.scheduled == []
+        assert repo.circuits == []
+
+        repo.schedule_next_attempts({1: None})
+        assert repo.scheduled == [{1: None}]
+
 
 # ---------------------------------------------------------------------------
 # AbstractWebhookDeliveryAttemptRepository
@@ -630,6 +675,12 @@ class TestAbstractWebhookDeliveryAttemptRepository:
         repo.add(agg)
         assert agg in repo.seen
 
+    def test_add_many_adds_to_seen(self):
+        repo = _ConcreteWebhookDeliveryAttemptRepo()
+        aggs = [_attempt_agg(), _attempt_agg()]
+        repo.add_many(aggs)
+        assert all(agg in repo.seen for agg in aggs)
+
     def test_get_with_result_adds_to_seen(self):
         agg = _attempt_agg()
         repo = _ConcreteWebhookDeliveryAttemptRepo(return_value=agg)
@@ -654,6 +705,12 @@ class TestAbstractWebhookEventRepository:
         repo.add(agg)
         assert agg in repo.seen
 
+    def test_update_adds_to_seen(self):
+        repo = _ConcreteWebhookEventRepo()
+        agg = _webhook_event_agg()
+        repo.update(agg)
+        assert agg in repo.seen
+
     def test_get_with_result_adds_to_seen(self):
         agg = _webhook_event_agg()
         repo = _ConcreteWebhookEventRepo(return_value=agg)
@@ -52,6 +52,15 @@ class _ConcreteUoW(AbstractUnitOfWork):
     def rollback(self):
         self.rollback_called = True
 
+    def _begin_nested(self):
+        pass
+
+    def _release_nested(self):
+        pass
+
+    def _rollback_nested(self):
+        pass
+
 
 @pytest.fixture
 def actor():
@@ -182,3 +191,32 @@ class TestCollectDomainEventsFromRepo:
 
         assert ev1 in uow.pending_events
         assert ev2 in uow.pending_events
+
+
+# ---------------------------------------------------------------------------
+# Savepoints
+# ---------------------------------------------------------------------------
+
+
+class TestSavepoint:
+    def test_release_collects_domain_events(self, uow, actor):
+        ev = AppDeleted(actor=actor, id=1, admin_unit_id=2)
+
+        uow.begin_savepoint()
+        uow.apps.seen.add(_MockAggregate(events=[ev]))
+        uow.release_savepoint()
+
+        assert uow.pending_events == [ev]
+
+    def test_rollback_discards_domain_events(self, uow, actor):
+        ev = AppDeleted(actor=actor, id=1, admin_unit_id=2)
+        agg = _MockAggregate(events=[ev])
+
+        uow.begin_savepoint()
+        uow.apps.seen.add(agg)
+        uow.rollback_savepoint()
+
+        uow.commit()
+
+        assert agg.domain_events == []
+        assert uow.pending_events == []
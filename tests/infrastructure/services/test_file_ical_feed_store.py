@@ -0,0 +1,102 @@
+import os
+
+
+def test_render_and_remove(app, db, seeder, tmp_path):
+    user_id, admin_unit_id = seeder.setup_base(log_in=False)
+    event_id = seeder.create_event(admin_unit_id)
+    organizer_id = seeder.upsert_default_event_organizer(admin_unit_id)
+
+    with app.app_context():
+        from project.infrastructure.services.file_ical_feed_store import (
+            FileIcalFeedStore,
+        )
+
+        store = FileIcalFeedStore(session=db.session, path=str(tmp_path))
+        admin_unit_path = store.get_admin_unit_feed_path(admin_unit_id)
+        event_path = store.get_event_feed_path(event_id)
+
+        # Feeds that were never requested are not rendered
+        store.invalidate_admin_unit_feed(admin_unit_id)
+        store.render_event_feed(event_id)
+        assert os.listdir(tmp_path) == []
+
+        app.config["ICAL_FEED_MAX_AGE"] = 3600
+        try:
+            assert store.get_admin_unit_feed(admin_unit_id) == admin_unit_path
+            assert store.get_event_feed(event_id) == event_path
+            assert store.get_admin_unit_feed(admin_unit_id + 1000) is None
+        finally:
+            app.config["ICAL_FEED_MAX_AGE"] = 0
+
+        with open(admin_unit_path, "rb") as f:
+            data = f.read()
+        assert data.startswith(b"BEGIN:VCALENDAR")
+        assert data.count(b"BEGIN:VEVENT") == 1
+
+        # Unchanged feeds keep their ETag
+        etag = store.get_etag(admin_unit_path)
+        store.invalidate_admin_unit_feed(admin_unit_id)
+        app.config["ICAL_FEED_MAX_AGE"] = 3600
+        try:
+            assert store.get_admin_unit_feed(admin_unit_id) == admin_unit_path
+        finally:
+            app.config["ICAL_FEED_MAX_AGE"] = 0
+        assert store.get_etag(admin_unit_path) == etag
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            [os.path.basename(admin_unit_path), os.path.basename(event_path)]
+        )
+
+        store.remove_event_feeds_of_organizer(organizer_id)
+        assert not os.path.exists(event_path)
+
+        store.remove_admin_unit_feeds(admin_unit_id)
+        assert os.listdir(tmp_path) == []
+
+
+def test_invalidate_renders_once(app, db, seeder, tmp_path):
+    from unittest.mock import MagicMock, patch
+
+    user_id, admin_unit_id = seeder.setup_base(log_in=False)
+    event_ids = [seeder.create_event(admin_unit_id) for _ in range(3)]
+
+    with app.app_context():
+        from project.application.event_handlers.ical_feed_event_handler import (
+            IcalFeedEventHandler,
+        )
+        from project.domain import events
+        from project.domain.models.entities.actor import Actor
+        from project.infrastructure.services.file_ical_feed_store import (
+            FileIcalFeedStore,
+        )
+
+        store = FileIcalFeedStore(session=db.session, path=str(tmp_path))
+        event_read_repo = MagicMock()
+        event_read_repo.get_referencing_admin_unit_ids.return_value = []
+        handler = IcalFeedEventHandler(
+            ical_feed_store=store, event_read_repo=event_read_repo
+        )
+
+        app.config["ICAL_FEED_MAX_AGE"] = 3600
+        try:
+            store.get_admin_unit_feed(admin_unit_id)
+
+            with patch.object(
+                store,
+                "_render_admin_unit_feed",
+                wraps=store._render_admin_unit_feed,
+            ) as render:
+                for event_id in event_ids:
+                    handler.handle(
+                        events.EventUpdated(
+                            actor=Actor(), id=event_id, admin_unit_id=admin_unit_id
+                        ),
+                        None,
+                    )
+
+                render.assert_not_called()
+
+                store.get_admin_unit_feed(admin_unit_id)
+                store.get_admin_unit_feed(admin_unit_id)
+                render.assert_called_once()
+        finally:
+            app.config["ICAL_FEED_MAX_AGE"] = 0
@@ -0,0 +1,73 @@
+import os
+
+
+def test_get_size(app):
+    from project.infrastructure.services.file_image_derivative_cache import (
+        FileImageDerivativeCache,
+    )
+
+    cache = FileImageDerivativeCache(session=None, path="")
+
+    assert cache.get_size(None) == 500
+    assert cache.get_size(100) == 100
+    assert cache.get_size(120) == 200
+    assert cache.get_size(5000) == 1000
+
+
+def test_get_format(app):
+    from werkzeug.datastructures import MIMEAccept
+
+    from project.infrastructure.services.file_image_derivative_cache import (
+        FileImageDerivativeCache,
+        is_format_supported,
+    )
+
+    cache = FileImageDerivativeCache(session=None, path="")
+
+    assert cache.get_format(MIMEAccept()) is None
+    assert cache.get_format(MIMEAccept([("*/*", 1)])) is None
+    assert cache.get_format(MIMEAccept([("image/webp", 1), ("*/*", 0.8)])) == "webp"
+    assert cache.get_format(MIMEAccept([("image/webp", 0)])) is None
+
+    expected = "avif" if is_format_supported("avif") else "webp"
+    accept = MIMEAccept([("image/avif", 1), ("image/webp", 1)])
+    assert cache.get_format(accept) == expected
+
+
+def test_render_and_evict(app, db, seeder, tmp_path):
+    image_id = seeder.upsert_default_image()
+
+    with app.app_context():
+        from project.infrastructure.services.file_image_derivative_cache import (
+            IMAGE_DERIVATIVE_SIZES,
+            FileImageDerivativeCache,
+        )
+        from project.models import Image
+
+        cache = FileImageDerivativeCache(session=db.session, path=str(tmp_path))
+        image = db.session.get(Image, image_id)
+
+        # Outdated derivative of a previous version
+        stale_path = tmp_path / f"{image_id}-1-500-500.png"
+        stale_path.write_bytes(b"stale")
+
+        cache.render_derivatives(image_id)
+
+        assert not stale_path.exists()
+        for size in IMAGE_DERIVATIVE_SIZES:
+            assert os.path.exists(cache.get_file_path(image, size))
+            assert os.path.exists(cache.get_file_path(image, size, "webp"))
+
+        file_path = cache.get_file(image, 200)
+        assert file_path == cache.get_file_path(image, 200)
+        assert not [p for p in os.listdir(tmp_path) if p.startswith(".tmp-")]
+
+        app.config["IMAGE_CACHE_MAX_SIZE_MB"] = 0
+        try:
+            cache.evict()
+        finally:
+            app.config["IMAGE_CACHE_MAX_SIZE_MB"] = 1024
+
+        assert os.listdir(tmp_path) == []
+
+        cache.remove_derivatives(image_id)
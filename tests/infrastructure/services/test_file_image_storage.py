@@ -0,0 +1,23 @@
+import hashlib
+
+from project.infrastructure.services.file_image_storage import FileImageStorage
+
+
+def test_write_read_delete(tmp_path):
+    storage = FileImageStorage(path=str(tmp_path))
+    data = b"image data"
+
+    key = storage.write(data)
+    assert key == hashlib.sha256(data).hexdigest()
+    assert (tmp_path / key[:2] / key[2:4] / key).read_bytes() == data
+
+    # Same content is stored once
+    assert storage.write(data) == key
+    assert list(storage.iter_keys()) == [key]
+    assert list(storage.iter_keys(min_age=60)) == []
+
+    assert storage.read(key) == data
+
+    storage.delete(key)
+    assert storage.read(key) is None
+    storage.delete(key)
@@ -0,0 +1,51 @@
+import time
+
+from project.infrastructure.services.in_memory_api_auth_cache import (
+    InMemoryApiAuthCache,
+)
+
+
+def test_get_set():
+    cache = InMemoryApiAuthCache(max_entries=2)
+
+    assert cache.get("a") is None
+    cache.set("a", {"id": 1})
+    cache.set("b", {"id": 2})
+    assert cache.get("a") == {"id": 1}
+
+    # Least recently used entry is dropped
+    cache.set("c", {"id": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"id": 1}
+    assert cache.get("c") == {"id": 3}
+
+
+def test_get_returns_copy():
+    cache = InMemoryApiAuthCache()
+    cache.set("a", {"permissions": ["events:read"]})
+
+    cache.get("a")["permissions"].append("events:write")
+    assert cache.get("a") == {"permissions": ["events:read"]}
+
+
+def test_expired(mocker):
+    cache = InMemoryApiAuthCache()
+    cache.set("a", {"id": 1})
+
+    mocker.patch.object(
+        time, "monotonic", return_value=time.monotonic() + cache.timeout + 1
+    )
+    assert cache.get("a") is None
+
+
+def test_invalidate():
+    cache = InMemoryApiAuthCache()
+    cache.set("a", {"id": 1})
+    cache.set("b", {"id": 2})
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == {"id": 2}
+
+    cache.invalidate_all()
+    assert cache.get("b") is None
@@ -0,0 +1,37 @@
+import time
+
+from project.infrastructure.services.in_memory_response_cache import (
+    InMemoryResponseCache,
+)
+
+
+def test_get_set():
+    cache = InMemoryResponseCache(max_entries=2)
+
+    assert cache.get("a") is None
+    cache.set("a", b"1", 60)
+    cache.set("b", b"2", 60)
+    assert cache.get("a") == b"1"
+
+    # Least recently used entry is dropped
+    cache.set("c", b"3", 60)
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+
+
+def test_expired(mocker):
+    cache = InMemoryResponseCache()
+    cache.set("a", b"1", 60)
+
+    mocker.patch.object(time, "monotonic", return_value=time.monotonic() + 61)
+    assert cache.get("a") is None
+
+
+def test_invalidate():
+    cache = InMemoryResponseCache()
+
+    assert cache.get_generation("global") == 0
+    cache.invalidate("global")
+    assert cache.get_generation("global") == 1
+    assert cache.get_generation("admin_unit:1") == 0
@@ -0,0 +1,38 @@
+import time
+
+from project.infrastructure.services.in_memory_webhook_subscription_cache import (
+    InMemoryWebhookSubscriptionCache,
+)
+
+
+def test_get_set():
+    cache = InMemoryWebhookSubscriptionCache()
+
+    assert cache.get_event_types(1) is None
+    cache.set_event_types(1, set())
+    cache.set_event_types(2, {"event.created"})
+    assert cache.get_event_types(1) == set()
+    assert cache.get_event_types(2) == {"event.created"}
+
+
+def test_expired(mocker):
+    cache = InMemoryWebhookSubscriptionCache()
+    cache.set_event_types(1, {"event.created"})
+
+    mocker.patch.object(
+        time, "monotonic", return_value=time.monotonic() + cache.timeout + 1
+    )
+    assert cache.get_event_types(1) is None
+
+
+def test_invalidate():
+    cache = InMemoryWebhookSubscriptionCache()
+    cache.set_event_types(1, {"event.created"})
+    cache.set_event_types(2, {"event.created"})
+
+    cache.invalidate(1)
+    assert cache.get_event_types(1) is None
+    assert cache.get_event_types(2) == {"event.created"}
+
+    cache.invalidate_all()
+    assert cache.get_event_types(2) is None
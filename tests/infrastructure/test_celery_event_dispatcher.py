@@ -0,0 +1,89 @@
+import sys
+from unittest.mock import MagicMock
+
+from flask import Flask
+
+from project.base_tasks import get_class_by_path, process_delayed_events
+from project.domain import events
+from project.domain.models.entities.actor import Actor
+from project.infrastructure import celery_event_dispatcher
+from project.infrastructure.celery_event_dispatcher import CeleryEventDispatcher
+
+
+def _serialize(event):
+    event_class_path = f"{event.__class__.__module__}.{event.__class__.__name__}"
+    return event_class_path, event.model_dump_json(exclude_unset=True)
+
+
+def _fake_base_tasks(monkeypatch):
+    # The dispatcher imports the tasks at call time
+    fake_base_tasks = MagicMock()
+    monkeypatch.setitem(sys.modules, "project.base_tasks", fake_base_tasks)
+    return fake_base_tasks
+
+
+def test_dispatch_calls_process_delayed_event_v2(monkeypatch):
+    fake_base_tasks = _fake_base_tasks(monkeypatch)
+    event = events.EventDeleted(actor=Actor(), id=1, admin_unit_id=2)
+
+    CeleryEventDispatcher().dispatch(event)
+
+    fake_base_tasks.process_delayed_event_v2.delay.assert_called_once_with(
+        *_serialize(event)
+    )
+
+
+def test_dispatch_many_single_event(monkeypatch):
+    fake_base_tasks = _fake_base_tasks(monkeypatch)
+    event = events.EventDeleted(actor=Actor(), id=1, admin_unit_id=2)
+
+    CeleryEventDispatcher().dispatch_many([event])
+
+    fake_base_tasks.process_delayed_event_v2.delay.assert_called_once()
+    fake_base_tasks.process_delayed_events.delay.assert_not_called()
+
+
+def test_dispatch_many_sends_batches_in_order(monkeypatch):
+    fake_base_tasks = _fake_base_tasks(monkeypatch)
+    monkeypatch.setattr(celery_event_dispatcher, "EVENT_BATCH_SIZE", 2)
+    pending_events = [
+        events.EventDeleted(actor=Actor(), id=i, admin_unit_id=2) for i in range(3)
+    ]
+
+    CeleryEventDispatcher().dispatch_many(pending_events)
+
+    calls = fake_base_tasks.process_delayed_events.delay.call_args_list
+    assert [call.args[0] for call in calls] == [
+        [_serialize(pending_events[0]), _serialize(pending_events[1])],
+        [_serialize(pending_events[2])],
+    ]
+    fake_base_tasks.process_delayed_event_v2.delay.assert_not_called()
+
+
+def test_process_delayed_events_handles_events_in_order():
+    pending_events = [
+        events.EventDeleted(actor=Actor(), id=1, admin_unit_id=2),
+        events.EventUpdated(actor=Actor(), id=3, admin_unit_id=2),
+    ]
+    app = Flask(__name__)
+    app.container = MagicMock()
+    message_bus = app.container.cqrs.message_bus.return_value
+
+    with app.app_context():
+        process_delayed_events([_serialize(event) for event in pending_events])
+
+    handled_events = [call.args[0] for call in message_bus.handle.call_args_list]
+    assert [(type(event), event.id) for event in handled_events] == [
+        (events.EventDeleted, 1),
+        (events.EventUpdated, 3),
+    ]
+
+
+def test_get_class_by_path():
+    assert (
+        get_class_by_path("project.domain.events.EventDeleted") is events.EventDeleted
+    )
+    assert (
+        get_class_by_path("project.domain.events.EventDeleted") is events.EventDeleted
+    )
+    assert get_class_by_path.cache_info().hits >= 1
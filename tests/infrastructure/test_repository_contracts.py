@@ -21,6 +21,9 @@ from project.domain.models.entities.image_entity import ImageEntity
 from project.domain.models.value_objects.location_value_object import (
     LocationValueObject,
 )
+from project.domain.models.value_objects.webhook_circuit_value_object import (
+    WebhookCircuitValueObject,
+)
 from project.infrastructure.read_repositories.sql_alchemy_event_read_repository import (
     SqlAlchemyEventReadRepository,
 )
@@ -299,6 +302,78 @@ def test_webhook_delivery_attempt_repository_roundtrip_aggregate(app, db):
         assert loaded.status_code == "200"
 
 
+def test_webhook_delivery_read_repository_get_pending(app, db):
+    with app.app_context():
+        webhook_event, webhook = _create_enabled_webhook_event_and_webhook(db)
+        pending = WebhookDelivery(
+            webhook_event_id=webhook_event.id,
+            webhook_id=webhook.id,
+        )
+        attempted = WebhookDelivery(
+            webhook_event_id=webhook_event.id,
+            webhook_id=webhook.id,
+        )
+        db.session.add_all([pending, attempted])
+        db.session.commit()
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        attempt_repo = SqlAlchemyWebhookDeliveryAttemptRepository(db.session)
+        attempt = WebhookDeliveryAttemptAggregate.create(
+            actor=Actor(),
+            url=webhook.url,
+            start_at=now,
+            end_at=now,
+            webhook_delivery_id=attempted.id,
+            status="OK",
+        )
+        attempt_repo.add_many([attempt])
+        db.session.commit()
+        assert attempt.id > 0
+
+        pending_id = pending.id
+        attempted_id = attempted.id
+        read_repo = SqlAlchemyWebhookDeliveryReadRepository(db.session)
+        read_models = read_repo.get_pending(10)
+        db.session.rollback()
+
+        # Due retries are pending again
+        write_repo = SqlAlchemyWebhookDeliveryRepository(db.session)
+        write_repo.schedule_next_attempts(
+            {attempted_id: datetime.datetime.utcnow() - datetime.timedelta(minutes=1)}
+        )
+        db.session.commit()
+        retry_read_models = read_repo.get_pending(10)
+        db.session.rollback()
+
+        # Deliveries of webhooks with an open circuit are not pending
+        write_repo.update_webhook_circuits(
+            [
+                WebhookCircuitValueObject(
+                    webhook_id=webhook.id,
+                    consecutive_failures=5,
+                    circuit_open_until=datetime.datetime.utcnow()
+                    + datetime.timedelta(minutes=1),
+                )
+            ]
+        )
+        db.session.commit()
+        open_read_models = read_repo.get_pending(10)
+        db.session.rollback()
+
+    assert [read_model.id for read_model in read_models] == [pending_id]
+    assert read_models[0].webhook.url == "https://example.com/webhook"
+    assert read_models[0].webhook_event.event_type == "event.created"
+    assert read_models[0].attempt_count == 0
+
+    assert [read_model.id for read_model in retry_read_models] == [
+        pending_id,
+        attempted_id,
+    ]
+    assert retry_read_models[1].attempt_count == 1
+
+    assert open_read_models == []
+
+
 def test_event_reference_repository_get_by_event_id_returns_aggregates(
     app, db, seeder: Seeder
 ):
@@ -399,6 +474,8 @@ def test_organization_app_installation_repository_aggregate_and_webhook_filter(
             permissions=[],
             event_type="event.created",
         )
+        event_types = repo.get_webhook_event_types(admin_unit_id)
+        other_event_types = repo.get_webhook_event_types(admin_unit_id + 1)
         app_model_app_permissions = app_model.app_permissions
 
     assert isinstance(loaded, OrganisationAppInstallationAggregate)
@@ -406,6 +483,8 @@ def test_organization_app_installation_repository_aggregate_and_webhook_filter(
     assert loaded.app_id == app_id
     assert loaded.permissions == set(app_model_app_permissions or [])
     assert any(item.id == installation.id for item in filtered)
+    assert event_types == {"event.created"}
+    assert other_event_types == set()
 
 
 def test_webhook_delivery_read_repository_includes_app_installation_id(app, db, seeder):
@@ -452,3 +531,71 @@ def test_webhook_delivery_read_repository_includes_app_installation_id(app, db,
     assert read_model.id == delivery.id
     assert read_model.app_installation_id == installation_id
     assert read_model.webhook_event.payload["source"] == "integration-test"
+
+
+def test_webhook_delivery_repository_get_debounced(app, db, seeder):
+    _, admin_unit_id = seeder.setup_base(log_in=False, email="debounce@test.de")
+    app_id = seeder.insert_default_oauth2_client_app(admin_unit_id=admin_unit_id)
+
+    with app.app_context():
+        app_model = db.session.get(OAuth2Client, app_id)
+        app_model.webhook = Webhook(
+            url="https://example.com/debounce",
+            event_types=["event.updated"],
+            debounce_seconds=60,
+        )
+        installation = AppInstallation(
+            admin_unit_id=admin_unit_id,
+            oauth2_client_id=app_id,
+            permissions=list(app_model.app_permissions or []),
+        )
+        db.session.add(installation)
+        db.session.commit()
+
+        event_repo = SqlAlchemyWebhookEventRepository(db.session)
+        webhook_event = WebhookEventAggregate.create(
+            actor=Actor(),
+            timestamp=datetime.datetime.now(datetime.timezone.utc),
+            event_type="event.updated",
+            payload={"id": 7, "name": {"old": "a", "new": "b"}},
+        )
+        event_repo.add(webhook_event)
+
+        write_repo = SqlAlchemyWebhookDeliveryRepository(db.session)
+        delivery = WebhookDeliveryAggregate.create(
+            actor=Actor(),
+            webhook_event_id=webhook_event.id,
+            app_id=app_id,
+            app_installation_id=installation.id,
+        )
+        write_repo.add(delivery)
+        write_repo.schedule_next_attempts(
+            {delivery.id: datetime.datetime.utcnow() + datetime.timedelta(minutes=1)}
+        )
+        db.session.commit()
+
+        installation_id = installation.id
+        debounced = write_repo.get_debounced(installation_id, "event.updated", 7)
+        other_object = write_repo.get_debounced(installation_id, "event.updated", 8)
+        other_type = write_repo.get_debounced(installation_id, "event.deleted", 7)
+        db.session.rollback()
+
+        webhook_event.payload = {"id": 7, "name": {"old": "a", "new": "c"}}
+        event_repo.update(webhook_event)
+        db.session.commit()
+        updated_payload = event_repo.get(webhook_event.id).payload
+
+        # Deliveries that are due are left to the sender
+        write_repo.schedule_next_attempts(
+            {delivery.id: datetime.datetime.utcnow() - datetime.timedelta(minutes=1)}
+        )
+        db.session.commit()
+        due = write_repo.get_debounced(installation_id, "event.updated", 7)
+        db.session.rollback()
+
+    assert debounced.id == delivery.id
+    assert debounced.webhook_event_id == webhook_event.id
+    assert other_object is None
+    assert other_type is None
+    assert updated_payload["name"] == {"old": "a", "new": "c"}
+    assert due is None
@@ -23,7 +23,7 @@ def test_send_success_builds_headers_and_signature(monkeypatch):
     response.status_code = 201
     response.raise_for_status = Mock()
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr(requests, "post", post_mock)
+    monkeypatch.setattr(requests.Session, "post", post_mock)
 
     status, status_code = sender.send(
         url="https://example.test/webhook",
@@ -61,7 +61,7 @@ def test_send_without_secret_or_installation_headers(monkeypatch):
     response.status_code = 200
     response.raise_for_status = Mock()
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr(requests, "post", post_mock)
+    monkeypatch.setattr(requests.Session, "post", post_mock)
 
     status, status_code = sender.send(
         url="https://example.test/webhook",
@@ -84,7 +84,7 @@ def test_send_timeout(monkeypatch):
     sender = _make_sender()
 
     post_mock = Mock(side_effect=requests.Timeout())
-    monkeypatch.setattr(requests, "post", post_mock)
+    monkeypatch.setattr(requests.Session, "post", post_mock)
 
     status, status_code = sender.send(
         url="https://example.test/webhook",
@@ -105,7 +105,7 @@ def test_send_request_exception_reason_truncated(monkeypatch):
     response = Mock()
     response.reason = "x" * 300
     post_mock = Mock(side_effect=requests.RequestException(response=response))
-    monkeypatch.setattr(requests, "post", post_mock)
+    monkeypatch.setattr(requests.Session, "post", post_mock)
 
     status, status_code = sender.send(
         url="https://example.test/webhook",
@@ -124,7 +124,7 @@ def test_send_request_exception_without_response_uses_type(monkeypatch):
     sender = _make_sender()
 
     post_mock = Mock(side_effect=requests.RequestException())
-    monkeypatch.setattr(requests, "post", post_mock)
+    monkeypatch.setattr(requests.Session, "post", post_mock)
 
     status, status_code = sender.send(
         url="https://example.test/webhook",
@@ -145,7 +145,7 @@ def test_send_request_exception_with_utf8_bytes_reason(monkeypatch):
     response = Mock()
     response.reason = "Über den Wolken".encode("utf-8")
     post_mock = Mock(side_effect=requests.RequestException(response=response))
-    monkeypatch.setattr(requests, "post", post_mock)
+    monkeypatch.setattr(requests.Session, "post", post_mock)
 
     status, status_code = sender.send(
         url="https://example.test/webhook",
@@ -166,7 +166,7 @@ def test_send_request_exception_with_non_utf8_bytes_reason(monkeypatch):
     response = Mock()
     response.reason = b"\xff"
     post_mock = Mock(side_effect=requests.RequestException(response=response))
-    monkeypatch.setattr(requests, "post", post_mock)
+    monkeypatch.setattr(requests.Session, "post", post_mock)
 
     status, status_code = sender.send(
         url="https://example.test/webhook",
@@ -179,3 +179,83 @@ def test_send_request_exception_with_non_utf8_bytes_reason(monkeypatch):
 
     assert status == "ÿ"
     assert status_code is None
+
+
+def _make_delivery(delivery_id, url):
+    from project.application.read_models.webhook_delivery_read_model import (
+        WebhookDeliveryReadModel,
+        WebhookEventReadModel,
+        WebhookReadModel,
+    )
+
+    return WebhookDeliveryReadModel(
+        id=delivery_id,
+        webhook_event=WebhookEventReadModel(
+            event_type="event.created", payload={"id": delivery_id}
+        ),
+        webhook=WebhookReadModel(url=url),
+    )
+
+
+def test_send_many_returns_results_in_order(monkeypatch):
+    sender = _make_sender()
+
+    def post(url, **kwargs):
+        if "fail" in url:
+            raise requests.ConnectionError()
+
+        response = Mock()
+        response.status_code = 200
+        response.raise_for_status = Mock()
+        return response
+
+    post_mock = Mock(side_effect=post)
+    monkeypatch.setattr(requests.Session, "post", post_mock)
+
+    deliveries = [
+        _make_delivery(1, "https://a.example.test/webhook"),
+        _make_delivery(2, "https://fail.example.test/webhook"),
+        _make_delivery(3, "https://a.example.test/webhook"),
+    ]
+    results = sender.send_many(deliveries)
+
+    assert [r.status for r in results] == ["OK", "ConnectionError", "OK"]
+    assert [r.status_code for r in results] == ["200", None, "200"]
+    assert all(r.end_at >= r.start_at for r in results)
+    assert post_mock.call_count == 3
+    assert sender.send_many([]) == []
+
+
+def test_sessions_are_reused_per_host():
+    sender = _make_sender()
+
+    with sender._use_session("https://a.example.test/webhook") as session:
+        with sender._use_session("https://a.example.test/other") as other:
+            assert other is session
+
+        with sender._use_session("http://a.example.test/webhook") as other:
+            assert other is not session
+
+        with sender._use_session("https://b.example.test/webhook") as other:
+            assert other is not session
+
+
+def test_sessions_in_use_are_not_evicted(monkeypatch):
+    from project.infrastructure.services import requests_webhook_delivery_sender
+
+    monkeypatch.setattr(requests_webhook_delivery_sender, "MAX_SESSIONS", 1)
+    sender = _make_sender()
+
+    with sender._use_session("https://a.example.test/webhook") as session_a:
+        close_a = Mock()
+        monkeypatch.setattr(session_a, "close", close_a)
+
+        with sender._use_session("https://b.example.test/webhook"):
+            close_a.assert_not_called()
+            assert len(sender.sessions) == 2
+
+    with sender._use_session("https://c.example.test/webhook"):
+        close_a.assert_called_once()
+        assert list(sender.sessions) == [("https", "c.example.test")]
+
+    assert sender.session_users == {}
@@ -17,3 +17,50 @@ def test_dump_admin_unit(client, seeder, utils, app):
         from project.services.dump import dump_admin_unit
 
         dump_admin_unit(admin_unit_id)
+
+        import json
+        import os
+        import zipfile
+
+        from project import dump_org_path
+
+        zip_path = os.path.join(dump_org_path, f"org-{admin_unit_id}.zip")
+        with zipfile.ZipFile(zip_path) as zip_file:
+            events = json.loads(zip_file.read("events.json"))
+            assert len(events) == 1
+            assert events[0]["id"] == event_id
+            assert events[0]["photo"]["id"] == image_id
+            assert f"{image_id}.png" in zip_file.namelist()
+
+            organization = json.loads(zip_file.read("organization.json"))
+            assert organization["id"] == admin_unit_id
+
+
+def test_dump_all(client, seeder, utils, app):
+    user_id, admin_unit_id = seeder.setup_base()
+    event_ids = [seeder.create_event(admin_unit_id) for _ in range(3)]
+
+    with app.app_context():
+        import json
+        import os
+        import zipfile
+
+        from project import dump_path
+        from project.services import dump
+        from project.services.dump import dump_all
+
+        dump.DUMP_BATCH_SIZE = 2
+        try:
+            dump_all()
+        finally:
+            dump.DUMP_BATCH_SIZE = 500
+
+        zip_path = os.path.join(dump_path, "all.zip")
+        assert not os.path.exists(zip_path + ".tmp")
+
+        with zipfile.ZipFile(zip_path) as zip_file:
+            events = json.loads(zip_file.read("events.json"))
+            assert [event["id"] for event in events] == event_ids
+
+            organizations = json.loads(zip_file.read("organizations.json"))
+            assert admin_unit_id in [o["id"] for o in organizations]
@@ -151,6 +151,101 @@ def test_update_event_dates_with_recurrence_rule_exdate(
         assert event_date.end == create_berlin_date(2021, 6, 9, 18, 0)
 
 
+def test_update_recurring_dates_for_events(client, seeder, app, db):
+    _, admin_unit_id = seeder.setup_base()
+    event_id = seeder.create_event(admin_unit_id, "RRULE:FREQ=DAILY;COUNT=7")
+
+    with app.app_context():
+        from project.dateutils import create_berlin_date
+        from project.models import Event, EventDate
+        from project.services.event import update_recurring_dates_for_events
+
+        event = db.session.get(Event, event_id)
+        expected_starts = sorted(date.start for date in event.dates)
+        db.session.delete(event.dates[0])
+        db.session.add(
+            EventDate(event_id=event_id, start=create_berlin_date(2030, 1, 1, 10))
+        )
+        db.session.commit()
+
+        added, removed = update_recurring_dates_for_events([event_id])
+        db.session.commit()
+
+        assert added == 1
+        assert removed == 1
+
+        starts = db.session.scalars(
+            db.select(EventDate.start)
+            .where(EventDate.event_id == event_id)
+            .order_by(EventDate.start)
+        ).all()
+        assert starts == expected_starts
+
+        db.session.expire_all()
+        event = db.session.get(Event, event_id)
+        assert event.is_recurring
+        assert event.number_of_dates == 7
+        assert event.min_start == expected_starts[0]
+        assert event.max_date_end == max(date.end_or_start for date in event.dates)
+
+        # Nothing changes on a second run
+        assert update_recurring_dates_for_events([event_id]) == (0, 0)
+
+
+def test_backfill_event_summaries(client, seeder, app, db):
+    _, admin_unit_id = seeder.setup_base()
+    (_, _, event_id, _) = seeder.create_any_reference(admin_unit_id)
+
+    with app.app_context():
+        from sqlalchemy import update
+
+        from project.models import Event
+        from project.services.event import backfill_event_summaries
+
+        event = db.session.get(Event, event_id)
+        assert event.number_of_references == 1
+        assert event.number_of_dates == 1
+
+        db.session.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(min_start=None, number_of_dates=0, number_of_references=0)
+        )
+        db.session.commit()
+        updated_at = db.session.get(Event, event_id).updated_at
+
+        assert backfill_event_summaries(batch_size=1) >= 1
+
+        db.session.expire_all()
+        event = db.session.get(Event, event_id)
+        assert event.updated_at == updated_at
+        assert event.min_start == event.date_definitions[0].start
+        assert event.number_of_dates == 1
+        assert event.number_of_references == 1
+
+
+def test_update_recurring_dates_sharded(client, seeder, app, db):
+    _, admin_unit_id = seeder.setup_base()
+    first_event_id = seeder.create_event(admin_unit_id, "RRULE:FREQ=DAILY;COUNT=7")
+    seeder.create_event(admin_unit_id)
+    second_event_id = seeder.create_event(admin_unit_id, "RRULE:FREQ=DAILY;COUNT=7")
+
+    with app.app_context():
+        from project.services.event import (
+            get_recurring_event_id_ranges,
+            update_recurring_dates,
+        )
+
+        event_id_ranges = get_recurring_event_id_ranges(1)
+        assert event_id_ranges == [
+            (first_event_id, first_event_id),
+            (second_event_id, second_event_id),
+        ]
+
+        result = update_recurring_dates(second_event_id, second_event_id)
+        assert result == {"events": 1, "added": 0, "removed": 0}
+
+
 def test_get_meta_data(seeder, app, db):
     user_id, admin_unit_id = seeder.setup_base()
     event_id = seeder.create_event(admin_unit_id)
@@ -271,6 +366,36 @@ def test_get_events_fulltext(
             i = i + 1
 
 
+def test_get_events_keyword_place_and_changed_description(client, seeder, app, db):
+    from project.models import Location
+
+    _, admin_unit_id = seeder.setup_base()
+    place_id = seeder.upsert_event_place(
+        admin_unit_id, "Kaiserpfalz", Location(city="Goslar")
+    )
+    event_id = seeder.create_event(admin_unit_id, name="Konzert", place_id=place_id)
+
+    with app.app_context():
+        from project.models import Event
+        from project.services.event import get_events_query
+        from project.services.search_params import EventSearchParams
+
+        def search(keyword):
+            params = EventSearchParams()
+            params.keyword = keyword
+            return [event.id for event in get_events_query(params).all()]
+
+        assert search("Kaiserpfalz") == [event_id]
+        assert search("goslar") == [event_id]
+        assert search("Autorin") == []
+
+        event = db.session.get(Event, event_id)
+        event.description = "Lesung mit Autorin"
+        db.session.commit()
+
+        assert search("Autorin") == [event_id]
+
+
 def test_create_ical_events_for_event(client, app, db, utils, seeder):
     user_id, admin_unit_id = seeder.setup_base()
     event_id = seeder.create_event(
@@ -322,3 +447,46 @@ def test_get_old_events(client, seeder, utils, app, db, mocker):
 
         old_events = get_old_events()
         assert len(old_events) == 0
+
+
+def test_purge_old_events(client, seeder, utils, app, db):
+    from project.dateutils import create_berlin_date
+
+    _, admin_unit_id = seeder.setup_base()
+    (_, _, old_event_id, reference_id) = seeder.create_any_reference(admin_unit_id)
+    event_id = seeder.create_event(admin_unit_id)
+
+    with app.app_context():
+        from sqlalchemy import update
+
+        from project.models import DumpTombstone, Event, EventDate
+        from project.services.event import purge_old_events
+
+        old_date = create_berlin_date(2020, 1, 1, 12, 0)
+        db.session.execute(
+            update(EventDate)
+            .where(EventDate.event_id == old_event_id)
+            .values(start=old_date, end=old_date)
+        )
+        db.session.execute(
+            update(Event)
+            .where(Event.id == old_event_id)
+            .values(created_at=old_date, updated_at=old_date)
+        )
+        db.session.commit()
+
+        assert purge_old_events(dry_run=True) == 1
+        assert db.session.get(Event, old_event_id) is not None
+
+        assert purge_old_events(batch_size=1) == 1
+        db.session.expire_all()
+        assert db.session.get(Event, old_event_id) is None
+        assert db.session.get(Event, event_id) is not None
+        assert EventDate.query.filter(EventDate.event_id == old_event_id).count() == 0
+
+        tombstones = {
+            (tombstone.entity_type, tombstone.entity_id)
+            for tombstone in DumpTombstone.query.all()
+        }
+        assert ("events", old_event_id) in tombstones
+        assert ("event_references", reference_id) in tombstones
@@ -26,3 +26,42 @@ def test_has_current_user_member_role_for_admin_unit(client, app, db, seeder):
                 has_current_user_member_role_for_admin_unit(admin_unit_id, "admin")
                 is False
             )
+
+
+def test_current_user_memberships_loaded_once(client, app, db, seeder, mocker):
+    owner_id, admin_unit_id, member_id = seeder.setup_base_event_verifier()
+
+    with app.test_request_context():
+        with app.app_context():
+            from flask_login import login_user
+
+            import project.services.admin_unit
+            from project.access import (
+                has_current_user_member_permission_for_admin_unit,
+                has_current_user_member_role_for_admin_unit,
+            )
+            from project.models import AdminUnitMember
+            from project.models.admin_unit import AdminUnitMemberRole
+
+            member = db.session.get(AdminUnitMember, member_id)
+            login_user(member.user)
+            spy = mocker.spy(project.services.admin_unit, "get_members_for_user_id")
+
+            assert has_current_user_member_role_for_admin_unit(
+                admin_unit_id, "event_verifier"
+            )
+            assert not has_current_user_member_role_for_admin_unit(
+                admin_unit_id, "admin"
+            )
+            assert not has_current_user_member_permission_for_admin_unit(
+                admin_unit_id + 1, "events:write"
+            )
+            assert spy.call_count == 1
+
+            # Changed memberships are loaded again
+            admin_role = AdminUnitMemberRole.query.filter_by(name="admin").first()
+            member.roles.append(admin_role)
+            db.session.flush()
+
+            assert has_current_user_member_role_for_admin_unit(admin_unit_id, "admin")
+            assert spy.call_count == 2
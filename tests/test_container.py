@@ -0,0 +1,23 @@
+from flask import Flask
+
+from project.container import create_cache
+from project.infrastructure.services.in_memory_response_cache import (
+    InMemoryResponseCache,
+)
+from project.infrastructure.services.redis_response_cache import RedisResponseCache
+
+
+def test_create_cache():
+    app = Flask(__name__)
+
+    with app.app_context():
+        cache = create_cache(RedisResponseCache, InMemoryResponseCache)
+        assert isinstance(cache, InMemoryResponseCache)
+
+        app.config["REDIS_URL"] = "redis://"
+        cache = create_cache(RedisResponseCache, InMemoryResponseCache)
+        assert isinstance(cache, RedisResponseCache)
+
+        app.config["TESTING"] = True
+        cache = create_cache(RedisResponseCache, InMemoryResponseCache)
+        assert isinstance(cache, InMemoryResponseCache)
@@ -53,6 +53,27 @@ def test_calculate_occurrences_count():
     assert number_of_occurences == 10
 
 
+def test_stream_icalendar():
+    from datetime import datetime
+
+    import icalendar
+
+    from project.dateutils import create_icalendar, stream_icalendar
+
+    ical_event = icalendar.Event()
+    ical_event.add("summary", "Event")
+    ical_event.add("dtstart", datetime(2030, 1, 1, 10))
+
+    cal = create_icalendar()
+    cal.add("x-wr-calname", "Calendar")
+    cal.add_component(ical_event)
+
+    chunks = list(stream_icalendar(iter([ical_event]), "Calendar"))
+
+    assert len(chunks) == 3
+    assert b"".join(chunks) == cal.to_ical()
+
+
 def get_calculate_occurrences(rrule_str, start=0):
     from datetime import datetime
 
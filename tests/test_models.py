@@ -91,8 +91,11 @@ def test_event_properties(client, app, db, seeder: Seeder):
 
         event = Event()
         assert event.min_start_definition is None
+        event.update_date_summary()
         assert event.min_start is None
+        assert event.max_date_end is None
         assert event.is_recurring is False
+        assert event.number_of_dates == 0
 
         with pytest.raises(IntegrityError) as e:
             event.validate()
@@ -102,6 +105,7 @@ def test_event_properties(client, app, db, seeder: Seeder):
         date_definition = EventDateDefinition()
         date_definition.start = start
         event.date_definitions = [date_definition]
+        event.update_date_summary()
         assert event.min_start == start
 
 
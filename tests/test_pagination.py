@@ -0,0 +1,69 @@
+import pytest
+
+
+def test_cursor_round_trip():
+    from project.dateutils import create_berlin_date
+    from project.pagination import decode_cursor, encode_cursor
+
+    start = create_berlin_date(2020, 10, 3, 10)
+    cursor = encode_cursor((start, 42))
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (start, 42)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "Quatsch",
+        "W3siZHQiOiAiUXVhdHNjaCJ9LCAxXQ",
+        "WyJhIiwgMV0",
+        "W3RydWUsIDFd",
+        "e30",
+    ],
+)
+def test_decode_cursor_invalid(cursor):
+    from project.pagination import decode_cursor
+
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_keyset_pagination_pages():
+    from project.pagination import KeysetPagination
+
+    class FakeQuery:
+        def __init__(self, items):
+            self.items = items
+
+        def order_by(self, *args):
+            return self
+
+        def count(self):
+            return len(self.items)
+
+        def limit(self, limit):
+            return FakeQuery(self.items[:limit])
+
+        def all(self):
+            return self.items
+
+    class FakeKeyset:
+        def get_cursor(self, item):
+            return str(item)
+
+    pagination = KeysetPagination(FakeQuery([1, 2, 3]), FakeKeyset(), None, 2)
+    assert pagination.items == [1, 2]
+    assert pagination.has_next
+    assert not pagination.has_prev
+    assert pagination.next_cursor == "2"
+    assert pagination.total == 3
+    assert pagination.pages == 2
+
+    pagination = KeysetPagination(FakeQuery([]), FakeKeyset(), None, 2, False)
+    assert pagination.items == []
+    assert not pagination.has_next
+    assert not hasattr(pagination, "next_cursor")
+    assert pagination.total is None
+    assert pagination.pages is None
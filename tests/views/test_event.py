@@ -993,3 +993,71 @@ def test_ical(client, seeder: Seeder, utils: UtilActions):
     url = utils.get_url("main.event_ical", id=event_with_recc_id)
     response = utils.get_ok(url)
     utils.assert_response_contains(response, "FREQ=DAILY;COUNT=7")
+
+
+def test_ical_response_cache(client, app, seeder: Seeder, utils: UtilActions):
+    user_id, admin_unit_id = seeder.setup_base(log_in=False)
+    event_id = seeder.create_event(admin_unit_id)
+    app.config["RESPONSE_CACHE_TIMEOUT"] = 300
+
+    url = utils.get_url("main.event_ical", id=event_id)
+    response = utils.get_ok(url)
+    assert response.cache_control.public
+    assert response.cache_control.max_age == 300
+    assert response.last_modified is not None
+    etag = response.headers["ETag"]
+
+    response = utils.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Changed events of the organization invalidate the cached response
+    with app.app_context():
+        app.container.infrastructure.response_cache().invalidate(
+            f"admin_unit:{admin_unit_id}"
+        )
+
+    response = utils.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    # Authenticated users are not served from the cache
+    utils.login()
+    response = utils.get_ok(url)
+    assert response.cache_control.max_age is None
+
+
+def test_ical_feed_file(client, app, seeder: Seeder, utils: UtilActions, tmp_path):
+    from dependency_injector import providers
+
+    from project.infrastructure.services.file_ical_feed_store import FileIcalFeedStore
+
+    user_id, admin_unit_id = seeder.setup_base(log_in=False)
+    event_id = seeder.create_event(admin_unit_id)
+    app.config["ICAL_FEED_MAX_AGE"] = 3600
+    app.container.infrastructure.ical_feed_store.override(
+        providers.Factory(
+            FileIcalFeedStore,
+            session=app.container.infrastructure.session_factory,
+            path=str(tmp_path),
+        )
+    )
+
+    url = utils.get_url("main.event_ical", id=event_id)
+    response = utils.get_ok(url)
+    assert response.data.count(b"BEGIN:VEVENT") == 1
+    assert response.headers["Content-Disposition"].endswith(f"event_{event_id}.ics")
+    assert response.last_modified is not None
+    etag, weak = response.get_etag()
+    assert not weak
+    assert (tmp_path / f"event_{event_id}.ics").exists()
+
+    response = utils.get(url, headers={"If-None-Match": f'"{etag}"'})
+    assert response.status_code == 304
+
+    # Feeds of private events are not written
+    draft_id = seeder.create_event(admin_unit_id, draft=True)
+    url = utils.get_url("main.event_ical", id=draft_id)
+    utils.assert_response_unauthorized(utils.get(url))
+    assert not (tmp_path / f"event_{draft_id}.ics").exists()
+
+    app.container.infrastructure.ical_feed_store.reset_override()
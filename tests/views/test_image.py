@@ -15,3 +15,16 @@ def test_read(app, seeder, utils, size):
     url = utils.get_image_url_for_id(image_id, s=size)
     utils.get_ok(url)
     utils.get_ok(url)  # cache
+
+
+def test_read_webp(app, seeder, utils):
+    user_id, admin_unit_id = seeder.setup_base()
+    image_id = seeder.upsert_default_image()
+
+    url = utils.get_image_url_for_id(image_id, s=200)
+    response = utils.get_ok(url, headers={"Accept": "image/webp,*/*;q=0.8"})
+    assert response.content_type == "image/webp"
+    assert "Accept" in response.headers["Vary"]
+
+    response = utils.get_ok(url, headers={"Accept": "*/*"})
+    assert response.content_type == "image/png"
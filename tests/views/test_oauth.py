@@ -19,6 +19,17 @@ def test_revoke_token(seeder, utils):
     utils.revoke_token()
 
 
+def test_revoke_token_cached(seeder, utils):
+    seeder.setup_api_access()
+    url = utils.get_url("api_v1_user_organization_membership_list")
+    utils.get_json_ok(url)
+
+    # The token is cached now and has to be dropped from the cache
+    utils.revoke_token()
+    response = utils.get_json(url)
+    utils.assert_response_unauthorized(response)
+
+
 def test_introspect(seeder, utils):
     seeder.setup_api_access()
     utils.introspect(utils.get_access_token(), "access_token")
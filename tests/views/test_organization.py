@@ -15,4 +15,19 @@ def test_ical(client, seeder, utils):
 
     seeder.create_event(admin_unit_id, end=seeder.get_now_by_minute())
     url = utils.get_url("main.organization_ical", id=admin_unit_id)
-    utils.get_ok(url)
+    response = utils.get_ok(url)
+    assert response.data.startswith(b"BEGIN:VCALENDAR")
+    assert response.data.count(b"BEGIN:VEVENT") == 1
+    assert response.data.endswith(b"END:VCALENDAR\r\n")
+
+
+def test_ical_streamed(client, app, seeder, utils):
+    user_id, admin_unit_id = seeder.setup_base(log_in=False)
+    seeder.create_event(admin_unit_id)
+    app.config["RESPONSE_CACHE_TIMEOUT"] = 300
+
+    url = utils.get_url("main.organization_ical", id=admin_unit_id)
+    response = utils.get_ok(url)
+    assert not response.cache_control.public
+    assert "ETag" not in response.headers
+    assert response.data.endswith(b"END:VCALENDAR\r\n")
@@ -1,4 +1,6 @@
+import gzip
 import os
+import re
 
 from tests.utils import UtilActions
 
@@ -103,15 +105,49 @@ def test_robots_txt(app, utils):
     utils.get_endpoint_ok("main.robots_txt")
 
 
-def test_sitemap_xml(seeder, app, utils):
+def test_sitemap_xml(seeder, app, utils, monkeypatch):
+    from project import sitemap_dir
+
+    # Every url goes into its own sitemap file
+    monkeypatch.setattr("project.services.seo.SITEMAP_MAX_URLS", 1)
+
     user_id, admin_unit_id = seeder.setup_base()
-    seeder.create_event(admin_unit_id)
+    event_id = seeder.create_event(admin_unit_id)
+    other_event_id = seeder.create_event(admin_unit_id)
 
     app.config["SERVER_NAME"] = "localhost"
     runner = app.test_cli_runner()
     result = runner.invoke(args=["seo", "generate-sitemap"])
     assert result.exit_code == 0
-    utils.get_endpoint_ok("main.sitemap_xml")
+    response = utils.get_endpoint_ok("main.sitemap_xml")
+    assert b"<sitemapindex" in response.data
+
+    locs = [
+        loc.decode("utf-8") for loc in re.findall(rb"<loc>([^<]+)</loc>", response.data)
+    ]
+    file_names = [loc.rsplit("/", 1)[-1] for loc in locs]
+    generation = file_names[0].split("-", 1)[0]
+    assert f"{generation}-events-2.xml.gz" in file_names
+    assert all(file_name.endswith(".xml.gz") for file_name in file_names)
+    assert sorted(file_names) == sorted(
+        file_name
+        for file_name in os.listdir(sitemap_dir)
+        if file_name.split("-", 1)[0] == generation
+    )
+
+    urls = list()
+    for loc in locs:
+        response = utils.get_ok(loc)
+        urlset = gzip.decompress(response.data)
+        assert urlset.count(b"<url>") == 1
+        urls.extend(re.findall(r"<loc>([^<]+)</loc>", urlset.decode("utf-8")))
+
+    assert f"http://localhost{utils.get_url('main.event', event_id=event_id)}" in urls
+    assert (
+        f"http://localhost{utils.get_url('main.event', event_id=other_event_id)}"
+        in urls
+    )
+    assert f"http://localhost/organizations/{admin_unit_id}" in urls
 
 
 def test_announcement(app, db, utils: UtilActions):
@@ -30,6 +30,29 @@ def test_get_pagination_urls(client, seeder, app, utils):
     )
 
 
+def test_get_pagination_urls_cursor(client, app):
+    from project.views.utils import get_pagination_urls
+
+    class Pagination:
+        page = None
+        pages = None
+        total = None
+        has_prev = True
+        prev_num = None
+        has_next = True
+        next_num = None
+        next_cursor = "abc"
+
+    with app.test_request_context("/api/v1/event-dates?cursor=xyz&per_page=10"):
+        urls = get_pagination_urls(Pagination())
+
+    assert "prev_url" not in urls
+    assert "last_url" not in urls
+    assert "cursor" not in urls["first_url"]
+    assert "cursor=abc" in urls["next_url"]
+    assert "per_page=10" in urls["next_url"]
+
+
 def test_truncate():
     from project.views.utils import truncate
 
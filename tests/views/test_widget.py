@@ -119,3 +119,23 @@ def test_event_dates_colors(client, seeder, utils, app, db):
 
     url = utils.get_url("main.widget_event_dates", id=admin_unit_id)
     utils.get_ok(url)
+
+
+def test_event_dates_response_cache(client, seeder: Seeder, utils: UtilActions, app):
+    user_id, admin_unit_id = seeder.setup_base(log_in=False)
+    seeder.create_event(admin_unit_id)
+    app.config["RESPONSE_CACHE_TIMEOUT"] = 300
+
+    url = utils.get_url("main.widget_event_dates", id=admin_unit_id, keyword="name")
+    response = utils.get_ok(url)
+    assert response.cache_control.max_age == 300
+    assert "Accept-Language" in response.vary
+    etag = response.headers["ETag"]
+
+    response = utils.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Different search params use a different entry
+    url = utils.get_url("main.widget_event_dates", id=admin_unit_id, keyword="other")
+    response = utils.get_ok(url)
+    assert response.headers["ETag"] != etag